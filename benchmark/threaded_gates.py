@@ -0,0 +1,79 @@
+# Copyright 2018-2019 Xanadu Quantum Technologies Inc.
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+
+#     http://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+Scaling benchmark of the multi-threaded gate application of the ``default.qubit`` device.
+
+For each number of wires, a layer of single-qubit rotations followed by a ring of CNOTs and
+controlled rotations is applied to the state, using an increasing number of threads.
+
+Usage::
+
+    python benchmark/threaded_gates.py --wires 20 22 24 --threads 1 2 4 8
+"""
+import argparse
+import time
+
+import numpy as np
+
+from pennylane.plugins.default_qubit import DefaultQubit
+
+
+def layer(dev, params):
+    """Apply a layer of gates to all wires of the device."""
+    n = dev.num_wires
+
+    for w in range(n):
+        dev.apply("RY", [w], [params[w]])
+        dev.apply("RZ", [w], [params[w]])
+
+    for w in range(n):
+        dev.apply("CNOT", [w, (w + 1) % n], [])
+        dev.apply("CRX", [w, (w + 1) % n], [params[w]])
+
+
+def benchmark(wires, threads, repeat):
+    """Return the best time of ``repeat`` executions of a layer of gates."""
+    dev = DefaultQubit(wires, threads=threads)
+    params = np.random.uniform(0, 2 * np.pi, wires)
+    times = []
+
+    for _ in range(repeat):
+        dev.reset()
+        start = time.perf_counter()
+        layer(dev, params)
+        times.append(time.perf_counter() - start)
+
+    return min(times)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--wires", type=int, nargs="+", default=[18, 20, 22])
+    parser.add_argument("--threads", type=int, nargs="+", default=[1, 2, 4, 8])
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    print("{:>6} {:>8} {:>10} {:>8}".format("wires", "threads", "time [s]", "speedup"))
+
+    for wires in args.wires:
+        baseline = None
+
+        for threads in args.threads:
+            t = benchmark(wires, threads, args.repeat)
+            baseline = baseline or t
+            print("{:>6} {:>8} {:>10.3f} {:>8.2f}".format(wires, threads, t, baseline / t))
+
+
+if __name__ == "__main__":
+    main()
@@ -21,6 +21,7 @@ import numpy as np
 
 from pennylane.operation import Operation, Observable, Sample, Variance, Expectation, Probability, Tensor
 from pennylane.qnodes import QuantumFunctionError
+from pennylane.utils import _rotated_observable, group_observables, measurement_rotations
 
 
 class DeviceError(Exception):
@@ -157,6 +158,75 @@ class Device(abc.ABC):
             array[float]: measured value(s)
         """
         self.check_validity(queue, observables)
+        return self._execute(None, queue, observables, parameters)
+
+    def compile(self, queue, observables):
+        """Compile a circuit into an execution plan for the device.
+
+        The execution plan depends only on the structure of the circuit, i.e., the
+        types of the operations and observables and the wires they act on, and not on
+        the parameter values. It can therefore be computed once, and then be reused
+        by :meth:`execute_compiled` for every evaluation of a circuit with the same structure.
+
+        Compiling the circuit checks that all the operations and observables are
+        supported by the device.
+
+        For plugin developers: by default, no execution plan is constructed. Devices can
+        overwrite this method, together with :meth:`apply_compiled`, to perform any
+        structure-dependent preprocessing once per circuit structure.
+
+        Args:
+            queue (Iterable[~.operation.Operation]): operations to execute on the device
+            observables (Iterable[~.operation.Observable]): observables to measure and return
+
+        Raises:
+            DeviceError: if there are operations in the queue or observables that the device does
+                not support
+
+        Returns:
+            object or None: the execution plan
+        """
+        self.check_validity(queue, observables)
+
+    def execute_compiled(self, plan, queue, observables, parameters={}):
+        """Execute a queue of quantum operations on the device using an execution plan,
+        and then measure the given observables.
+
+        The circuit must have the structure it had when the plan was created
+        using :meth:`compile`; as a result, the validity of the circuit is not checked again.
+        If no plan was created, the circuit is executed using :meth:`execute`.
+
+        Args:
+            plan (object or None): the execution plan returned by :meth:`compile`
+            queue (Iterable[~.operation.Operation]): operations to execute on the device
+            observables (Iterable[~.operation.Observable]): observables to measure and return
+            parameters (dict[int->list[ParameterDependency]]): Mapping from free parameter index to the list of
+                :class:`Operations <pennylane.operation.Operation>` (in the queue) that depend on it.
+
+        Raises:
+            QuantumFunctionError: if the value of :attr:`~.Observable.return_type` is not supported
+
+        Returns:
+            array[float]: measured value(s)
+        """
+        if plan is None:
+            return self.execute(queue, observables, parameters)
+
+        return self._execute(plan, queue, observables, parameters)
+
+    def _execute(self, plan, queue, observables, parameters):
+        """Apply the operations, and measure the observables, without checking their validity.
+
+        Args:
+            plan (object or None): the execution plan returned by :meth:`compile`, if any
+            queue (Iterable[~.operation.Operation]): operations to execute on the device
+            observables (Iterable[~.operation.Observable]): observables to measure and return
+            parameters (dict[int->list[ParameterDependency]]): Mapping from free parameter index to the list of
+                :class:`Operations <pennylane.operation.Operation>` (in the queue) that depend on it.
+
+        Returns:
+            array[float]: measured value(s)
+        """
         self._op_queue = queue
         self._obs_queue = observables
         self._parameters = {}
@@ -167,8 +237,11 @@ class Device(abc.ABC):
         with self.execution_context():
             self.pre_apply()
 
-            for operation in queue:
-                self.apply(operation.name, operation.wires, operation.parameters)
+            if plan is None:
+                for operation in queue:
+                    self.apply(operation.name, operation.wires, operation.parameters)
+            else:
+                self.apply_compiled(plan, queue)
 
             self.post_apply()
 
@@ -185,7 +258,7 @@ class Device(abc.ABC):
                     results.append(np.array(self.sample(obs.name, obs.wires, obs.parameters)))
 
                 elif obs.return_type is Probability:
-                    results.append(list(self.probability(wires=obs.wires).values()))
+                    results.append(self.marginal_probability(wires=obs.wires))
 
                 elif obs.return_type is not None:
                     raise QuantumFunctionError("Unsupported return type specified for observable {}".format(obs.name))
@@ -205,6 +278,84 @@ class Device(abc.ABC):
 
             return self._asarray(results)
 
+    def batch_execute(self, circuits):
+        """Execute a batch of quantum circuits on the device.
+
+        Each circuit is given as an ``(queue, observables)`` pair, in which the
+        parameters of all operators are already bound to numerical values, so that the
+        circuits can be evaluated independently of each other (and of the QNode that
+        generated them).
+
+        For plugin developers: by default, the device is reset and :meth:`execute` is
+        called once for every circuit. Devices that are able to evaluate many circuits
+        more efficiently at once, for example by vectorizing over the parameter values
+        or by submitting a single job to remote hardware, should overwrite this method.
+
+        Args:
+            circuits (Sequence[tuple[list[~.operation.Operation], list[~.operation.Observable]]]):
+                circuits to execute, in the form of (operation queue, observables) pairs
+
+        Returns:
+            list[array[float]]: measured value(s) for each circuit, in the order the circuits were given
+        """
+        results = []
+
+        for queue, observables in circuits:
+            self.reset()
+            results.append(self.execute(queue, observables))
+
+        return results
+
+    def execute_grouped(self, queue, observables):
+        """Execute a circuit using a single rotated circuit for each group of qubit-wise
+        commuting expectation values and variances.
+
+        The observables returning expectation values or variances are partitioned using
+        :func:`~.utils.group_observables`. For each group, the circuit is extended by the
+        rotations into the shared eigenbasis of the group (see
+        :func:`~.utils.measurement_rotations`), and the observables are replaced by their
+        diagonal counterparts, which can all be estimated from the same samples. The
+        remaining observables are measured in one further circuit without rotations.
+        The circuits are submitted using :meth:`batch_execute`, so that the number of
+        executions grows with the number of groups rather than the number of observables.
+
+        The parameters of all operators must already be bound to numerical values.
+
+        Args:
+            queue (list[~.operation.Operation]): operations to execute on the device
+            observables (list[~.operation.Observable]): observables to measure and return
+
+        Returns:
+            array[float]: measured value(s), in the order of ``observables``
+        """
+        grouped = [
+            i for i, obs in enumerate(observables) if obs.return_type in (Expectation, Variance)
+        ]
+        others = [i for i in range(len(observables)) if i not in grouped]
+
+        groups = group_observables([observables[i] for i in grouped])
+        groups = [[grouped[k] for k in group] for group in groups]
+        circuits = []
+
+        for group in groups:
+            obs = [observables[i] for i in group]
+            rotations = measurement_rotations(obs)
+            circuits.append((list(queue) + rotations, [_rotated_observable(o) for o in obs]))
+
+        if others:
+            groups.append(others)
+            circuits.append((list(queue), [observables[i] for i in others]))
+
+        results = [None] * len(observables)
+        for group, res in zip(groups, self.batch_execute(circuits)):
+            for i, r in zip(group, res):
+                results[i] = r
+
+        if any(obs.return_type is Sample for obs in observables):
+            return self._asarray(results, dtype="object")
+
+        return self._asarray(results)
+
     @property
     def op_queue(self):
         """The operation queue to be applied.
@@ -401,6 +552,38 @@ class Device(abc.ABC):
             par (tuple): parameters for the operation
         """
 
+    def apply_compiled(self, plan, queue):
+        """Apply a queue of quantum operations using an execution plan.
+
+        For plugin developers: this function is only called if :meth:`compile` has been
+        overwritten to return an execution plan. By default, :meth:`apply` is called
+        for each operation in the queue.
+
+        Args:
+            plan (object): the execution plan returned by :meth:`compile`
+            queue (Iterable[~.operation.Operation]): operations to apply on the device
+        """
+        for operation in queue:
+            self.apply(operation.name, operation.wires, operation.parameters)
+
+    def operation_matrix(self, operation, par):
+        """Matrix representation of a quantum operation.
+
+        For plugin developers: devices that apply the operations as matrices may
+        overwrite this method, which allows the QNode to fuse adjacent fixed gates
+        into single :class:`~.QubitUnitary` operations (see :func:`~.fuse_gates`).
+        By default, no matrix representation is known.
+
+        Args:
+            operation (str): name of the operation
+            par (tuple): parameters for the operation
+
+        Returns:
+            array or None: the matrix of the operation, or None if it is not known
+        """
+        # pylint: disable=unused-argument,no-self-use
+        return None
+
     @abc.abstractmethod
     def expval(self, observable, wires, par):
         r"""Returns the expectation value of observable on specified wires.
@@ -474,6 +657,24 @@ class Device(abc.ABC):
         """
         raise NotImplementedError("Returning probability not currently supported by {}".format(self.short_name))
 
+    def marginal_probability(self, wires=None):
+        """Return the (marginal) probability of each computational basis
+        state from the last run of the device, as an array.
+
+        By default, the probabilities are extracted from :meth:`probability`. Devices
+        with direct access to the probabilities should override this method, and may
+        implement :meth:`probability` as a wrapper around it instead.
+
+        Args:
+            wires (Sequence[int]): Sequence of wires to return
+                marginal probabilities for. Wires not provided
+                are traced out of the system.
+
+        Returns:
+            array[float]: the probabilities, with the basis states in lexicographical order
+        """
+        return np.array(list(self.probability(wires=wires).values()))
+
     @abc.abstractmethod
     def reset(self):
         """Reset the backend state.
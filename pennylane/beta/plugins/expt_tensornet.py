@@ -15,6 +15,10 @@ r"""
 Experimental simulator plugin based on tensor network contractions
 """
 
+from collections import OrderedDict
+import functools
+import operator
+import string
 import warnings
 from itertools import product
 
@@ -49,23 +53,152 @@ from pennylane.plugins.default_qubit import (
     hermitian,
     identity,
     Toffoli,
-    spectral_decomposition,
     unitary,
 )
+from pennylane.utils import spectral_cache
 
 # tolerance for numerical errors
 tolerance = 1e-10
 
+# einsum subscripts of the indices of the reduced density matrices
+_letters = string.ascii_letters
+
+
+def _size(edges, sizes):
+    """Number of elements of a tensor with the given edges."""
+    return functools.reduce(operator.mul, (sizes[e] for e in edges), 1)
+
+
+def _greedy_path(inputs, sizes):
+    """Find a contraction path for a tensor network using a greedy heuristic.
+
+    At each step, the pair of connected tensors whose contraction reduces the total size of
+    the tensors the most is contracted. Disconnected tensors are combined by outer products,
+    smallest first, once no connected pairs remain.
+
+    Args:
+        inputs (list[frozenset]): the edges of each tensor
+        sizes (dict): the dimension of each edge
+
+    Returns:
+        list[tuple[int, int]]: the pairs of tensors to contract, in order, where the result of
+        the :math:`k`-th contraction is labelled ``len(inputs) + k``
+    """
+    tensors = dict(enumerate(inputs))
+    path = []
+
+    while len(tensors) > 1:
+        holders = {}
+        for i, edges in tensors.items():
+            for e in edges:
+                holders.setdefault(e, []).append(i)
+
+        pairs = {tuple(h) for h in holders.values() if len(h) == 2}
+        if not pairs:
+            pairs = {tuple(sorted(tensors, key=lambda i: (_size(tensors[i], sizes), i))[:2])}
+
+        def score(pair):
+            a, b = tensors[pair[0]], tensors[pair[1]]
+            return _size(a ^ b, sizes) - _size(a, sizes) - _size(b, sizes), pair
+
+        a, b = min(pairs, key=score)
+        tensors[len(inputs) + len(path)] = tensors.pop(a) ^ tensors.pop(b)
+        path.append((a, b))
+
+    return path
+
+
+def _optimal_path(inputs, sizes):
+    """Find the contraction path for a tensor network with the lowest cost.
+
+    The cost of contracting two tensors is the number of elements of the union of their edges.
+    The search runs over all subsets of the tensors, so that it is only feasible for small
+    networks.
+
+    Args:
+        inputs (list[frozenset]): the edges of each tensor
+        sizes (dict): the dimension of each edge
+
+    Returns:
+        list[tuple[int, int]]: the pairs of tensors to contract, in order, where the result of
+        the :math:`k`-th contraction is labelled ``len(inputs) + k``
+    """
+    n = len(inputs)
+
+    # the open edges of the tensor resulting from contracting each subset
+    edges = {0: frozenset()}
+    best = {}
+
+    for mask in range(1, 2 ** n):
+        low = mask & -mask
+        edges[mask] = edges[mask ^ low] ^ inputs[low.bit_length() - 1]
+
+        if mask == low:
+            best[mask] = (0, None)
+            continue
+
+        candidates = []
+        sub = (mask - 1) & mask
+        while sub:
+            # each split is only considered once, with the lowest tensor in the first part
+            if sub & low:
+                other = mask ^ sub
+                cost = best[sub][0] + best[other][0] + _size(edges[sub] | edges[other], sizes)
+                candidates.append((cost, sub))
+            sub = (sub - 1) & mask
+
+        best[mask] = min(candidates)
+
+    path = []
+
+    def build(mask):
+        if mask & (mask - 1) == 0:
+            return mask.bit_length() - 1
+        sub = best[mask][1]
+        a, b = build(sub), build(mask ^ sub)
+        path.append((a, b))
+        return n + len(path) - 1
+
+    build(2 ** n - 1)
+    return path
+
 # ========================================================
 #  device
 # ========================================================
 
 
 class TensorNetwork(Device):
-    """Experimental Tensor Network simulator device for PennyLane.
+    r"""Experimental Tensor Network simulator device for PennyLane.
+
+    By default, the state is stored as one node of the tensor network per separable factor,
+    starting from one node per wire. Each operation is contracted into the factors of the
+    wires it acts on as it is applied, merging them into one factor if there are several, so
+    that the size of the state follows the groups of wires that have actually been entangled.
+
+    With ``representation="mps"``, the state is instead stored as a matrix product state, with
+    one node of shape ``(chi_left, 2, chi_right)`` per wire. Operations acting on several wires
+    are applied by contracting the nodes of the (swapped to be adjacent) wires and splitting the
+    result using singular value decompositions, discarding the singular values below
+    ``cutoff``, and keeping at most ``max_bond_dim`` of them. The sum of the squares of the discarded
+    singular values is reported by the :attr:`truncation_error` attribute.
+
+    With the ``"greedy"`` or ``"optimal"`` contraction of the exact representation, the
+    operations are not contracted as they are applied. Instead, the complete network
+    :math:`\bra{\psi}A\ket{\psi}` of each measurement, starting from one node per wire, is
+    contracted in an order found by a greedy heuristic, or by an exhaustive search for
+    networks of at most :attr:`_max_optimal_nodes` nodes. The contraction order is cached
+    for each circuit structure, so that it is only searched for once when the circuit is
+    evaluated for different parameters.
 
     Args:
         wires (int): the number of modes to initialize the device in
+        representation (str): the representation of the state, either ``"exact"`` or ``"mps"``
+        max_bond_dim (int): maximum bond dimension of the matrix product state; if ``None``,
+            the bond dimension is only limited by ``cutoff``
+        cutoff (float): singular values of the matrix product state bonds below this value
+            are discarded
+        contraction (str): the contraction strategy of the exact representation, either
+            ``"eager"``, ``"greedy"`` or ``"optimal"``
     """
 
     name = "PennyLane TensorNetwork simulator plugin"
@@ -117,17 +250,70 @@ class TensorNetwork(Device):
     _real = staticmethod(np.real)
     _imag = staticmethod(np.imag)
     _abs = staticmethod(np.abs)
+    _einsum = staticmethod(np.einsum)
 
     C_DTYPE = np.complex128
     R_DTYPE = np.float64
 
-    def __init__(self, wires, shots=1000, analytic=True):
+    _representations = ("exact", "mps")
+    _contractions = ("eager", "greedy", "optimal")
+
+    _max_optimal_nodes = 10
+    """int: maximum number of nodes of a network for which the contraction order is
+    found by an exhaustive search"""
+
+    _max_rdm_wires = 10
+    """int: maximum number of wires of the reduced density matrices the measurements are
+    computed from; observables acting on more wires are contracted with the state directly"""
+
+    def __init__(
+        self,
+        wires,
+        shots=1000,
+        analytic=True,
+        representation="exact",
+        max_bond_dim=None,
+        cutoff=tolerance,
+        contraction="eager",
+    ):
+        if representation not in self._representations:
+            raise ValueError("Unknown state representation {}.".format(representation))
+        if contraction not in self._contractions:
+            raise ValueError("Unknown contraction strategy {}.".format(contraction))
+        if representation == "mps" and contraction != "eager":
+            raise ValueError("The matrix product state representation is contracted eagerly.")
+
         super().__init__(wires, shots)
         self.analytic = True
+        self.representation = representation
+        self.max_bond_dim = max_bond_dim
+        self.cutoff = cutoff
+        self.contraction = contraction
+
+        self.truncation_error = 0.0
+        """float: sum of the squared singular values discarded from the bonds of the
+        matrix product state since the last reset"""
+
         self._nodes = []
         self._edges = []
-        self._state_node = None
-        self._free_edges = []
+        self._site_nodes = []
+        self._center = 0
+
+        self._factors = []
+        """list[tuple[array, tuple[int]]]: the tensors of the separable factors of the state,
+        and the wires they act on; for a deferred contraction, the factors of the initial state"""
+
+        self._circuit = []
+        """list[tuple[array, list[int], str]]: the operations applied since the preparation of
+        the initial state of a deferred contraction, the wires they act on, and their names"""
+
+        self._paths = {}
+        """dict[tuple, list[tuple[int, int]]]: the contraction path of each network structure"""
+
+        self._rdm_cache = {}
+        """dict[tuple[int], array]: the reduced density matrices of the current state, computed
+        for each set of wires"""
+
         self.reset()
 
     @staticmethod
@@ -192,11 +378,11 @@ class TensorNetwork(Device):
         self.reset()
 
     def apply(self, operation, wires, par):
+        self._rdm_cache = {}
+
         if operation == "QubitStateVector":
             state = self._array(par[0], dtype=self.C_DTYPE)
-            if state.ndim == 1 and state.shape[0] == 2 ** self.num_wires:
-                self._state_node.tensor = self._reshape(state, [2] * self.num_wires)
-            else:
+            if not (state.ndim == 1 and state.shape[0] == 2 ** self.num_wires):
                 raise ValueError("State vector must be of length 2**wires.")
             if wires is not None and wires != [] and list(wires) != list(range(self.num_wires)):
                 raise ValueError(
@@ -204,6 +390,12 @@ class TensorNetwork(Device):
                         self.num_wires
                     )
                 )
+            if self.representation == "mps":
+                self._mps_split(np.reshape(state, [1] + [2] * self.num_wires + [1]), 0)
+            else:
+                self._factors = [
+                    (self._reshape(state, [2] * self.num_wires), tuple(range(self.num_wires)))
+                ]
             return
         if operation == "BasisState":
             n = len(par[0])
@@ -219,22 +411,355 @@ class TensorNetwork(Device):
                         self.num_wires
                     )
                 )
-            state_node = self._create_basis_state(par[0], wires)
-            self._state_node.tensor = self._asarray(state_node, dtype=self.C_DTYPE)
+            if self.representation == "mps":
+                self._mps_basis_state(par[0])
+                return
+            # the wires beyond the given bits are prepared in the |0> state
+            bits = list(par[0]) + [0] * (self.num_wires - n)
+            self._factors = [
+                (self._asarray(self._create_basis_state([bit], [w]), dtype=self.C_DTYPE), (w,))
+                for w, bit in enumerate(bits)
+            ]
             return
 
         A = self._get_operator_matrix(operation, par)
+        if self.representation == "mps":
+            self._mps_apply(A, wires)
+            return
+
         num_mult_idxs = len(wires)
         A = self._reshape(A, [2] * num_mult_idxs * 2)
+
+        if self.contraction != "eager":
+            self._circuit.append((A, list(wires), operation))
+            return
+
+        # merge the factors of the state acting on the wires of the operation
+        merged = [i for i, (_, w) in enumerate(self._factors) if set(w) & set(wires)]
+        factor_wires = tuple(w for i in merged for w in self._factors[i][1])
+        factor_node = functools.reduce(
+            tn.outer_product,
+            [self._add_node(*self._factors[i], name="Factor") for i in merged],
+        )
+
+        free_edges = dict(zip(factor_wires, factor_node.edges))
         op_node = self._add_node(A, wires=wires, name=operation)
         for idx, w in enumerate(wires):
-            self._add_edge(op_node, num_mult_idxs + idx, self._state_node, w)
-            self._free_edges[w] = op_node[idx]
-        # TODO: can be smarter here about collecting contractions?
-        self._state_node = tn.contract_between(
-            op_node, self._state_node, output_edge_order=self._free_edges
+            self._edges.append(tn.connect(op_node[num_mult_idxs + idx], free_edges[w]))
+            free_edges[w] = op_node[idx]
+
+        factor_node = tn.contract_between(
+            op_node, factor_node, output_edge_order=[free_edges[w] for w in factor_wires]
         )
 
+        # the merged factor takes the place of the first of the factors
+        factor = (factor_node.tensor, factor_wires)
+        self._factors = [
+            factor if i == merged[0] else f
+            for i, f in enumerate(self._factors)
+            if i not in merged[1:]
+        ]
+
+    def _mps_basis_state(self, state):
+        """Set the matrix product state to a computational basis state.
+
+        Args:
+            state (array[int]): array of 0s and 1s of size at most ``(wires,)`` representing
+                the basis state; the remaining wires are prepared in the zero state
+        """
+        state = list(state) + [0] * (self.num_wires - len(state))
+
+        self._site_nodes = []
+        for w, bit in enumerate(state):
+            site = np.zeros([1, 2, 1], dtype=self.C_DTYPE)
+            site[0, int(bit), 0] = 1
+            self._site_nodes.append(self._add_node(site, wires=(w,), name="Site"))
+        self._center = 0
+
+    def _mps_move_center(self, site):
+        """Move the orthogonality centre of the matrix product state using QR decompositions.
+
+        The nodes to the left of the centre are kept left-orthonormal, and the nodes to the
+        right of it right-orthonormal.
+
+        Args:
+            site (int): the new orthogonality centre
+        """
+        nodes = self._site_nodes
+
+        while self._center < site:
+            c = self._center
+            M = nodes[c].tensor
+            q, r = np.linalg.qr(np.reshape(M, [-1, M.shape[2]]))
+            nodes[c].tensor = np.reshape(q, [M.shape[0], 2, -1])
+            nodes[c + 1].tensor = np.tensordot(r, nodes[c + 1].tensor, axes=1)
+            self._center += 1
+
+        while self._center > site:
+            c = self._center
+            M = nodes[c].tensor
+            q, r = np.linalg.qr(np.reshape(M, [M.shape[0], -1]).T)
+            nodes[c].tensor = np.reshape(q.T, [-1, 2, M.shape[2]])
+            nodes[c - 1].tensor = np.tensordot(nodes[c - 1].tensor, r.T, axes=1)
+            self._center -= 1
+
+    def _mps_split(self, theta, first):
+        """Split a tensor of adjacent sites into the nodes of the matrix product state.
+
+        The bonds are truncated according to ``cutoff`` and ``max_bond_dim``, and the
+        discarded weight is added to :attr:`truncation_error`.
+
+        Args:
+            theta (array): tensor of shape ``(chi_left, 2, ..., 2, chi_right)``, containing
+                the orthogonality centre
+            first (int): the site of the first physical index of ``theta``
+        """
+        last = first + theta.ndim - 3
+
+        for site in range(first, last):
+            chi = theta.shape[0]
+            u, s, vh = np.linalg.svd(np.reshape(theta, [chi * 2, -1]), full_matrices=False)
+
+            keep = max(1, int(np.sum(s > self.cutoff)))
+            if self.max_bond_dim is not None:
+                keep = min(keep, self.max_bond_dim)
+
+            self.truncation_error += float(np.sum(s[keep:] ** 2))
+            s = s[:keep] / np.linalg.norm(s[:keep])
+
+            self._site_nodes[site].tensor = np.reshape(u[:, :keep], [chi, 2, keep])
+            theta = np.reshape(s[:, None] * vh[:keep], [keep] + list(theta.shape[2:]))
+
+        self._site_nodes[last].tensor = theta
+        self._center = last
+
+    def _mps_apply_local(self, A, first):
+        """Apply an operation to adjacent sites of the matrix product state.
+
+        Args:
+            A (array): the operation, as a tensor of shape ``[2] * 2 * k``
+            first (int): the first of the ``k`` sites the operation acts on
+        """
+        k = A.ndim // 2
+        nodes = self._site_nodes
+
+        if k > 1:
+            # the contracted sites must contain the orthogonality centre for the
+            # singular values to be the Schmidt coefficients of the state
+            if self._center < first:
+                self._mps_move_center(first)
+            elif self._center >= first + k:
+                self._mps_move_center(first + k - 1)
+
+        theta = nodes[first].tensor
+        for site in range(first + 1, first + k):
+            theta = np.tensordot(theta, nodes[site].tensor, axes=1)
+
+        theta = np.tensordot(A, theta, axes=[list(range(k, 2 * k)), list(range(1, k + 1))])
+        theta = np.moveaxis(theta, k, 0)
+
+        if k == 1:
+            nodes[first].tensor = theta
+        else:
+            self._mps_split(theta, first)
+
+    def _mps_apply(self, A, wires):
+        """Apply an operation to the matrix product state.
+
+        The wires of the operation are brought next to the first of them using SWAP
+        operations, which are undone after the operation has been applied.
+
+        Args:
+            A (array): matrix representation of the operation
+            wires (Sequence[int]): wires the operation acts on
+        """
+        k = len(wires)
+        order = list(np.argsort(wires))
+        sorted_wires = [wires[i] for i in order]
+
+        # reorder the indices of the operation to act on the wires in ascending order
+        A = np.transpose(np.reshape(A, [2] * 2 * k), order + [k + i for i in order])
+
+        swap = np.reshape(self._array(SWAP, dtype=self.C_DTYPE), [2] * 4)
+        first = sorted_wires[0]
+        swaps = []
+
+        for j, w in enumerate(sorted_wires[1:], start=1):
+            for site in range(w - 1, first + j - 1, -1):
+                self._mps_apply_local(swap, site)
+                swaps.append(site)
+
+        self._mps_apply_local(A, first)
+
+        for site in reversed(swaps):
+            self._mps_apply_local(swap, site)
+
+    @staticmethod
+    def _mpo(A, wires):
+        """Matrix product operator representation of an observable.
+
+        Args:
+            A (array): matrix representation of the observable
+            wires (Sequence[int]): wires the observable acts on
+
+        Returns:
+            dict[int, array]: tensors of shape ``(chi_left, 2, 2, chi_right)``, with the output
+            index before the input index, of the sites from the first to the last wire
+        """
+        k = len(wires)
+        order = list(np.argsort(wires))
+        sorted_wires = [wires[i] for i in order]
+
+        # interleave the output and input index of each wire, in ascending order
+        rest = np.transpose(np.reshape(A, [2] * 2 * k), [x for i in order for x in (i, k + i)])
+        rest = np.reshape(rest, [1, -1])
+        tensors = {}
+
+        for w in sorted_wires[:-1]:
+            chi = rest.shape[0]
+            u, s, vh = np.linalg.svd(np.reshape(rest, [chi * 4, -1]), full_matrices=False)
+            keep = max(1, int(np.sum(s > tolerance)))
+            tensors[w] = np.reshape(u[:, :keep], [chi, 2, 2, keep])
+            rest = s[:keep, None] * vh[:keep]
+
+        tensors[sorted_wires[-1]] = np.reshape(rest, [rest.shape[0], 2, 2, 1])
+
+        # the bonds between the wires are carried by the sites in between
+        for w1, w2 in zip(sorted_wires[:-1], sorted_wires[1:]):
+            bond = np.eye(tensors[w1].shape[3])
+            for site in range(w1 + 1, w2):
+                tensors[site] = np.einsum("ab,ij->aijb", bond, np.eye(2))
+
+        return tensors
+
+    def _mps_ev(self, observables, wires):
+        r"""Expectation value of observables in the matrix product state.
+
+        The observables are converted into a matrix product operator, and the expectation
+        value is contracted in a sweep of the left environment over the sites between the
+        observables and the orthogonality centre. The nodes to the left and right of these
+        sites are orthonormal, so that their environments are identities.
+
+        Args:
+            observables (Sequence[array]): matrix representations of the observables
+            wires (Sequence[Sequence[int]]): measured subsystems for each observable
+
+        Returns:
+            complex: expectation value :math:`\bra{\psi}A\ket{\psi}`
+        """
+        mpo = {}
+        for A, w in zip(observables, wires):
+            for site, W in self._mpo(A, list(w)).items():
+                if site in mpo:
+                    W = np.einsum("aijb,cjkd->acikbd", mpo[site], W)
+                    W = np.reshape(W, [W.shape[0] * W.shape[1], 2, 2, -1])
+                mpo[site] = W
+
+        first = min(self._center, *mpo)
+        last = max(self._center, *mpo)
+        identity_site = np.reshape(np.eye(2), [1, 2, 2, 1])
+
+        chi = self._site_nodes[first].tensor.shape[0]
+        env = np.reshape(np.eye(chi), [chi, 1, chi])
+
+        for site in range(first, last + 1):
+            M = self._site_nodes[site].tensor
+            W = mpo.get(site, identity_site)
+            env = np.einsum("xyz,xsa,ystb,ztc->abc", env, np.conj(M), W, M, optimize=True)
+
+        return np.einsum("xyx->", env)
+
+    def _ket(self, conj=False):
+        """Build the network of the state from its factors and the operations applied.
+
+        Args:
+            conj (bool): whether to build the network of the complex conjugate of the state
+
+        Returns:
+            tuple[list[tn.Node], list[tn.Edge]]: the nodes of the network, and the free edge
+            of each wire
+        """
+        name = "Bra" if conj else "Ket"
+        nodes = []
+        free_edges = [None] * self.num_wires
+
+        def create_node(A):
+            node = tn.Node(A, backend=self.backend)
+            return tn.conj(node) if conj else node
+
+        for A, wires in self._factors:
+            node = self._add_node(create_node(A), wires=wires, name=name)
+            nodes.append(node)
+            for idx, w in enumerate(wires):
+                free_edges[w] = node[idx]
+
+        for A, wires, operation in self._circuit:
+            node = self._add_node(create_node(A), wires=wires, name=name + operation)
+            nodes.append(node)
+            for idx, w in enumerate(wires):
+                self._edges.append(tn.connect(node[len(wires) + idx], free_edges[w]))
+                free_edges[w] = node[idx]
+
+        return nodes, free_edges
+
+    def _structure(self):
+        """The structure of the network of the state, which determines its contraction path.
+
+        Returns:
+            tuple: the wires of the factors of the state and of the operations
+        """
+        return (
+            tuple(wires for _, wires in self._factors),
+            tuple(tuple(wires) for _, wires, _ in self._circuit),
+        )
+
+    def _contract(self, nodes, key, output_edge_order=None):
+        """Contract a network along its cached contraction path.
+
+        If no contraction path has been cached for the structure of the network, it is found
+        using :func:`_optimal_path` for the ``"optimal"`` contraction of networks with at
+        most :attr:`_max_optimal_nodes` nodes, and :func:`_greedy_path` otherwise.
+
+        Args:
+            nodes (list[tn.Node]): the nodes of the network
+            key (tuple): the structure of the network
+            output_edge_order (list[tn.Edge]): the order of the dangling edges of the result
+
+        Returns:
+            tn.Node: the contracted network
+        """
+        path = self._paths.get(key)
+
+        if path is None:
+            sizes = {}
+            for node in nodes:
+                for e, dim in zip(node.edges, node.shape):
+                    sizes[e] = dim
+
+            inputs = [frozenset(node.edges) for node in nodes]
+
+            if self.contraction == "optimal" and len(nodes) <= self._max_optimal_nodes:
+                path = _optimal_path(inputs, sizes)
+            else:
+                path = _greedy_path(inputs, sizes)
+
+            self._paths[key] = path
+
+        num_nodes = len(nodes)
+        nodes = dict(enumerate(nodes))
+
+        for k, (a, b) in enumerate(path):
+            node1, node2 = nodes.pop(a), nodes.pop(b)
+            if tn.get_shared_edges(node1, node2):
+                nodes[num_nodes + k] = tn.contract_between(node1, node2)
+            else:
+                nodes[num_nodes + k] = tn.outer_product(node1, node2)
+
+        (result,) = nodes.values()
+        if output_edge_order is not None:
+            result.reorder_edges(output_edge_order)
+        return result
+
     def create_nodes_from_tensors(self, tensors: list, wires: list, observable_names: list):
         """Helper function for creating tensornetwork nodes based on tensors.
 
@@ -248,6 +773,157 @@ class TensorNetwork(Device):
         """
         return [self._add_node(A, w, name=o) for A, w, o in zip(tensors, wires, observable_names)]
 
+    def _reduced_density_matrix(self, wires):
+        """Reduced density matrix of the state on a subset of the wires.
+
+        The reduced density matrices are cached until the state changes. If the reduced
+        density matrix of a superset of the wires is cached, the other wires are traced
+        out of it, rather than contracting the network of the state again.
+
+        Args:
+            wires (Iterable[int]): the wires to return the reduced density matrix of
+
+        Returns:
+            (array, tf.Tensor): tensor of shape ``[2] * 2 * len(wires)``, with the ket
+            indices of the wires in ascending order followed by their bra indices
+        """
+        wires = tuple(sorted(set(wires)))
+
+        if wires in self._rdm_cache:
+            return self._rdm_cache[wires]
+
+        for cached_wires, rho in self._rdm_cache.items():
+            if set(wires) <= set(cached_wires):
+                rho = self._partial_trace(rho, cached_wires, wires)
+                break
+        else:
+            if self.representation == "mps":
+                rho = self._mps_reduced_density_matrix(wires)
+            else:
+                rho = self._network_reduced_density_matrix(wires)
+
+        self._rdm_cache[wires] = rho
+        return rho
+
+    def _partial_trace(self, rho, rho_wires, wires):
+        """Trace out wires of a reduced density matrix.
+
+        Args:
+            rho (array, tf.Tensor): reduced density matrix of ``rho_wires``
+            rho_wires (tuple[int]): the wires of ``rho``, in ascending order
+            wires (tuple[int]): the wires to keep, in ascending order
+
+        Returns:
+            (array, tf.Tensor): the reduced density matrix of ``wires``
+        """
+        k = len(rho_wires)
+        ket, bra = _letters[:k], _letters[k : 2 * k]
+        eye = self._array(np.eye(2), dtype=self.C_DTYPE)
+
+        subscripts = [ket + bra]
+        for i, w in enumerate(rho_wires):
+            if w not in wires:
+                subscripts.append(ket[i] + bra[i])
+
+        kept = [i for i, w in enumerate(rho_wires) if w in wires]
+        output = "".join(ket[i] for i in kept) + "".join(bra[i] for i in kept)
+        operands = [rho] + [eye] * (len(subscripts) - 1)
+        return self._einsum(",".join(subscripts) + "->" + output, *operands)
+
+    def _network_reduced_density_matrix(self, wires):
+        """Reduced density matrix of the exact representation, contracting the network
+        of the ket and the bra with the edges of the unmeasured wires connected.
+
+        Args:
+            wires (tuple[int]): the wires, in ascending order
+
+        Returns:
+            (array, tf.Tensor): the reduced density matrix
+        """
+        ket, ket_edges = self._ket()
+        bra, bra_edges = self._ket(conj=True)
+
+        for w in set(range(self.num_wires)) - set(wires):
+            self._edges.append(tn.connect(bra_edges[w], ket_edges[w]))
+
+        output_edge_order = [ket_edges[w] for w in wires] + [bra_edges[w] for w in wires]
+        key = (self._structure(), "rdm", wires)
+        return self._contract(ket + bra, key, output_edge_order=output_edge_order).tensor
+
+    def _mps_reduced_density_matrix(self, wires):
+        """Reduced density matrix of the matrix product state, contracted in a sweep of the
+        left environment over the sites between the wires and the orthogonality centre.
+
+        Args:
+            wires (tuple[int]): the wires, in ascending order
+
+        Returns:
+            array: the reduced density matrix
+        """
+        first = min(wires[0], self._center)
+        last = max(wires[-1], self._center)
+
+        chi = self._site_nodes[first].tensor.shape[0]
+        env = np.eye(chi, dtype=self.C_DTYPE)
+
+        for site in range(first, last + 1):
+            M = self._site_nodes[site].tensor
+            if site in wires:
+                env = np.einsum("...xz,xsa,ztc->...tsac", env, np.conj(M), M)
+            else:
+                env = np.einsum("...xz,xsa,zsc->...ac", env, np.conj(M), M)
+
+        # the open indices alternate between the ket and the bra of each wire
+        rho = np.einsum("...xx->...", env)
+        k = len(wires)
+        return np.transpose(rho, list(range(0, 2 * k, 2)) + list(range(1, 2 * k, 2)))
+
+    def _rdm_ev(self, tensors, wires):
+        r"""Expectation value of observables, computed from the reduced density matrix
+        of the wires they act on.
+
+        Args:
+            tensors (Sequence[array, tf.Tensor]): the observables, as tensors of shape
+                ``[2] * 2 * len(w)``
+            wires (Sequence[Sequence[int]]): measured subsystems for each observable
+
+        Returns:
+            float: expectation value :math:`\expect{A} = \tr(\rho A)`
+        """
+        measured = sorted(set(w for obs_wires in wires for w in obs_wires))
+        rho = self._reduced_density_matrix(measured)
+
+        k = len(measured)
+        ket = {w: _letters[i] for i, w in enumerate(measured)}
+        bra = {w: _letters[k + i] for i, w in enumerate(measured)}
+
+        subscripts = ["".join(ket[w] for w in measured) + "".join(bra[w] for w in measured)]
+        for obs_wires in wires:
+            subscripts.append("".join(bra[w] for w in obs_wires) + "".join(ket[w] for w in obs_wires))
+
+        return self._check_expval(self._einsum(",".join(subscripts) + "->", rho, *tensors))
+
+    def _num_measured(self, wires):
+        """Number of distinct wires measured by observables.
+
+        Args:
+            wires (Sequence[Sequence[int]]): measured subsystems for each observable
+
+        Returns:
+            int: the number of wires
+        """
+        return len(set(w for obs_wires in wires for w in obs_wires))
+
+    def pre_measure(self):
+        # compute the reduced density matrix of all measured wires once, so that the
+        # measurements of wires which are subsets only need to trace out other wires
+        wires = set()
+        for obs in self.obs_queue:
+            wires.update(np.hstack(obs.wires or range(self.num_wires)).tolist())
+
+        if len(wires) <= self._max_rdm_wires:
+            self._reduced_density_matrix(wires)
+
     def expval(self, observable, wires, par):
 
         if not isinstance(observable, list):
@@ -259,6 +935,9 @@ class TensorNetwork(Device):
             num_mult_idxs = len(w)
             tensors.append(self._reshape(A, [2] * num_mult_idxs * 2))
 
+        if self._num_measured(wires) <= self._max_rdm_wires:
+            return self._rdm_ev(tensors, wires)
+
         nodes = self.create_nodes_from_tensors(tensors, wires, observable)
         return self.ev(nodes, wires)
 
@@ -274,6 +953,9 @@ class TensorNetwork(Device):
             self._reshape(A @ A, [2] * len(wires) * 2) for A, wires in zip(matrices, wires)
         ]
 
+        if self._num_measured(wires) <= self._max_rdm_wires:
+            return self._rdm_ev(tensors_of_squared_matrices, wires) - self._rdm_ev(tensors, wires) ** 2
+
         obs_nodes = self.create_nodes_from_tensors(tensors, wires, observable)
         obs_nodes_for_squares = self.create_nodes_from_tensors(
             tensors_of_squared_matrices, wires, observable
@@ -282,43 +964,66 @@ class TensorNetwork(Device):
         return self.ev(obs_nodes_for_squares, wires) - self.ev(obs_nodes, wires) ** 2
 
     def sample(self, observable, wires, par):
+        """Draw samples of an observable.
 
-        if not isinstance(observable, list):
-            observable, wires, par = [observable], [wires], [par]
-
-        matrices = [self._get_operator_matrix(o, p) for o, p in zip(observable, par)]
-
-        decompositions = [spectral_decomposition(A) for A in matrices]
-        eigenvalues, projector_groups = list(zip(*decompositions))
-        eigenvalues = list(eigenvalues)
-
-        # Matching each projector with the wires it acts on
-        # while preserving the groupings
-        projectors_with_wires = [
-            [(proj, wires[idx]) for proj in proj_group]
-            for idx, proj_group in enumerate(projector_groups)
-        ]
+        The probability of each joint eigenvector of the observables is read from the
+        reduced density matrix of the wires they act on.
 
-        # The eigenvalue - projector maps are preserved as product() preserves
-        # the previous ordering by creating a lexicographic ordering
-        joint_outcomes = list(product(*eigenvalues))
-        projector_tensor_products = list(product(*projectors_with_wires))
+        Args:
+            observable (str or list[str]): name of the observable(s)
+            wires (list[int] or list[list[int]]): subsystems the observable(s) act on
+            par (list[Any] or list[list[Any]]): parameters of the observable(s)
 
-        joint_probabilities = []
+        Returns:
+            array[float]: samples of the eigenvalues of the observable
+        """
+        if not isinstance(observable, list):
+            observable, wires, par = [observable], [wires], [par]
 
-        for projs in projector_tensor_products:
-            obs_nodes = []
-            obs_wires = []
-            for proj, proj_wires in projs:
+        measured = sorted(set(w for obs_wires in wires for w in obs_wires))
+        rho = np.asarray(self._reduced_density_matrix(measured))
+
+        k = len(measured)
+        ket = {w: _letters[i] for i, w in enumerate(measured)}
+        bra = {w: _letters[k + i] for i, w in enumerate(measured)}
+
+        subscripts = ["".join(ket[w] for w in measured) + "".join(bra[w] for w in measured)]
+        operands = [rho]
+        output = ""
+        eigenvalues = []
+
+        # <v|rho|v> for the eigenvectors v of each observable
+        for idx, (o, p, obs_wires) in enumerate(zip(observable, par, wires)):
+            entry = spectral_cache[np.asarray(self._get_operator_matrix(o, p))]
+            eigenvalues.append(entry["eigval"])
+
+            V = np.reshape(entry["eigvec"], [2] * len(obs_wires) + [-1])
+            label = _letters[2 * k + idx]
+            operands.extend([np.conj(V), V])
+            subscripts.append("".join(ket[w] for w in obs_wires) + label)
+            subscripts.append("".join(bra[w] for w in obs_wires) + label)
+            output += label
+
+        # The eigenvalue - probability maps are preserved as product() and the
+        # flattened probabilities both order the joint outcomes lexicographically
+        joint_probabilities = np.real(np.einsum(",".join(subscripts) + "->" + output, *operands))
+        joint_probabilities = np.clip(joint_probabilities.flatten(), 0, None)
+        joint_probabilities /= np.sum(joint_probabilities)
+
+        outcomes = np.array([np.prod(p) for p in product(*eigenvalues)])
+        return np.random.choice(outcomes, self.shots, p=joint_probabilities)
 
-                tensor = proj.reshape([2] * len(proj_wires) * 2)
-                obs_nodes.append(self._add_node(tensor, proj_wires))
-                obs_wires.append(proj_wires)
+    def probability(self, wires=None):
+        prob = self.marginal_probability(wires=wires)
+        basis_states = product(range(2), repeat=int(np.log2(len(prob))))
+        return OrderedDict(zip(basis_states, prob))
 
-            joint_probabilities.append(self.ev(obs_nodes, obs_wires))
+    def marginal_probability(self, wires=None):
+        wires = sorted(set(np.hstack(wires or range(self.num_wires)).tolist()))
+        rho = np.asarray(self._reduced_density_matrix(wires))
 
-        outcomes = np.array([np.prod(p) for p in joint_outcomes])
-        return np.random.choice(outcomes, self.shots, p=joint_probabilities)
+        dim = 2 ** len(wires)
+        return np.real(np.diagonal(np.reshape(rho, [dim, dim])))
 
     def _get_operator_matrix(self, operation, par):
         """Get the operator matrix for a given operation or observable.
@@ -343,34 +1048,46 @@ class TensorNetwork(Device):
          Returns:
             float: expectation value :math:`\expect{A} = \bra{\psi}A\ket{\psi}`
         """
-
-        all_wires = tuple(w for w in range(self.num_wires))
-        ket = self._add_node(self._state_node, wires=all_wires, name="Ket")
-        bra = self._add_node(tn.conj(ket), wires=all_wires, name="Bra")
-        meas_wires = []
-        # We need to build up <psi|A|psi> step-by-step.
+        if self.representation == "mps":
+            observables = [
+                np.reshape(node.tensor, [2 ** len(w)] * 2) for node, w in zip(obs_nodes, wires)
+            ]
+            return self._check_expval(self._mps_ev(observables, wires))
+
+        # Build the complete network <psi|A|psi>. We use the convention that the indices
+        # of a tensor are ordered like
+        # [output_idx1, output_idx2, ..., input_idx1, input_idx2, ...]
         # For wires which are measured, we need to connect edges between
         # bra, obs_node, and ket.
         # For wires which are not measured, we need to connect edges between
         # bra and ket.
-        # We use the convention that the indices of a tensor are ordered like
-        # [output_idx1, output_idx2, ..., input_idx1, input_idx2, ...]
+        ket, ket_edges = self._ket()
+        bra, bra_edges = self._ket(conj=True)
+
         for obs_node, obs_wires in zip(obs_nodes, wires):
-            meas_wires.extend(obs_wires)
             for idx, w in enumerate(obs_wires):
-                output_idx = idx
-                input_idx = len(obs_wires) + idx
-                self._add_edge(obs_node, input_idx, ket, w)  # A|psi>
-                self._add_edge(bra, w, obs_node, output_idx)  # <psi|A
-        for w in set(all_wires) - set(meas_wires):
-            self._add_edge(bra, w, ket, w)  # |psi[w]|**2
+                self._edges.append(tn.connect(obs_node[len(obs_wires) + idx], ket_edges[w]))
+                self._edges.append(tn.connect(bra_edges[w], obs_node[idx]))
+                ket_edges[w] = bra_edges[w] = None
+
+        for ket_edge, bra_edge in zip(ket_edges, bra_edges):
+            if ket_edge is not None:
+                self._edges.append(tn.connect(bra_edge, ket_edge))
 
         # At this stage, all nodes are connected, and the contraction yields a
         # scalar value.
-        contracted_ket = ket
-        for obs_node in obs_nodes:
-            contracted_ket = tn.contract_between(obs_node, contracted_ket)
-        expval = tn.contract_between(bra, contracted_ket).tensor
+        key = (self._structure(), tuple(tuple(w) for w in wires))
+        return self._check_expval(self._contract(ket + list(obs_nodes) + bra, key).tensor)
+
+    def _check_expval(self, expval):
+        """Real part of an expectation value, warning if its imaginary part does not vanish.
+
+        Args:
+            expval (complex): the expectation value
+
+        Returns:
+            float: the real part of the expectation value
+        """
         if self._abs(self._imag(expval)) > tolerance:
             warnings.warn(
                 "Nonvanishing imaginary part {} in expectation value.".format(expval.imag),
@@ -387,24 +1104,30 @@ class TensorNetwork(Device):
         Returns:
             (array, tf.Tensor, torch.Tensor): the numerical tensor
         """
+        if self.representation == "mps":
+            state = self._site_nodes[0].tensor
+            for node in self._site_nodes[1:]:
+                state = np.tensordot(state, node.tensor, axes=1)
+            return np.reshape(state, [2] * self.num_wires)
 
-        return self._state_node.tensor
+        ket, free_edges = self._ket()
+        key = (self._structure(), None)
+        return self._contract(ket, key, output_edge_order=free_edges).tensor
 
     def reset(self):
         """Reset the device"""
         self._nodes = []
         self._edges = []
+        self._rdm_cache = {}
+        self.truncation_error = 0.0
 
-        state = self._create_basis_state([0] * self.num_wires, range(self.num_wires))
-        state = self._array(state, dtype=self.C_DTYPE)
+        if self.representation == "mps":
+            self._mps_basis_state([0] * self.num_wires)
+            return
 
-        # TODO: since this state is separable, can be more intelligent about not making a dense matrix
-        self._state_node = self._add_node(
-            state, wires=tuple(w for w in range(self.num_wires)), name="AllZeroState"
-        )
-        self._free_edges = self._state_node.edges[
-            :
-        ]  # we need this list to be distinct from self._state_node.edges
+        zero = self._array([1, 0], dtype=self.C_DTYPE)
+        self._factors = [(zero, (w,)) for w in range(self.num_wires)]
+        self._circuit = []
 
     @property
     def operations(self):
@@ -253,6 +253,7 @@ class TensorNetworkTF(TensorNetwork):
     _real = staticmethod(tf.math.real)
     _imag = staticmethod(tf.math.imag)
     _abs = staticmethod(tf.abs)
+    _einsum = staticmethod(tf.einsum)
 
     C_DTYPE = C_DTYPE
     R_DTYPE = R_DTYPE
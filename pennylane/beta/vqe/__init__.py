@@ -15,4 +15,4 @@
 This package contains functionality for running Variational Quantum Eigensolver (VQE)
 computations using PennyLane.
 """
-from .vqe import Hamiltonian, circuits, aggregate, cost
+from .vqe import Hamiltonian, PauliHamiltonian, circuits, aggregate, cost, VQECost
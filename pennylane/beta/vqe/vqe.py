@@ -15,10 +15,17 @@
 This submodule contains functionality for running Variational Quantum Eigensolver (VQE)
 computations using PennyLane.
 """
+import autograd.builtins
+import autograd.extend
 import numpy as np
-from pennylane.ops import Observable
+from scipy import sparse
+
+from pennylane.operation import Tensor
+from pennylane.ops import Identity, Observable, PauliX, PauliY, PauliZ
 from pennylane.measure import expval
+from pennylane.plugins.default_qubit import DefaultQubit
 from pennylane.qnodes import QNode
+from pennylane.utils import unflatten
 
 
 class Hamiltonian:
@@ -84,7 +91,289 @@ class Hamiltonian:
         return self.coeffs, self.ops
 
 
-def circuits(ansatz, observables, device, interface="numpy"):
+class PauliHamiltonian:
+    r"""Compact representation of a Hamiltonian as a linear combination of Pauli words.
+
+    Rather than storing an :class:`~.Observable` per term, as :class:`Hamiltonian` does, the
+    :math:`N` terms :math:`c_k P_k` are stored as a vector of coefficients and two boolean arrays
+    of shape ``(N, num_wires)``, the X and Z masks. The Pauli word :math:`P_k` acts on wire
+    :math:`w` with the identity, :math:`X`, :math:`Z` or :math:`Y` if the masks
+    ``(x_mask[k, w], z_mask[k, w])`` are ``(0, 0)``, ``(1, 0)``, ``(0, 1)`` or ``(1, 1)``.
+
+    **Example:**
+
+    >>> H = Hamiltonian([0.5, -0.2], [qml.PauliZ(0), qml.PauliX(0) @ qml.PauliY(1)])
+    >>> P = PauliHamiltonian.from_hamiltonian(H)
+    >>> P.x_mask
+    array([[False, False],
+           [ True,  True]])
+    >>> P.z_mask
+    array([[ True, False],
+           [False,  True]])
+
+    Args:
+        coeffs (array[float]): coefficients of the terms
+        x_mask (array[bool]): X masks of the Pauli words of the terms
+        z_mask (array[bool]): Z masks of the Pauli words of the terms
+    """
+
+    def __init__(self, coeffs, x_mask, z_mask):
+        coeffs = np.asarray(coeffs)
+        x_mask = np.asarray(x_mask, dtype=bool)
+        z_mask = np.asarray(z_mask, dtype=bool)
+
+        if x_mask.ndim != 2 or x_mask.shape != z_mask.shape or len(coeffs) != len(x_mask):
+            raise ValueError(
+                "Could not create valid Hamiltonian; "
+                "number of coefficients and Pauli words does not match."
+            )
+
+        if any(np.imag(coeffs) != 0):
+            raise ValueError(
+                "Could not create valid Hamiltonian; " "coefficients are not real-valued."
+            )
+
+        self._coeffs = np.real(coeffs).astype(float)
+        self._x_mask = x_mask
+        self._z_mask = z_mask
+        self._matrix = None
+
+    @property
+    def coeffs(self):
+        """Return the coefficients defining the Hamiltonian.
+
+        Returns:
+            array[float]: coefficients of the terms
+        """
+        return self._coeffs
+
+    @property
+    def x_mask(self):
+        """Return the X masks of the Pauli words defining the Hamiltonian.
+
+        Returns:
+            array[bool]: X masks, of shape ``(num_terms, num_wires)``
+        """
+        return self._x_mask
+
+    @property
+    def z_mask(self):
+        """Return the Z masks of the Pauli words defining the Hamiltonian.
+
+        Returns:
+            array[bool]: Z masks, of shape ``(num_terms, num_wires)``
+        """
+        return self._z_mask
+
+    @property
+    def num_wires(self):
+        """Number of wires the Hamiltonian acts on.
+
+        Returns:
+            int: number of wires
+        """
+        return self._x_mask.shape[1]
+
+    def __len__(self):
+        return len(self._coeffs)
+
+    @property
+    def terms(self):
+        r"""The terms of the Hamiltonian expression :math:`\sum_{k=0}^{N-1} c_k P_k`, in the
+        format of :attr:`Hamiltonian.terms`.
+
+        Returns:
+            (tuple, tuple): tuples of coefficients and observables, each of length N
+        """
+        return self.to_hamiltonian().terms
+
+    @classmethod
+    def from_hamiltonian(cls, hamiltonian, num_wires=None):
+        """Create the compact representation of a Hamiltonian consisting of Pauli words.
+
+        Args:
+            hamiltonian (Hamiltonian): Hamiltonian whose observables are tensor products of
+                :class:`~.PauliX`, :class:`~.PauliY`, :class:`~.PauliZ` and :class:`~.Identity`
+            num_wires (int or None): number of wires; by default, the number of wires
+                required by the observables
+
+        Raises:
+            ValueError: if an observable is not a Pauli word
+
+        Returns:
+            PauliHamiltonian: the Hamiltonian
+        """
+        coeffs, observables = hamiltonian.terms
+        words = []
+
+        for obs in observables:
+            factors = obs.obs if isinstance(obs, Tensor) else [obs]
+            word = {}
+
+            for factor in factors:
+                if factor.name not in ("PauliX", "PauliY", "PauliZ", "Identity"):
+                    raise ValueError(
+                        "Could not create Pauli words; {} is not a Pauli operator.".format(
+                            factor.name
+                        )
+                    )
+
+                wire = factor.wires[0]
+
+                if wire in word:
+                    raise ValueError("Could not create Pauli words; wire {} is repeated.".format(wire))
+
+                word[wire] = factor.name
+
+            words.append(word)
+
+        if num_wires is None:
+            num_wires = max(w for word in words for w in word) + 1
+
+        x_mask = np.zeros((len(words), num_wires), dtype=bool)
+        z_mask = np.zeros((len(words), num_wires), dtype=bool)
+
+        for k, word in enumerate(words):
+            for wire, name in word.items():
+                x_mask[k, wire] = name in ("PauliX", "PauliY")
+                z_mask[k, wire] = name in ("PauliZ", "PauliY")
+
+        return cls(coeffs, x_mask, z_mask)
+
+    def to_hamiltonian(self):
+        """Return the Hamiltonian with one observable per term.
+
+        Returns:
+            Hamiltonian: the Hamiltonian
+        """
+        paulis = {(True, False): PauliX, (False, True): PauliZ, (True, True): PauliY}
+        observables = []
+
+        for x, z in zip(self._x_mask, self._z_mask):
+            factors = [
+                paulis[(x[w], z[w])](wires=w, do_queue=False) for w in np.flatnonzero(x | z)
+            ]
+
+            if not factors:
+                observables.append(Identity(wires=0, do_queue=False))
+            elif len(factors) == 1:
+                observables.append(factors[0])
+            else:
+                observables.append(Tensor(*factors))
+
+        return Hamiltonian(list(self._coeffs), observables)
+
+    def simplify(self, atol=1e-12):
+        """Merge the terms with the same Pauli word.
+
+        Args:
+            atol (float): terms whose merged coefficients do not exceed this magnitude are removed
+
+        Returns:
+            PauliHamiltonian: the simplified Hamiltonian
+        """
+        words, inverse = np.unique(
+            np.hstack([self._x_mask, self._z_mask]), axis=0, return_inverse=True
+        )
+        coeffs = np.zeros(len(words))
+        np.add.at(coeffs, inverse.ravel(), self._coeffs)
+
+        keep = np.abs(coeffs) > atol
+        n = self.num_wires
+        return PauliHamiltonian(coeffs[keep], words[keep, :n], words[keep, n:])
+
+    def save(self, file):
+        """Save the Hamiltonian to a ``.npz`` file.
+
+        Args:
+            file (str or file): file name or file object, see :func:`numpy.savez`
+        """
+        np.savez(file, coeffs=self._coeffs, x_mask=self._x_mask, z_mask=self._z_mask)
+
+    @classmethod
+    def load(cls, file):
+        """Load a Hamiltonian saved using :meth:`save`.
+
+        Args:
+            file (str or file): file name or file object, see :func:`numpy.load`
+
+        Returns:
+            PauliHamiltonian: the Hamiltonian
+        """
+        with np.load(file) as data:
+            return cls(data["coeffs"], data["x_mask"], data["z_mask"])
+
+    def sparse_matrix(self):
+        r"""Sparse matrix representation of the Hamiltonian.
+
+        The Pauli word :math:`P` with masks :math:`x, z` maps the computational basis state
+        :math:`|b\rangle` to :math:`i^{|x \wedge z|} (-1)^{b \cdot z} |b \oplus x\rangle`. Terms with
+        the same X mask share the same sparsity pattern, so the matrix has ``2**num_wires``
+        nonzero entries per distinct X mask. The matrix is computed once, and cached.
+
+        Returns:
+            scipy.sparse.csr_matrix: matrix of shape ``(2**num_wires, 2**num_wires)``,
+            with the basis states in lexicographic order
+        """
+        if self._matrix is not None:
+            return self._matrix
+
+        n = self.num_wires
+        dim = 2 ** n
+        powers = 2 ** np.arange(n - 1, -1, -1, dtype=np.int64)
+        cols = np.arange(dim, dtype=np.int64)
+
+        x_masks, inverse = np.unique(self._x_mask, axis=0, return_inverse=True)
+        inverse = inverse.ravel()
+        rows, data = [], []
+
+        for k, x in enumerate(x_masks):
+            values = np.zeros(dim, dtype=np.complex128)
+
+            for c, z in zip(self._coeffs[inverse == k], self._z_mask[inverse == k]):
+                phase = 1j ** np.count_nonzero(x & z)
+                values += c * phase * (1 - 2 * _parity(cols & (z @ powers)))
+
+            rows.append(cols ^ (x @ powers))
+            data.append(values)
+
+        self._matrix = sparse.csr_matrix(
+            (np.concatenate(data), (np.concatenate(rows), np.tile(cols, len(x_masks)))),
+            shape=(dim, dim),
+        )
+        return self._matrix
+
+    def expval(self, state):
+        r"""Expectation value :math:`\langle\psi|H|\psi\rangle` of the Hamiltonian in a state,
+        computed using a single sparse matrix-vector product.
+
+        Args:
+            state (array[complex]): state vector of length ``2**num_wires``, for example
+                the state of a statevector simulator
+
+        Returns:
+            float: expectation value
+        """
+        state = np.ravel(state)
+        return np.real(np.vdot(state, self.sparse_matrix() @ state))
+
+
+def _parity(v):
+    """Parity of the number of set bits of each integer in an array.
+
+    Args:
+        v (array[int]): non-negative 64-bit integers
+
+    Returns:
+        array[int]: 1 if the number of set bits is odd, else 0
+    """
+    v = v.copy()
+    for shift in (32, 16, 8, 4, 2, 1):
+        v ^= v >> shift
+    return v & 1
+
+
+def circuits(ansatz, observables, device, interface="numpy", mutable=True):
     """Create a set of callable functions which evaluate quantum circuits based on
     ``ansatz`` and ``observables``.
 
@@ -103,6 +392,9 @@ def circuits(ansatz, observables, device, interface="numpy"):
         observables (Iterable[:class:`~.Observable`]): observables to measure during the final step of each circuit
         device (:class:`~.Device`): device where the circuits should be executed
         interface (str): which interface to use for the circuit QNodes
+        mutable (bool): whether the circuit QNodes are mutable; immutable QNodes construct
+            the circuit only once, so the structure of the ansatz may not depend on the
+            values of its parameters
 
     Returns:
         tuple: callable functions which evaluate each observable
@@ -112,17 +404,22 @@ def circuits(ansatz, observables, device, interface="numpy"):
             "Could not create quantum circuits. The ansatz is not a callable function."
         )
 
-    # TODO: can be more clever/efficient here for observables which are jointly measurable
+    # see VQECost for evaluating all observables on a single simulated state
     qnodes = []
     for obs in observables:
         if not isinstance(obs, Observable):
             raise ValueError("Could not create circuits. Some or all observables are not valid.")
 
-        def circuit(*params, obs=obs):
-            ansatz(*params, wires=range(device.num_wires))
-            return expval(obs)
+        def make_circuit(obs):
+            # the observable is bound in a closure rather than as a default argument,
+            # as immutable QNodes convert the auxiliary arguments into variables
+            def circuit(*params):
+                ansatz(*params, wires=range(device.num_wires))
+                return expval(obs)
+
+            return circuit
 
-        qnode = QNode(circuit, device, interface=interface)
+        qnode = QNode(make_circuit(obs), device, interface=interface, mutable=mutable)
 
         qnodes.append(qnode)
 
@@ -177,3 +474,159 @@ def cost(params, ansatz, hamiltonian, device, interface="numpy"):
     coeffs, observables = hamiltonian.terms
     qnodes = circuits(ansatz, observables, device, interface)
     return aggregate(coeffs, qnodes, params)
+
+
+class VQECost:
+    """Persistent VQE cost function, i.e., the expectation value of a Hamiltonian as a
+    function of the parameters of an ansatz.
+
+    Unlike :func:`cost`, the circuits are constructed once, when the cost object is created.
+    By default, the circuits are immutable, so the ansatz is only called once to construct the
+    circuit structure, and subsequent evaluations only update the parameter values.
+
+    On statevector simulators computing exact expectation values, a single QNode returns the
+    expectation values of all the terms of the Hamiltonian. Each evaluation therefore runs the
+    ansatz once, and evaluates all the terms on the resulting state. Likewise, each shifted
+    circuit of the parameter-shift rule is executed once, and its state is used for the
+    partial derivatives of all the terms. On other devices, one QNode per term is evaluated.
+
+    If the Hamiltonian is a :class:`PauliHamiltonian`, and the Autograd (or NumPy) interface is
+    used, the expectation value on a statevector simulator is instead computed using a single
+    product of its :meth:`~.PauliHamiltonian.sparse_matrix` with the simulated state. The
+    gradient is still obtained from the expectation values of the terms on the shifted states.
+
+    **Example:**
+
+    >>> dev = qml.device("default.qubit", wires=2)
+    >>> H = Hamiltonian([0.5, -0.2], [qml.PauliZ(0), qml.PauliX(0) @ qml.PauliX(1)])
+    >>> cost = VQECost(qml.templates.layers.StronglyEntanglingLayers, H, dev)
+    >>> params = qml.init.strong_ent_layers_uniform(n_layers=2, n_wires=2)
+    >>> cost(params)
+    0.1734802329356154
+
+    Args:
+        ansatz (function or :class:`~.template`): Callable function which contains a
+            series of PennyLane operations, but no measurements.
+        hamiltonian (:class:`~.Hamiltonian` or :class:`~.PauliHamiltonian`): the Hamiltonian
+            whose expectation value is to be evaluated
+        device (:class:`~.Device`): device where the circuits should be executed
+        interface (str): which interface to use for the underlying circuits
+        mutable (bool): whether the circuits are mutable; set to ``True`` if the structure of
+            the ansatz depends on the values of its parameters, or the ansatz performs numerical
+            operations on its parameters (such as a state preparation)
+    """
+
+    def __init__(self, ansatz, hamiltonian, device, interface="numpy", mutable=False):
+        self.hamiltonian = hamiltonian
+        """:class:`~.Hamiltonian` or :class:`~.PauliHamiltonian`: the Hamiltonian whose
+        expectation value is evaluated"""
+
+        coeffs, observables = hamiltonian.terms
+        self._coeffs = coeffs
+
+        # whether a single QNode evaluates all the terms on the simulated state
+        self._joint = isinstance(device, DefaultQubit) and device.analytic
+
+        # whether the expectation value is computed using the sparse matrix of the Hamiltonian
+        self._sparse = (
+            self._joint
+            and isinstance(hamiltonian, PauliHamiltonian)
+            and hamiltonian.num_wires <= device.num_wires
+            and interface in ("autograd", "numpy")
+        )
+
+        if self._joint:
+            if not callable(ansatz):
+                raise ValueError(
+                    "Could not create quantum circuits. The ansatz is not a callable function."
+                )
+
+            def circuit(*params):
+                ansatz(*params, wires=range(device.num_wires))
+                return [expval(obs) for obs in observables]
+
+            self.qnodes = [
+                QNode(
+                    circuit,
+                    device,
+                    interface=interface,
+                    mutable=mutable,
+                    properties={"shared_wires": True},
+                )
+            ]
+            """list[:class:`~.QNode`]: the QNodes evaluated by the cost function"""
+
+            if self._sparse:
+                # the remaining wires are acted on by the identity
+                padding = ((0, 0), (0, device.num_wires - hamiltonian.num_wires))
+                self._matrix_hamiltonian = PauliHamiltonian(
+                    hamiltonian.coeffs,
+                    np.pad(hamiltonian.x_mask, padding),
+                    np.pad(hamiltonian.z_mask, padding),
+                )
+
+                def state_circuit(*params):
+                    ansatz(*params, wires=range(device.num_wires))
+                    return expval(Identity(wires=0))
+
+                # only used to prepare the state, whose expectation value is computed directly
+                self._state_qnode = QNode(state_circuit, device, interface=None, mutable=mutable)
+        else:
+            self.qnodes = circuits(ansatz, observables, device, interface, mutable=mutable)
+
+    def __call__(self, *params):
+        """Evaluate the cost function.
+
+        Args:
+            params (Iterable[float, tf.Tensor, torch.Tensor]): the parameters of the circuit
+
+        Returns:
+            float: the expectation value of the Hamiltonian
+        """
+        if self._sparse:
+            # prevents autograd boxed arguments from going through to the state QNode
+            return _sparse_expval(self, autograd.builtins.tuple(params))
+
+        if self._joint:
+            expvals = self.qnodes[0](*params)
+            return sum(c * expvals[k] for k, c in enumerate(self._coeffs))
+
+        return aggregate(self._coeffs, self.qnodes, params)
+
+
+@autograd.extend.primitive
+def _sparse_expval(cost, args):
+    """Expectation value of a :class:`PauliHamiltonian` on the state prepared by the ansatz,
+    computed using a single sparse matrix-vector product.
+
+    Args:
+        cost (VQECost): cost function using the sparse matrix of its Hamiltonian
+        args (tuple[Any]): parameters of the ansatz
+
+    Returns:
+        float: expectation value
+    """
+    # pylint: disable=protected-access
+    cost._state_qnode.evaluate(args, {})
+    return cost._matrix_hamiltonian.expval(cost._state_qnode.device._state)
+
+
+def _sparse_expval_vjp(ans, cost, args):
+    """Returns the vector-Jacobian product operator for :func:`_sparse_expval`.
+
+    The Jacobian of the expectation values of the terms is computed by the QNode of the cost
+    function, which shares each shifted state between all the terms.
+
+    Returns:
+        function[float, array[float]]: vector-Jacobian product operator
+    """
+    # pylint: disable=unused-argument,protected-access
+    def gradient_product(g):
+        jac = cost.qnodes[0].jacobian(args, {})
+        temp = g * (np.asarray(cost._coeffs) @ jac)
+        return unflatten(temp.flat, args)
+
+    return gradient_product
+
+
+autograd.extend.defvjp(_sparse_expval, _sparse_expval_vjp, argnums=[1])
@@ -23,7 +23,7 @@ from pennylane.templates.state_preparations import (
     BasisStatePreparation,
     MottonenStatePreparation,
 )
-from pennylane.utils import OperationRecorder, pauli_eigs
+from pennylane.utils import OperationRecorder, pauli_eigs, spectral_cache
 
 
 class Hadamard(Observable, Operation):
@@ -961,41 +961,33 @@ class Hermitian(Observable):
     num_params = 1
     par_domain = "A"
     grad_method = "F"
-    _eigs = {}
+    _eigs = spectral_cache
 
     @classmethod
     def eigvals(cls, Hmat):
         """Return the eigenvalues of the specified Hermitian observable.
 
-        This method uses pre-stored eigenvalues for standard observables where
-        possible and stores the corresponding eigenvectors from the eigendecomposition.
+        The eigendecomposition is stored in the shared :data:`~.utils.spectral_cache`,
+        and reused for as long as the matrix remains in the cache.
 
         Returns:
             array: array containing the eigenvalues of the Hermitian observable
         """
-        Hkey = tuple(Hmat.flatten().tolist())
-        if Hkey not in cls._eigs:
-            w, U = np.linalg.eigh(Hmat)
-            cls._eigs[Hkey] = {"eigval": w, "eigvec": U}
-        return cls._eigs[Hkey]["eigval"]
+        return cls._eigs[Hmat]["eigval"]
 
     @classmethod
     def diagonalizing_gates(cls, Hmat, wires):
         """Return the gate set that diagonalizes a circuit according to the
         specified Hermitian observable.
 
-        This method uses pre-stored eigenvalues for standard observables where
-        possible and stores the corresponding eigenvectors from the eigendecomposition.
+        The eigendecomposition is stored in the shared :data:`~.utils.spectral_cache`,
+        and reused for as long as the matrix remains in the cache.
 
         Returns:
             array: array containing the eigenvalues of the tensor product observable
         """
-        Hkey = tuple(Hmat.flatten().tolist())
-        if Hkey not in cls._eigs:
-            w, U = np.linalg.eigh(Hmat)
-            cls._eigs[Hkey] = {"eigval": w, "eigvec": U}
         return [
-            QubitUnitary(cls._eigs[Hkey]["eigvec"].conj().T, wires=wires),
+            QubitUnitary(cls._eigs[Hmat]["eigvec"].conj().T, wires=wires),
         ]
 
 
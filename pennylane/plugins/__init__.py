@@ -22,7 +22,13 @@ to verify and test quantum gradient computations.
     :toctree: api
 
     default_qubit
+    default_qubit_autograd
+    default_qubit_sparse
+    default_clifford
     default_gaussian
 """
 from .default_qubit import DefaultQubit
+from .default_qubit_autograd import DefaultQubitAutograd
+from .default_qubit_sparse import DefaultQubitSparse
+from .default_clifford import DefaultClifford
 from .default_gaussian import DefaultGaussian
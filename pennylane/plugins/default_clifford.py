@@ -0,0 +1,301 @@
+# Copyright 2019 Xanadu Quantum Technologies Inc.
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+
+#     http://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+r"""
+Stabilizer simulator plugin for Clifford circuits.
+
+The state is represented by the stabilizer tableau of Aaronson and Gottesman
+[`arXiv:quant-ph/0406196 <https://arxiv.org/abs/quant-ph/0406196>`_], so that Clifford
+operations are applied in :math:`\mathcal{O}(n)` and Pauli observables are measured in
+:math:`\mathcal{O}(n^2)` time, rather than requiring a state vector of size :math:`2^n`.
+"""
+from collections import OrderedDict
+import functools
+import itertools
+
+import numpy as np
+
+from pennylane import Device, DeviceError
+from pennylane.operation import Operation
+
+
+class DefaultClifford(Device):
+    r"""Stabilizer tableau simulator device for Clifford circuits.
+
+    The tableau holds :math:`2n` Pauli operators, as rows of bits :math:`x_{ij}, z_{ij}`
+    and a sign bit :math:`r_i`: the first :math:`n` rows are the destabilizers, and the last
+    :math:`n` rows are the stabilizers generating the stabilizer group of the state. A row with
+    :math:`x_{ij} = z_{ij} = 1` acts as :math:`Y` on wire :math:`j`.
+
+    The expectation value of a Pauli word :math:`P` is :math:`\pm 1` if :math:`\pm P` is in the
+    stabilizer group of the state, and zero otherwise. Samples of a Pauli word are drawn from
+    its two eigenvalues accordingly. Probabilities are computed from the expectation values
+    of all products of :math:`Z` operators on the requested wires, and are therefore limited
+    to at most :attr:`_max_probability_wires` wires.
+
+    Args:
+        wires (int): the number of modes to initialize the device in
+        shots (int): How many times the circuit should be evaluated (or sampled) to estimate
+            the expectation values. Defaults to 1000 if not specified.
+            If ``analytic == True``, then the number of shots is ignored
+            in the calculation of expectation values and variances, and only controls the number
+            of samples returned by ``sample``.
+        analytic (bool): indicates if the device should calculate expectations
+            and variances analytically
+    """
+
+    name = "Default Clifford stabilizer PennyLane plugin"
+    short_name = "default.clifford"
+    pennylane_requires = "0.8"
+    version = "0.8.0"
+    author = "Xanadu Inc."
+    _capabilities = {"model": "qubit", "tensor_observables": True, "inverse_operations": True}
+
+    _operation_decompositions = {
+        "Hadamard": [("H", 0)],
+        "S": [("S", 0)],
+        "PauliX": [("H", 0), ("S", 0), ("S", 0), ("H", 0)],
+        "PauliZ": [("S", 0), ("S", 0)],
+        "PauliY": [("S", 0), ("S", 0), ("H", 0), ("S", 0), ("S", 0), ("H", 0)],
+        "CNOT": [("CNOT", 0, 1)],
+        "CZ": [("H", 1), ("CNOT", 0, 1), ("H", 1)],
+        "SWAP": [("CNOT", 0, 1), ("CNOT", 1, 0), ("CNOT", 0, 1)],
+    }
+    """dict[str, list[tuple]]: decomposition of each supported operation into the Hadamard
+    (``"H"``), phase (``"S"``) and ``"CNOT"`` updates of the tableau, acting on the wires
+    of the operation with the given indices"""
+
+    _self_inverse = {"Hadamard", "PauliX", "PauliY", "PauliZ", "CNOT", "CZ", "SWAP"}
+
+    _pauli_bits = {"PauliX": (1, 0), "PauliY": (1, 1), "PauliZ": (0, 1), "Identity": (0, 0)}
+    """dict[str, tuple[int, int]]: the bits :math:`(x, z)` of the supported observables"""
+
+    _max_probability_wires = 16
+    """int: maximum number of wires the probabilities can be returned for"""
+
+    def __init__(self, wires, *, shots=1000, analytic=True):
+        super().__init__(wires, shots)
+        self.analytic = analytic
+
+        self._x = None
+        self._z = None
+        self._r = None
+        self._first_operation = True
+
+    def pre_apply(self):
+        self.reset()
+
+    def apply(self, operation, wires, par):
+        if operation == "BasisState":
+            if not self._first_operation:
+                raise DeviceError(
+                    "Operation {} cannot be used after other Operations have already been "
+                    "applied on a {} device.".format(operation, self.short_name)
+                )
+
+            if not set(par[0]).issubset({0, 1}):
+                raise ValueError("BasisState parameter must consist of 0 or 1 integers.")
+            if len(par[0]) != len(wires):
+                raise ValueError("BasisState parameter and wires must be of equal length.")
+
+            for bit, w in zip(par[0], wires):
+                if bit:
+                    self.apply("PauliX", [w], [])
+
+            self._first_operation = False
+            return
+
+        self._first_operation = False
+
+        inverse = operation.endswith(Operation.string_for_inverse)
+        if inverse:
+            operation = operation[: -len(Operation.string_for_inverse)]
+
+        steps = self._operation_decompositions[operation]
+
+        if inverse and operation not in self._self_inverse:
+            # the inverse of the phase gate is S^3
+            steps = steps * 3
+
+        for gate, *idx in steps:
+            getattr(self, "_" + gate.lower())(*[wires[i] for i in idx])
+
+    def _h(self, a):
+        """Apply the Hadamard gate to wire ``a``."""
+        self._r ^= self._x[:, a] & self._z[:, a]
+        self._x[:, a], self._z[:, a] = self._z[:, a].copy(), self._x[:, a].copy()
+
+    def _s(self, a):
+        """Apply the phase gate to wire ``a``."""
+        self._r ^= self._x[:, a] & self._z[:, a]
+        self._z[:, a] ^= self._x[:, a]
+
+    def _cnot(self, a, b):
+        """Apply the CNOT gate with control wire ``a`` and target wire ``b``."""
+        x, z = self._x, self._z
+        self._r ^= x[:, a] & z[:, b] & ~(x[:, b] ^ z[:, a])
+        x[:, b] ^= x[:, a]
+        z[:, a] ^= z[:, b]
+
+    @staticmethod
+    def _phase_exponent(x1, z1, x2, z2):
+        r"""Exponent of the phase :math:`i^g` acquired when multiplying the single-qubit Paulis
+        of two rows, summed over the wires.
+
+        Args:
+            x1, z1 (array[bool]): bits of the left factor
+            x2, z2 (array[bool]): bits of the right factor
+
+        Returns:
+            int: the exponent :math:`g`
+        """
+        x1, z1, x2, z2 = (np.asarray(v, dtype=int) for v in (x1, z1, x2, z2))
+        g = (
+            x1 * z1 * (z2 - x2)
+            + x1 * (1 - z1) * z2 * (2 * x2 - 1)
+            + (1 - x1) * z1 * x2 * (1 - 2 * z2)
+        )
+        return int(np.sum(g))
+
+    def _pauli_row(self, observable, wires):
+        """Bits of a Pauli word observable.
+
+        Args:
+            observable (str or list[str]): name of the observable, or the names of the factors
+                of a tensor product observable
+            wires (list[int] or list[list[int]]): subsystems the observable(s) act on
+
+        Returns:
+            tuple[array[bool], array[bool]]: the bits :math:`x` and :math:`z` of the observable
+        """
+        if not isinstance(observable, list):
+            observable, wires = [observable], [wires]
+
+        x = np.zeros(self.num_wires, dtype=bool)
+        z = np.zeros(self.num_wires, dtype=bool)
+
+        for name, w in zip(observable, wires):
+            for wire in np.hstack(w).tolist():
+                x[wire], z[wire] = self._pauli_bits[name]
+
+        return x, z
+
+    def _pauli_ev(self, x, z):
+        """Expectation value of a Pauli word in the stabilizer state.
+
+        Args:
+            x (array[bool]): :math:`x` bits of the Pauli word
+            z (array[bool]): :math:`z` bits of the Pauli word
+
+        Returns:
+            int: 1 or -1 if the Pauli word or its negative stabilizes the state, otherwise 0
+        """
+        n = self.num_wires
+
+        # rows anticommuting with the Pauli word
+        anticommuting = (np.sum(self._x & z, axis=1) + np.sum(self._z & x, axis=1)) % 2 == 1
+
+        if np.any(anticommuting[n:]):
+            return 0
+
+        # the Pauli word is the product of the stabilizers whose
+        # destabilizers anticommute with it, up to a sign
+        row_x = np.zeros(n, dtype=bool)
+        row_z = np.zeros(n, dtype=bool)
+        phase = 0
+
+        for i in np.flatnonzero(anticommuting[:n]):
+            s = i + n
+            phase += 2 * int(self._r[s]) + self._phase_exponent(
+                self._x[s], self._z[s], row_x, row_z
+            )
+            row_x ^= self._x[s]
+            row_z ^= self._z[s]
+
+        return 1 if phase % 4 == 0 else -1
+
+    def expval(self, observable, wires, par):
+        if not self.analytic:
+            return np.mean(self.sample(observable, wires, par))
+
+        return float(self._pauli_ev(*self._pauli_row(observable, wires)))
+
+    def var(self, observable, wires, par):
+        if not self.analytic:
+            return np.var(self.sample(observable, wires, par))
+
+        # Pauli words square to the identity
+        return 1.0 - self._pauli_ev(*self._pauli_row(observable, wires)) ** 2
+
+    def sample(self, observable, wires, par):
+        ev = self._pauli_ev(*self._pauli_row(observable, wires))
+
+        if ev != 0:
+            return np.full(self.shots, float(ev))
+
+        # both eigenvalues are equally likely
+        return np.random.choice([-1.0, 1.0], self.shots)
+
+    def probability(self, wires=None):
+        prob = self.marginal_probability(wires=wires)
+
+        if prob is None:
+            return None
+
+        basis_states = itertools.product(range(2), repeat=int(np.log2(len(prob))))
+        return OrderedDict(zip(basis_states, prob))
+
+    def marginal_probability(self, wires=None):
+        if self._x is None:
+            return None
+
+        wires = sorted(set(np.hstack(wires or range(self.num_wires)).tolist()))
+
+        if len(wires) > self._max_probability_wires:
+            raise DeviceError(
+                "The probabilities can only be returned for at most {} wires on the {} "
+                "device.".format(self._max_probability_wires, self.short_name)
+            )
+
+        # expectation values of the products of Z operators on all subsets of the wires
+        z_evs = np.empty(2 ** len(wires))
+        x = np.zeros(self.num_wires, dtype=bool)
+
+        for subset, bits in enumerate(itertools.product([0, 1], repeat=len(wires))):
+            z = np.zeros(self.num_wires, dtype=bool)
+            z[wires] = bits
+            z_evs[subset] = self._pauli_ev(x, z)
+
+        # p(b) = 2^{-k} sum_S (-1)^{b.S} <Z_S>
+        hadamard = functools.reduce(np.kron, [np.array([[1, 1], [1, -1]])] * len(wires), np.eye(1))
+        return hadamard @ z_evs / 2 ** len(wires)
+
+    def reset(self):
+        """Reset the device"""
+        n = self.num_wires
+        self._first_operation = True
+
+        # destabilizers X_i and stabilizers Z_i of the state |00..0>
+        self._x = np.zeros((2 * n, n), dtype=bool)
+        self._z = np.zeros((2 * n, n), dtype=bool)
+        self._r = np.zeros(2 * n, dtype=bool)
+        self._x[np.arange(n), np.arange(n)] = True
+        self._z[np.arange(n, 2 * n), np.arange(n)] = True
+
+    @property
+    def operations(self):
+        return set(self._operation_decompositions) | {"BasisState"}
+
+    @property
+    def observables(self):
+        return set(self._pauli_bits)
@@ -19,16 +19,33 @@ It implements the necessary :class:`~pennylane._device.Device` methods as well a
 :mod:`qubit operations <pennylane.ops.qubit>`, and provides a very simple pure state
 simulation of a qubit-based quantum circuit architecture.
 """
-from collections import OrderedDict
+from collections import OrderedDict, namedtuple
+from concurrent.futures import ThreadPoolExecutor
 import itertools
 import functools
+from string import ascii_letters as ABC
+import tempfile
 import warnings
 
 import numpy as np
-from scipy.linalg import eigh
 
 from pennylane import Device, DeviceError
-from pennylane.operation import Operation
+from pennylane.operation import (
+    Operation,
+    Expectation,
+    Variance,
+    Probability,
+    Sample,
+    Observable,
+    Tensor,
+)
+from pennylane.utils import (
+    _circuit_structure,
+    _flatten,
+    _measurement_bases,
+    group_observables,
+    spectral_cache,
+)
 
 
 # tolerance for numerical errors
@@ -42,6 +59,9 @@ tolerance = 1e-10
 def spectral_decomposition(A):
     r"""Spectral decomposition of a Hermitian matrix.
 
+    The decomposition is looked up in, or stored in, the shared
+    :data:`~.utils.spectral_cache`.
+
     Args:
         A (array): Hermitian matrix
 
@@ -49,12 +69,8 @@ def spectral_decomposition(A):
         (vector[float], list[array[complex]]): (a, P): eigenvalues and hermitian projectors
             such that :math:`A = \sum_k a_k P_k`.
     """
-    d, v = eigh(A)
-    P = []
-    for k in range(d.shape[0]):
-        temp = v[:, k]
-        P.append(np.outer(temp, temp.conj()))
-    return d, P
+    entry = spectral_cache[A]
+    return entry["eigval"], entry["projectors"]
 
 
 #========================================================
@@ -91,103 +107,123 @@ Toffoli[6:8, 6:8] = np.array([[0, 1], [1, 0]])
 #  parametrized gates
 #========================================================
 
-def Rphi(phi):
+def Rphi(phi, xp=np):
     r"""One-qubit phase shift.
 
     Args:
         phi (float): phase shift angle
+        xp (module): array module building the matrix, ``numpy`` or ``autograd.numpy``
     Returns:
         array: unitary 2x2 phase shift matrix
     """
-    return np.array([[1, 0], [0, np.exp(1j*phi)]])
+    return xp.array([[1, 0], [0, xp.exp(1j*phi)]])
 
 
-def Rotx(theta):
+def Rotx(theta, xp=np):
     r"""One-qubit rotation about the x axis.
 
     Args:
         theta (float): rotation angle
+        xp (module): array module building the matrix, ``numpy`` or ``autograd.numpy``
     Returns:
         array: unitary 2x2 rotation matrix :math:`e^{-i \sigma_x \theta/2}`
     """
-    return np.cos(theta/2) * I + 1j * np.sin(-theta/2) * X
+    c = xp.cos(theta/2)
+    js = 1j * xp.sin(-theta/2)
+    return xp.array([[c, js], [js, c]])
 
 
-def Roty(theta):
+def Roty(theta, xp=np):
     r"""One-qubit rotation about the y axis.
 
     Args:
         theta (float): rotation angle
+        xp (module): array module building the matrix, ``numpy`` or ``autograd.numpy``
     Returns:
         array: unitary 2x2 rotation matrix :math:`e^{-i \sigma_y \theta/2}`
     """
-    return np.cos(theta/2) * I + 1j * np.sin(-theta/2) * Y
+    c = xp.cos(theta/2) + 0j
+    s = xp.sin(theta/2) + 0j
+    return xp.array([[c, -s], [s, c]])
 
 
-def Rotz(theta):
+def Rotz(theta, xp=np):
     r"""One-qubit rotation about the z axis.
 
     Args:
         theta (float): rotation angle
+        xp (module): array module building the matrix, ``numpy`` or ``autograd.numpy``
     Returns:
         array: unitary 2x2 rotation matrix :math:`e^{-i \sigma_z \theta/2}`
     """
-    return np.cos(theta/2) * I + 1j * np.sin(-theta/2) * Z
+    p = xp.exp(-0.5j*theta)
+    return xp.array([[p, 0], [0, xp.conj(p)]])
 
 
-def Rot3(a, b, c):
+def Rot3(a, b, c, xp=np):
     r"""Arbitrary one-qubit rotation using three Euler angles.
 
     Args:
         a,b,c (float): rotation angles
+        xp (module): array module building the matrix, ``numpy`` or ``autograd.numpy``
     Returns:
         array: unitary 2x2 rotation matrix ``rz(c) @ ry(b) @ rz(a)``
     """
-    return Rotz(c) @ (Roty(b) @ Rotz(a))
+    return xp.dot(Rotz(c, xp=xp), xp.dot(Roty(b, xp=xp), Rotz(a, xp=xp)))
 
 
-def CRotx(theta):
+def CRotx(theta, xp=np):
     r"""Two-qubit controlled rotation about the x axis.
 
     Args:
         theta (float): rotation angle
+        xp (module): array module building the matrix, ``numpy`` or ``autograd.numpy``
     Returns:
         array: unitary 4x4 rotation matrix :math:`|0\rangle\langle 0|\otimes \mathbb{I}+|1\rangle\langle 1|\otimes R_x(\theta)`
     """
-    return np.array([[1, 0, 0, 0], [0, 1, 0, 0], [0, 0, np.cos(theta/2), -1j*np.sin(theta/2)], [0, 0, -1j*np.sin(theta/2), np.cos(theta/2)]])
+    c = xp.cos(theta/2)
+    js = 1j * xp.sin(-theta/2)
+    return xp.array([[1, 0, 0, 0], [0, 1, 0, 0], [0, 0, c, js], [0, 0, js, c]])
 
 
-def CRoty(theta):
+def CRoty(theta, xp=np):
     r"""Two-qubit controlled rotation about the y axis.
 
     Args:
         theta (float): rotation angle
+        xp (module): array module building the matrix, ``numpy`` or ``autograd.numpy``
     Returns:
         array: unitary 4x4 rotation matrix :math:`|0\rangle\langle 0|\otimes \mathbb{I}+|1\rangle\langle 1|\otimes R_y(\theta)`
     """
-    return np.array([[1, 0, 0, 0], [0, 1, 0, 0], [0, 0, np.cos(theta/2), -np.sin(theta/2)], [0, 0, np.sin(theta/2), np.cos(theta/2)]])
+    c = xp.cos(theta/2)
+    s = xp.sin(theta/2)
+    return xp.array([[1, 0, 0, 0], [0, 1, 0, 0], [0, 0, c, -s], [0, 0, s, c]])
 
 
-def CRotz(theta):
+def CRotz(theta, xp=np):
     r"""Two-qubit controlled rotation about the z axis.
 
     Args:
         theta (float): rotation angle
+        xp (module): array module building the matrix, ``numpy`` or ``autograd.numpy``
     Returns:
         array: unitary 4x4 rotation matrix :math:`|0\rangle\langle 0|\otimes \mathbb{I}+|1\rangle\langle 1|\otimes R_z(\theta)`
     """
-    return np.array([[1, 0, 0, 0], [0, 1, 0, 0], [0, 0, np.exp(-1j*theta/2), 0], [0, 0, 0, np.exp(1j*theta/2)]])
+    p = xp.exp(-0.5j*theta)
+    return xp.array([[1, 0, 0, 0], [0, 1, 0, 0], [0, 0, p, 0], [0, 0, 0, xp.conj(p)]])
 
 
-def CRot3(a, b, c):
+def CRot3(a, b, c, xp=np):
     r"""Arbitrary two-qubit controlled rotation using three Euler angles.
 
     Args:
         a,b,c (float): rotation angles
+        xp (module): array module building the matrix, ``numpy`` or ``autograd.numpy``
     Returns:
         array: unitary 4x4 rotation matrix :math:`|0\rangle\langle 0|\otimes \mathbb{I}+|1\rangle\langle 1|\otimes R(a,b,c)`
     """
-    return np.array([[1, 0, 0, 0], [0, 1, 0, 0], [0, 0, np.exp(-1j*(a+c)/2)*np.cos(b/2), -np.exp(1j*(a-c)/2)*np.sin(b/2)], [0, 0, np.exp(-1j*(a-c)/2)*np.sin(b/2), np.exp(1j*(a+c)/2)*np.cos(b/2)]])
+    U = Rot3(a, b, c, xp=xp)
+    return xp.array([[1, 0, 0, 0], [0, 1, 0, 0], [0, 0, U[0, 0], U[0, 1]], [0, 0, U[1, 0], U[1, 1]]])
 
 
 
@@ -252,6 +288,24 @@ def identity(*_):
 #  device
 #========================================================
 
+CompiledOperation = namedtuple(
+    "CompiledOperation", ["matrix", "inverse", "wires", "axes", "perm", "kernel"]
+)
+"""Execution plan for the application of an operation to the state vector.
+
+Args:
+    matrix (array or callable or None): the operation matrix (or its diagonal, for diagonal
+        operations), or a function of the operation parameters returning the matrix; None for
+        operations that modify the state directly, and for permutations
+    inverse (bool): whether the conjugate transpose of the matrix returned by ``matrix`` is applied
+    wires (list[int]): subsystems the operation acts on
+    axes (tuple[array[int], list[int]]): axes to contract the matrix and the state tensors over
+    perm (array[int]): permutation restoring the order of the subsystems after the contraction
+    kernel (str or None): ``"diagonal"`` for operations applied using :meth:`DefaultQubit._apply_diagonal`,
+        ``"permutation"`` for operations applied using :meth:`DefaultQubit._apply_permutation`,
+        and None for operations applied using a tensor contraction
+"""
+
 
 class DefaultQubit(Device):
     """Default qubit device for PennyLane.
@@ -265,13 +319,47 @@ class DefaultQubit(Device):
             of samples returned by ``sample``.
         analytic (bool): indicates if the device should calculate expectations
             and variances analytically
+        inplace (bool): If True, the device allocates two state buffers when it is first reset,
+            and updates the state in place, or by writing into the other buffer, for the
+            rest of its lifetime. This caps the memory used by the simulation at about twice
+            the size of the state, at the cost of slower dense two-qubit gates.
+        dtype (type): Complex data type of the state vector and the gate matrices, either
+            ``np.complex128`` (default) or ``np.complex64``. Single precision halves the memory
+            and bandwidth required by the simulation, at the cost of results that are only
+            accurate to about :math:`10^{-7}`.
+        threads (int): Number of threads used to apply the operations to the state. If larger
+            than one, the state is partitioned into slices along subsystems an operation does
+            not act on, and the slices are transformed concurrently by a pool of threads.
+            Only states of at least :attr:`_min_threaded_size` amplitudes are partitioned.
+            The number of threads may also be set in the ``[default.qubit]`` section of
+            the configuration file.
+        memmap_dir (str or None): If given, the state is stored out of core, in a temporary
+            file in this directory that is memory-mapped using :class:`numpy.memmap`, rather
+            than in memory. The operations are applied to slices of at most
+            :attr:`_max_block_size` amplitudes at a time, read into memory, and the
+            probabilities, samples and expectation values are accumulated over the slices.
+            This allows the simulation of circuits whose state exceeds the available memory,
+            at the speed of the disk. Parameter broadcasting is disabled in this mode.
+
+    **Parameter broadcasting**
+
+    In analytic mode, circuits passed to :meth:`batch_execute` that share the same
+    structure (the same operations on the same wires, and the same measured observables)
+    but differ in their gate parameters are simulated together. The state carries a leading
+    batch dimension, and each gate is applied to all the states in the batch at once, using
+    a stack of gate matrices of shape ``(B, 2**k, 2**k)`` where the parameters differ.
     """
     name = 'Default qubit PennyLane plugin'
     short_name = 'default.qubit'
     pennylane_requires = '0.8'
     version = '0.8.0'
     author = 'Xanadu Inc.'
-    _capabilities = {"model": "qubit", "tensor_observables": True, "inverse_operations": True}
+    _capabilities = {
+        "model": "qubit",
+        "tensor_observables": True,
+        "inverse_operations": True,
+        "provides_adjoint_jacobian": True,
+    }
 
     # Note: BasisState and QubitStateVector don't
     # map to any particular function, as they modify
@@ -302,6 +390,22 @@ class DefaultQubit(Device):
         'CRot': CRot3
     }
 
+    _diagonal_operations = {'PauliZ', 'S', 'T', 'RZ', 'PhaseShift', 'CZ', 'CRZ'}
+    """set[str]: operations with a diagonal matrix, applied by multiplying
+    the amplitudes of the state with the diagonal of the matrix"""
+
+    _permutation_operations = {
+        'PauliX': (0, 'flip'),
+        'CNOT': (1, 'flip'),
+        'Toffoli': (2, 'flip'),
+        'SWAP': (0, 'swap'),
+        'CSWAP': (1, 'swap'),
+    }
+    """dict[str, tuple[int, str]]: self-inverse operations that permute the computational
+    basis states, applied by permuting the axes of the state tensor. Maps the operation
+    name to the number of control wires, and the action on the target wire(s): either
+    ``'flip'`` (bit flip) or ``'swap'`` (exchange of two wires)"""
+
     _observable_map = {
         'PauliX': X,
         'PauliY': Y,
@@ -311,21 +415,115 @@ class DefaultQubit(Device):
         'Identity': identity
     }
 
-    def __init__(self, wires, *, shots=1000, analytic=True):
+    _reshape = staticmethod(np.reshape)
+    _tensordot = staticmethod(np.tensordot)
+    _transpose = staticmethod(np.transpose)
+    _einsum = staticmethod(np.einsum)
+    _vdot = staticmethod(np.vdot)
+    _conj = staticmethod(np.conj)
+    _real = staticmethod(np.real)
+    _imag = staticmethod(np.imag)
+    _abs = staticmethod(np.abs)
+    _diag = staticmethod(np.diag)
+    _roll = staticmethod(np.roll)
+    _sum = staticmethod(np.sum)
+    _swapaxes = staticmethod(np.swapaxes)
+    _stack = staticmethod(np.stack)
+
+    _max_broadcast_size = 2 ** 24
+    """int: maximum number of amplitudes in the state of a broadcasted execution;
+    larger batches of circuits are split into several executions"""
+
+    _min_threaded_size = 2 ** 18
+    """int: minimum number of amplitudes of a state for the operations to be applied
+    by several threads; smaller states are not worth the overhead of the thread pool"""
+
+    _max_block_size = 2 ** 22
+    """int: maximum number of amplitudes of the slices of a state stored out of core,
+    which are read into memory to apply an operation"""
+
+    def __init__(
+        self,
+        wires,
+        *,
+        shots=1000,
+        analytic=True,
+        inplace=False,
+        dtype=np.complex128,
+        threads=1,
+        memmap_dir=None
+    ):
         super().__init__(wires, shots)
         self.eng = None
         self.analytic = analytic
+        self.inplace = inplace
+        self.memmap_dir = memmap_dir
+
+        if int(threads) < 1:
+            raise DeviceError("The number of threads must be at least one.")
+
+        self.threads = int(threads)
+        self._executor = None
+
+        if np.dtype(dtype) not in (np.complex64, np.complex128):
+            raise DeviceError(
+                "Data type {} not supported on device {}; must be one of "
+                "complex64 or complex128.".format(np.dtype(dtype).name, self.short_name)
+            )
+
+        self.dtype = np.dtype(dtype)
 
         self._state = None
+        self._scratch = None
         self._first_operation = True
 
+        self._basis_samples = None
+        """list[dict] or None: the groups of qubit-wise commuting observables measured
+        during the measurement phase of :meth:`execute`, each with its measurement bases,
+        basis rotations, and computational basis samples of all wires once drawn"""
+
+        self._prob_cache = None
+        """tuple[array, array[float]] or None: the state, and the probabilities of the
+        computational basis states computed from it; see :meth:`_basis_probability`"""
+
+        self._operator_map = {
+            k: self._cast(v) if v is not None and not callable(v) else v
+            for k, v in {**self._operation_map, **self._observable_map}.items()
+        }
+
+    def __getstate__(self):
+        # the thread pool cannot be copied or pickled; copies of the device create their own
+        state = self.__dict__.copy()
+        state["_executor"] = None
+        return state
+
     def pre_apply(self):
         self.reset()
 
+    def _cast(self, A):
+        """Cast a gate or observable matrix to the data type of the device.
+
+        Matrices are only cast in single precision, so that the matrices used
+        in double precision are passed on unchanged.
+
+        Args:
+            A (array): matrix
+
+        Returns:
+            array: the matrix, of data type :attr:`dtype`
+        """
+        if self.dtype == np.complex128:
+            return A
+
+        return np.asarray(A, dtype=self.dtype)
+
     def apply(self, operation, wires, par):
         # number of wires on device
         n = self.num_wires
 
+        # the cached probabilities are invalidated, as the state may be updated in place
+        self._prob_cache = None
+
         if operation == 'QubitStateVector':
             input_state = np.asarray(par[0], dtype=np.complex128)
 
@@ -346,7 +544,7 @@ class DefaultQubit(Device):
 
                 # get indices for which the state is changed to input state vector elements
                 nums = np.ravel_multi_index(unravelled_nums.T, [2] * n)
-                self._state = np.zeros_like(self._state)
+                self._state = self._zero_state()
                 self._state[nums] = input_state
             else:
                 raise ValueError("State vector must be of length 2**wires.")
@@ -368,33 +566,537 @@ class DefaultQubit(Device):
             # get computational basis state number
             num = int(np.dot(par[0], 2**(n - 1 - np.array(wires))))
 
-            self._state = np.zeros_like(self._state)
+            self._state = self._zero_state()
             self._state[num] = 1.
             self._first_operation = False
             return
 
+        if operation.endswith(Operation.string_for_inverse):
+            base_name = operation[:-len(Operation.string_for_inverse)]
+        else:
+            base_name = operation
+
+        if base_name in self._permutation_operations:
+            # permutations of the basis states are their own inverse
+            self._state = self._apply_permutation(base_name, wires)
+            self._first_operation = False
+            return
+
         A = self._get_operator_matrix(operation, par)
 
-        self._state = self.mat_vec_product(A, self._state, wires)
+        if base_name in self._diagonal_operations and np.ndim(A) == 2:
+            self._state = self._apply_diagonal(self._diag(A), wires)
+        elif self._sliced_state(wires) and np.ndim(A) == 2:
+            self._state = self._sliced_mat_vec_product(A, wires)
+        elif self._inplace_state() and np.ndim(A) == 2:
+            self._state = self._inplace_mat_vec_product(A, wires)
+        else:
+            self._state = self.mat_vec_product(A, self._state, wires)
+
         self._first_operation = False
 
+    def _zero_state(self):
+        """Returns an all-zero array of the shape of the state, reusing the state buffer
+        when the state is updated in place or stored out of core."""
+        if self._inplace_state() or self._out_of_core():
+            self._state.fill(0)
+            return self._state
+
+        return np.zeros_like(self._state)
+
+    def _inplace_state(self):
+        """Whether the state is updated in place, using the state buffers of the device.
+
+        Returns:
+            bool: True if the device was created with ``inplace=True``, and the
+            state is not batched
+        """
+        return self.inplace and np.shape(self._state) == np.shape(self._scratch)
+
+    @staticmethod
+    def _subsystem_index(wires, bits):
+        """Index selecting the slice of the state tensor in which the given subsystems
+        are in the given computational basis state.
+
+        Args:
+            wires (Sequence[int]): subsystems
+            bits (Sequence[int]): computational basis state of the subsystems
+
+        Returns:
+            tuple: index into the state tensor
+        """
+        index = [slice(None)] * (max(wires) + 1)
+        for w, b in zip(wires, bits):
+            index[w] = b
+        # the trailing ellipsis ensures a view is returned even if every subsystem is indexed
+        return tuple(index) + (Ellipsis,)
+
+    def _inplace_mat_vec_product(self, mat, wires):
+        r"""Apply multiplication of a matrix to subsystems of the quantum state,
+        writing the result into the scratch buffer.
+
+        Each slice of the output, with the target subsystems in a given basis state, is
+        accumulated from the slices of the input state. Intermediate products are stored in
+        an output slice that is still to be computed, or, for the last output slice, in an input
+        slice that is no longer required, so that no temporary arrays are allocated.
+
+        Args:
+            mat (array): matrix to multiply, of shape ``(2**k, 2**k)``
+            wires (Sequence[int]): target subsystems
+
+        Returns:
+            array: the buffer holding the output vector; the buffers are swapped so that
+            the previous state becomes the scratch buffer
+        """
+        shape = [2] * self.num_wires
+        state = self._state.reshape(shape)
+        out = self._scratch.reshape(shape)
+
+        slices = [
+            self._subsystem_index(wires, bits)
+            for bits in itertools.product([0, 1], repeat=len(wires))
+        ]
+        last = len(slices) - 1
+
+        for i, o in enumerate(slices):
+            tmp = out[slices[last]] if i < last else state[slices[0]]
+            np.multiply(state[slices[0]], mat[i, 0], out=out[o])
+
+            for j in range(1, len(slices)):
+                if mat[i, j] != 0:
+                    np.multiply(state[slices[j]], mat[i, j], out=tmp)
+                    np.add(out[o], tmp, out=out[o])
+
+        out, self._scratch = self._scratch, self._state
+        return out
+
+    def _inplace_diagonal(self, phases, wires):
+        """Multiply the slices of the state by the diagonal of an operation, in place.
+
+        Args:
+            phases (array): diagonal of the operation matrix, of shape ``(2**k,)``
+            wires (Sequence[int]): target subsystems
+
+        Returns:
+            array: the state buffer
+        """
+        state = self._state.reshape([2] * self.num_wires)
+
+        for bits, phase in zip(itertools.product([0, 1], repeat=len(wires)), phases):
+            if phase != 1:
+                view = state[self._subsystem_index(wires, bits)]
+                np.multiply(view, phase, out=view)
+
+        return self._state
+
+    def _inplace_permutation(self, operation, wires):
+        """Apply an operation permuting the computational basis states in place, by
+        exchanging the two slices of the state the operation swaps.
+
+        Args:
+            operation (str): name of the operation, a key of :attr:`_permutation_operations`
+            wires (Sequence[int]): subsystems the operation acts on, control wires first
+
+        Returns:
+            array: the state buffer
+        """
+        num_controls, action = self._permutation_operations[operation]
+        controls = (1,) * num_controls
+        bits = [(0,), (1,)] if action == 'flip' else [(0, 1), (1, 0)]
+
+        state = self._state.reshape([2] * self.num_wires)
+        a = state[self._subsystem_index(wires, controls + bits[0])]
+        b = state[self._subsystem_index(wires, controls + bits[1])]
+        tmp = self._scratch[:a.size].reshape(a.shape)
+
+        np.copyto(tmp, a)
+        np.copyto(a, b)
+        np.copyto(b, tmp)
+        return self._state
+
+    def _apply_diagonal(self, phases, wires):
+        r"""Apply a diagonal operation to subsystems of the quantum state.
+
+        Rather than contracting the state with the full matrix, the state tensor is
+        multiplied elementwise by the diagonal of the matrix, broadcasted over the
+        subsystems the operation does not act on.
+
+        Args:
+            phases (array): diagonal of the operation matrix, of shape ``(2**k,)``
+            wires (Sequence[int]): target subsystems
+
+        Returns:
+            array: output vector after applying the operation, of the same shape as the state
+        """
+        if self._sliced_state(wires):
+            return self._sliced_diagonal(phases, wires)
+
+        if self._inplace_state():
+            return self._inplace_diagonal(phases, wires)
+
+        wires = list(wires)
+        shape = np.shape(self._state)
+
+        # order the axes of the diagonal by subsystem, and insert
+        # singleton axes for the remaining subsystems of the state
+        phases = self._reshape(phases, [2] * len(wires))
+        phases = self._transpose(phases, np.argsort(wires))
+        phases = self._reshape(phases, [2 if w in wires else 1 for w in range(self.num_wires)])
+
+        state = self._reshape(self._state, shape[:-1] + (2,) * self.num_wires)
+        return self._reshape(state * phases, shape)
+
+    def _apply_permutation(self, operation, wires):
+        r"""Apply an operation permuting the computational basis states to subsystems of the
+        quantum state.
+
+        The control wires select the slices of the state tensor the operation acts on, and bit
+        flips and swaps of the target wires are applied by rolling and swapping the axes of these
+        slices. Negative axes are used throughout, so that the state may carry leading batch
+        dimensions.
+
+        Args:
+            operation (str): name of the operation, a key of :attr:`_permutation_operations`
+            wires (Sequence[int]): subsystems the operation acts on, control wires first
+
+        Returns:
+            array: output vector after applying the operation, of the same shape as the state
+        """
+        if self._sliced_state(wires):
+            return self._sliced_permutation(operation, wires)
+
+        if self._inplace_state():
+            return self._inplace_permutation(operation, wires)
+
+        num_controls, action = self._permutation_operations[operation]
+        shape = np.shape(self._state)
+        state = self._reshape(self._state, shape[:-1] + (2,) * self.num_wires)
+
+        axes = [w - self.num_wires for w in wires]
+        state = self._controlled_permutation(state, axes[:num_controls], axes[num_controls:], action)
+        return self._reshape(state, shape)
+
+    def _controlled_permutation(self, state, controls, targets, action):
+        """Recursively apply a controlled bit flip or swap to a state tensor.
+
+        Args:
+            state (array): state tensor
+            controls (list[int]): negative axes of the control subsystems
+            targets (list[int]): negative axes of the target subsystems
+            action (str): ``'flip'`` or ``'swap'``
+
+        Returns:
+            array: the transformed state tensor
+        """
+        if not controls:
+            if action == 'flip':
+                return self._roll(state, 1, axis=targets[0])
+            return self._swapaxes(state, targets[0], targets[1])
+
+        c = controls[0]
+
+        # removing the control axis shifts the negative indices of the axes to its left
+        def shift(axes):
+            return [a + 1 if a < c else a for a in axes]
+
+        index = (Ellipsis, 1) + (slice(None),) * (-c - 1)
+        inactive = state[(Ellipsis, 0) + (slice(None),) * (-c - 1)]
+        active = self._controlled_permutation(state[index], shift(controls[1:]), shift(targets), action)
+        return self._stack([inactive, active], axis=c)
+
+    def _out_of_core(self):
+        """Whether the state is stored in a memory-mapped file.
+
+        Returns:
+            bool: True if the device was created with a ``memmap_dir``, and the
+            state is not batched
+        """
+        return self.memmap_dir is not None and isinstance(self._state, np.memmap)
+
+    def _sliced_state(self, wires):
+        """Whether an operation is applied to the state slice by slice, see :meth:`_apply_sliced`.
+
+        Args:
+            wires (Sequence[int]): subsystems the operation acts on
+
+        Returns:
+            bool: True if the state is stored out of core, or if the device was created with
+            more than one thread, the state is not batched and has at least
+            :attr:`_min_threaded_size` amplitudes, and the operation leaves at least one
+            subsystem untouched
+        """
+        if self._out_of_core():
+            return True
+
+        return (
+            self.threads > 1
+            and np.ndim(self._state) == 1
+            and np.size(self._state) >= self._min_threaded_size
+            and len(set(wires)) < self.num_wires
+        )
+
+    def _apply_sliced(self, kernel, wires, out=None, elementwise=False):
+        """Apply a kernel to independent slices of the state.
+
+        The state tensor is partitioned along the first subsystems the operation does not act
+        on, into at least as many slices as there are threads where possible, and into slices
+        of at most :attr:`_max_block_size` amplitudes if the state is stored out of core. Each
+        slice is transformed by the kernel, which writes the result into the same slice of the
+        output buffer. With several threads, the slices are processed by a thread pool;
+        NumPy releases the GIL during the array operations, so that they run concurrently.
+
+        Args:
+            kernel (callable): function ``kernel(state, wires, out)`` applying the operation
+                to the slice ``state`` of the state tensor, where ``wires`` are the axes of
+                the slice the operation acts on, and writing the result into ``out``
+            wires (Sequence[int]): subsystems the operation acts on
+            out (array or None): output buffer, of the shape of the state; may be the state
+                itself. If None, the kernel is passed None, and only its return values are used.
+            elementwise (bool): whether the kernel only combines the elements of the state and
+                the output at the same position. Otherwise, slices of a state stored out of core
+                are read into memory before they are passed to the kernel.
+
+        Returns:
+            list: the values returned by the kernel for each slice
+        """
+        free = [w for w in range(self.num_wires) if w not in wires]
+        num_split = 0
+
+        if self.threads > 1:
+            num_split = int(np.ceil(np.log2(self.threads)))
+
+        if self._out_of_core():
+            block_wires = int(np.log2(self._max_block_size))
+            num_split = max(num_split, self.num_wires - block_wires)
+
+        split = free[:num_split]
+
+        # axes of the slices the operation acts on
+        local_wires = [w - sum(1 for a in split if a < w) for w in wires]
+
+        shape = [2] * self.num_wires
+        state = self._state.reshape(shape)
+        out_tensor = None if out is None else out.reshape(shape)
+        copy_slices = self._out_of_core() and not elementwise
+
+        def apply_slice(bits):
+            index = self._subsystem_index(split, bits) if split else (Ellipsis,)
+            state_slice = np.array(state[index]) if copy_slices else state[index]
+            out_slice = None if out_tensor is None else out_tensor[index]
+            return kernel(state_slice, local_wires, out_slice)
+
+        slices = itertools.product([0, 1], repeat=len(split))
+
+        if self.threads == 1 or not split:
+            return [apply_slice(bits) for bits in slices]
+
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(max_workers=self.threads)
+
+        # consume the results, so that exceptions raised in the threads are propagated
+        return list(self._executor.map(apply_slice, slices))
+
+    def _sliced_output(self):
+        """Output buffer of an operation applied slice by slice.
+
+        Returns:
+            array: the state buffer itself if the state is stored out of core, since the slices
+            are then read into memory before they are transformed; the scratch buffer, which
+            is swapped with the state buffer, if the state is updated in place; otherwise a
+            new array of the shape of the state
+        """
+        if self._out_of_core():
+            return self._state
+
+        if not self._inplace_state():
+            return np.empty_like(self._state)
+
+        out, self._scratch = self._scratch, self._state
+        return out
+
+    @staticmethod
+    def _slice_mat_vec_product(mat, state, wires):
+        """Apply a matrix to axes of a slice of the state tensor.
+
+        Args:
+            mat (array): matrix to multiply, reshaped to a tensor of shape ``[2] * 2k``
+            state (array): slice of the state tensor
+            wires (list[int]): axes of the slice the matrix acts on
+
+        Returns:
+            array: the transformed slice
+        """
+        num_wires = len(wires)
+        tdot = np.tensordot(mat, state, axes=(np.arange(num_wires, 2 * num_wires), wires))
+        unused_idxs = [idx for idx in range(state.ndim) if idx not in wires]
+        return np.transpose(tdot, np.argsort(wires + unused_idxs))
+
+    def _sliced_mat_vec_product(self, mat, wires):
+        """Apply multiplication of a matrix to subsystems of the quantum state,
+        processing slices of the state independently.
+
+        Args:
+            mat (array): matrix to multiply, of shape ``(2**k, 2**k)``
+            wires (Sequence[int]): target subsystems
+
+        Returns:
+            array: output vector after applying the matrix
+        """
+        mat = np.reshape(mat, [2] * len(wires) * 2)
+
+        def kernel(state, local_wires, out):
+            np.copyto(out, self._slice_mat_vec_product(mat, state, local_wires))
+
+        out = self._sliced_output()
+        self._apply_sliced(kernel, list(wires), out)
+        return out
+
+    def _sliced_diagonal(self, phases, wires):
+        """Multiply the state by the diagonal of an operation, processing slices of
+        the state independently.
+
+        Args:
+            phases (array): diagonal of the operation matrix, of shape ``(2**k,)``
+            wires (Sequence[int]): target subsystems
+
+        Returns:
+            array: output vector after applying the operation; the state buffer itself
+            when the state is updated in place or stored out of core
+        """
+        wires = list(wires)
+        phases = np.transpose(np.reshape(phases, [2] * len(wires)), np.argsort(wires))
+
+        def kernel(state, local_wires, out):
+            shape = [2 if a in local_wires else 1 for a in range(state.ndim)]
+            np.multiply(state, np.reshape(phases, shape), out=out)
+
+        if self._inplace_state() or self._out_of_core():
+            out = self._state
+        else:
+            out = np.empty_like(self._state)
+
+        self._apply_sliced(kernel, wires, out, elementwise=True)
+        return out
+
+    def _sliced_permutation(self, operation, wires):
+        """Apply an operation permuting the computational basis states, processing slices
+        of the state independently.
+
+        Args:
+            operation (str): name of the operation, a key of :attr:`_permutation_operations`
+            wires (Sequence[int]): subsystems the operation acts on, control wires first
+
+        Returns:
+            array: output vector after applying the operation
+        """
+        num_controls, action = self._permutation_operations[operation]
+
+        def kernel(state, local_wires, out):
+            axes = [w - state.ndim for w in local_wires]
+            state = self._controlled_permutation(
+                state, axes[:num_controls], axes[num_controls:], action
+            )
+            np.copyto(out, state)
+
+        out = self._sliced_output()
+        self._apply_sliced(kernel, list(wires), out)
+        return out
+
+    def _sliced_ev(self, A, wires):
+        r"""Expectation value of an observable, accumulated over slices of the state.
+
+        Args:
+            A (array): the observable matrix
+            wires (Sequence[int]): target subsystems
+
+        Returns:
+            complex: expectation value :math:`\bra{\psi}A\ket{\psi}`
+        """
+        mat = np.reshape(A, [2] * len(wires) * 2)
+
+        def kernel(state, local_wires, _):
+            return np.vdot(state, self._slice_mat_vec_product(mat, state, local_wires))
+
+        return np.sum(self._apply_sliced(kernel, list(wires)))
+
+    def _sliced_probability(self, wires, rotations=()):
+        """Marginal probabilities of a subset of the subsystems, accumulated over slices
+        of a state stored out of core.
+
+        Only one slice of the state is held in memory at a time.
+
+        Args:
+            wires (Sequence[int]): subsystems to return the marginal probabilities for;
+                the remaining subsystems are traced out
+            rotations (Sequence[tuple[array, list[int]]]): unitaries rotating the state into a
+                measurement basis, and the subsystems they act on, applied to each slice
+
+        Returns:
+            array[float]: marginal probabilities, with the basis states in lexicographical
+            order of the subsystems in the order given by ``wires``
+        """
+        wires = list(wires)
+        sorted_wires = sorted(wires)
+
+        # the slices contain all the subsystems the rotations act on
+        rotated = {w for _, rot_wires in rotations for w in rot_wires}
+        free = [w for w in range(self.num_wires) if w not in rotated]
+        split = free[: max(0, self.num_wires - int(np.log2(self._max_block_size)))]
+        remaining = [w for w in range(self.num_wires) if w not in split]
+        inactive = tuple(i for i, w in enumerate(remaining) if w not in wires)
+
+        state = self._state.reshape([2] * self.num_wires)
+        prob = np.zeros([2] * len(wires))
+
+        for bits in itertools.product([0, 1], repeat=len(split)):
+            index = self._subsystem_index(split, bits) if split else (Ellipsis,)
+            state_slice = np.array(state[index])
+
+            for U, rot_wires in rotations:
+                U = np.reshape(U, [2] * len(rot_wires) * 2)
+                local_wires = [remaining.index(w) for w in rot_wires]
+                state_slice = self._slice_mat_vec_product(U, state_slice, local_wires)
+
+            # the split subsystems that are not traced out select a slice of the probabilities
+            prob_index = tuple(
+                bits[split.index(w)] if w in split else slice(None) for w in sorted_wires
+            )
+            prob[prob_index] += np.sum(np.abs(state_slice) ** 2, axis=inactive)
+
+        return np.transpose(prob, np.argsort(np.argsort(wires))).ravel()
+
     def mat_vec_product(self, mat, vec, wires):
         r"""Apply multiplication of a matrix to subsystems of the quantum state.
 
+        Both the matrix and the state vector may carry a leading batch dimension,
+        in which case the output is batched as well.
+
         Args:
-            mat (array): matrix to multiply
-            vec (array): state vector to multiply
+            mat (array): matrix to multiply, of shape ``(2**k, 2**k)`` or ``(B, 2**k, 2**k)``
+            vec (array): state vector to multiply, of shape ``(2**n,)`` or ``(B, 2**n)``
             wires (Sequence[int]): target subsystems
 
         Returns:
             array: output vector after applying ``mat`` to input ``vec`` on specified subsystems
         """
+        if np.ndim(mat) == 3 or np.ndim(vec) == 2:
+            return self._batched_mat_vec_product(mat, vec, wires)
 
-        # TODO: use multi-index vectors/matrices to represent states/gates internally
-        mat = np.reshape(mat, [2] * len(wires) * 2)
-        vec = np.reshape(vec, [2] * self.num_wires)
+        axes, inv_perm = self._contraction_indices(wires)
+        return self._tensordot_product(mat, vec, len(wires), axes, inv_perm)
+
+    def _contraction_indices(self, wires):
+        """Indices required to apply a matrix to subsystems of the state using a tensor contraction.
+
+        Args:
+            wires (Sequence[int]): target subsystems
+
+        Returns:
+            tuple[tuple[array[int], list[int]], array[int]]: the axes to contract the matrix
+            and the state tensors over, and the permutation to apply to the resulting tensor
+        """
+        wires = list(wires)
         axes = (np.arange(len(wires), 2 * len(wires)), wires)
-        tdot = np.tensordot(mat, vec, axes=axes)
 
         # tensordot causes the axes given in `wires` to end up in the first positions
         # of the resulting tensor. This corresponds to a (partial) transpose of
@@ -403,8 +1105,278 @@ class DefaultQubit(Device):
         unused_idxs = [idx for idx in range(self.num_wires) if idx not in wires]
         perm = wires + unused_idxs
         inv_perm = np.argsort(perm) # argsort gives inverse permutation
-        state_multi_index = np.transpose(tdot, inv_perm)
-        return np.reshape(state_multi_index, 2 ** self.num_wires)
+        return axes, inv_perm
+
+    def _tensordot_product(self, mat, vec, num_wires, axes, inv_perm):
+        """Apply multiplication of a matrix to subsystems of the quantum state,
+        using precomputed contraction indices.
+
+        Args:
+            mat (array): matrix to multiply
+            vec (array): state vector to multiply
+            num_wires (int): number of subsystems the matrix acts on
+            axes (tuple[array[int], list[int]]): axes to contract the matrix and the state tensors over
+            inv_perm (array[int]): permutation to apply to the contracted tensor
+
+        Returns:
+            array: output vector after applying ``mat`` to input ``vec``
+        """
+        # TODO: use multi-index vectors/matrices to represent states/gates internally
+        mat = self._reshape(mat, [2] * num_wires * 2)
+        vec = self._reshape(vec, [2] * self.num_wires)
+        tdot = self._tensordot(mat, vec, axes=axes)
+        state_multi_index = self._transpose(tdot, inv_perm)
+        return self._reshape(state_multi_index, 2 ** self.num_wires)
+
+    def compile(self, queue, observables):
+        self.check_validity(queue, observables)
+
+        plan = []
+
+        for op in queue:
+            wires = list(op.wires)
+
+            if op.name in ("BasisState", "QubitStateVector"):
+                plan.append(CompiledOperation(None, False, wires, None, None, None))
+                continue
+
+            if op.base_name in self._permutation_operations:
+                plan.append(CompiledOperation(None, False, wires, None, None, "permutation"))
+                continue
+
+            inverse = op.inverse
+            A = self._operator_map[op.base_name if inverse else op.name]
+
+            if not callable(A) and inverse:
+                A = A.conj().T
+                inverse = False
+
+            if op.base_name in self._diagonal_operations:
+                if not callable(A):
+                    A = np.diag(A)
+                plan.append(CompiledOperation(A, inverse, wires, None, None, "diagonal"))
+                continue
+
+            axes, inv_perm = self._contraction_indices(wires)
+            plan.append(CompiledOperation(A, inverse, wires, axes, inv_perm, None))
+
+        return plan
+
+    def apply_compiled(self, plan, queue):
+        self._prob_cache = None
+
+        for step, op in zip(plan, queue):
+            if step.kernel == "permutation":
+                self._state = self._apply_permutation(op.base_name, step.wires)
+                self._first_operation = False
+                continue
+
+            if step.matrix is None:
+                # operations that modify the state directly
+                self.apply(op.name, op.wires, op.parameters)
+                continue
+
+            self._first_operation = False
+
+            A = step.matrix
+
+            if callable(A):
+                A = self._cast(A(*op.parameters))
+
+                if step.inverse:
+                    A = self._conj(A).T
+
+                if step.kernel == "diagonal":
+                    A = self._diag(A)
+
+            if step.kernel == "diagonal":
+                self._state = self._apply_diagonal(A, step.wires)
+                continue
+
+            if self._sliced_state(step.wires):
+                self._state = self._sliced_mat_vec_product(A, step.wires)
+                continue
+
+            if self._inplace_state():
+                self._state = self._inplace_mat_vec_product(A, step.wires)
+                continue
+
+            self._state = self._tensordot_product(
+                A, self._state, len(step.wires), step.axes, step.perm
+            )
+
+    def _batched_mat_vec_product(self, mat, vec, wires):
+        r"""Apply multiplication of a (batch of) matrices to subsystems of a (batch of) states.
+
+        Args:
+            mat (array): matrix of shape ``(2**k, 2**k)``, or batch of matrices of shape ``(B, 2**k, 2**k)``
+            vec (array): state vector of shape ``(2**n,)``, or batch of states of shape ``(B, 2**n)``
+            wires (Sequence[int]): target subsystems
+
+        Returns:
+            array: batch of output vectors, of shape ``(B, 2**n)``
+        """
+        num_wires = len(wires)
+
+        # only the trailing dimensions are contracted, the
+        # batch dimension is broadcasted by the ellipsis
+        mat = self._reshape(mat, np.shape(mat)[:-2] + (2,) * num_wires * 2)
+        vec = self._reshape(vec, np.shape(vec)[:-1] + (2,) * self.num_wires)
+
+        state_indices = ABC[: self.num_wires]
+        affected_indices = "".join(state_indices[w] for w in wires)
+        new_indices = ABC[self.num_wires : self.num_wires + num_wires]
+
+        new_state_indices = state_indices
+        for old, new in zip(affected_indices, new_indices):
+            new_state_indices = new_state_indices.replace(old, new)
+
+        einsum_indices = "...{new}{old},...{state}->...{new_state}".format(
+            new=new_indices, old=affected_indices, state=state_indices, new_state=new_state_indices
+        )
+        res = self._einsum(einsum_indices, mat, vec)
+        return self._reshape(res, np.shape(res)[: np.ndim(res) - self.num_wires] + (2 ** self.num_wires,))
+
+    def batch_execute(self, circuits):
+        if not self.analytic or self.memmap_dir is not None:
+            return super().batch_execute(circuits)
+
+        # group the circuits by their structure, so that
+        # each group can be simulated using a single batched state
+        groups = OrderedDict()
+        for idx, (queue, observables) in enumerate(circuits):
+            groups.setdefault(self._circuit_structure(queue, observables), []).append(idx)
+
+        # split the groups so that a single batched state does not exceed the maximum size
+        max_batch = max(1, self._max_broadcast_size // 2 ** self.num_wires)
+
+        results = [None] * len(circuits)
+        for key, indices in groups.items():
+            for start in range(0, len(indices), max_batch):
+                batch = indices[start : start + max_batch]
+
+                if key is None or len(batch) == 1:
+                    # the circuits cannot be broadcasted
+                    for idx in batch:
+                        self.reset()
+                        results[idx] = self.execute(*circuits[idx])
+                    continue
+
+                res = self._execute_broadcast([circuits[idx] for idx in batch])
+                for idx, r in zip(batch, res):
+                    results[idx] = r
+
+        return results
+
+    @staticmethod
+    def _circuit_structure(queue, observables):
+        """Hashable description of the structure of a circuit.
+
+        Circuits with the same structure differ only in their gate parameters,
+        and can be simulated together using parameter broadcasting.
+
+        Args:
+            queue (Iterable[~.operation.Operation]): operations of the circuit
+            observables (Iterable[~.operation.Observable]): observables of the circuit
+
+        Returns:
+            tuple or None: the structure of the circuit, or None if it cannot be broadcasted
+        """
+        if any(ob.return_type not in (Expectation, Variance, Probability) for ob in observables):
+            return None
+
+        # state preparations and observables must be identical throughout the batch
+        return _circuit_structure(queue, observables, fixed_params=True)
+
+    def _execute_broadcast(self, circuits):
+        """Simulate several circuits of the same structure using a batched state.
+
+        The execution hooks :meth:`pre_apply`, :meth:`post_apply`, :meth:`pre_measure`
+        and :meth:`post_measure` are called once for the whole batch, with
+        :attr:`op_queue` and :attr:`obs_queue` set to the operations and observables of
+        the first circuit. Between :meth:`post_apply` and :meth:`post_measure`, the
+        state :attr:`_state` has a leading batch dimension, and the shape
+        ``(B, 2**wires)``. Subclasses that rely on the hooks or on the shape of the state
+        should overwrite :meth:`batch_execute` if they cannot handle a batched state.
+
+        Args:
+            circuits (Sequence[tuple[list[~.operation.Operation], list[~.operation.Observable]]]):
+                circuits to execute, all with the same structure
+
+        Returns:
+            list[array[float]]: measured value(s) for each circuit
+        """
+        queue, observables = circuits[0]
+        self.check_validity(queue, observables)
+        batch_size = len(circuits)
+        res = []
+
+        self._op_queue = queue
+        self._obs_queue = observables
+        self._parameters = {}
+
+        with self.execution_context():
+            self.pre_apply()
+
+            for ops in zip(*[q for q, _ in circuits]):
+                op = ops[0]
+
+                if op.name in ("BasisState", "QubitStateVector") or not op.num_params:
+                    # identical throughout the batch
+                    self.apply(op.name, op.wires, op.parameters)
+                    continue
+
+                mats = [self._get_operator_matrix(op.name, o.parameters) for o in ops]
+
+                if all(np.array_equal(mats[0], A) for A in mats[1:]):
+                    # the batch of states can share the same gate matrix
+                    A = mats[0]
+                else:
+                    A = np.stack(mats)
+
+                self._state = self.mat_vec_product(A, self._state, list(op.wires))
+                self._first_operation = False
+
+            if self._state.ndim == 1:
+                # all the circuits in the batch are identical
+                self._state = np.broadcast_to(self._state, (batch_size, self._state.shape[0]))
+
+            self.post_apply()
+            self.pre_measure()
+
+            for obs in observables:
+                if obs.return_type is Expectation:
+                    res.append(self.expval(obs.name, obs.wires, obs.parameters))
+                elif obs.return_type is Variance:
+                    res.append(self.var(obs.name, obs.wires, obs.parameters))
+                elif obs.return_type is Probability:
+                    res.append(self._batched_probability(obs.wires))
+
+            self.post_measure()
+
+        self._op_queue = None
+        self._obs_queue = None
+        self._parameters = None
+
+        return [self._asarray([r[b] for r in res]) for b in range(batch_size)]
+
+    def _batched_probability(self, wires):
+        """Marginal probabilities of each computational basis state for a batched state.
+
+        Args:
+            wires (Sequence[int]): Sequence of wires to return marginal probabilities for.
+                Wires not provided are traced out of the system.
+
+        Returns:
+            array[float]: array of shape ``(B, 2**len(wires))`` containing the probabilities,
+            with the basis states in lexicographical order
+        """
+        prob = np.abs(self._state.reshape((-1,) + (2,) * self.num_wires)) ** 2
+        wires = np.hstack(wires)
+
+        inactive_wires = [w + 1 for w in range(self.num_wires) if w not in wires]
+        prob = np.apply_over_axes(np.sum, prob, inactive_wires)
+        return prob.reshape(prob.shape[0], -1)
 
     def get_operator_matrix_for_measurement(self, observable, par):
         """Get the operator matrix for a given observable before measurement.
@@ -421,7 +1393,10 @@ class DefaultQubit(Device):
         return self._get_operator_matrix(observable, par)
 
     def expval(self, observable, wires, par):
-        if self.analytic:
+        if self.analytic and self._is_pauli_word(observable) and not self._out_of_core():
+            # exact expectation value, without constructing the operator matrix
+            ev = self.pauli_word_ev(observable, wires)
+        elif self.analytic:
             # exact expectation value
             A = self.get_operator_matrix_for_measurement(observable, par)
 
@@ -433,7 +1408,10 @@ class DefaultQubit(Device):
         return ev
 
     def var(self, observable, wires, par):
-        if self.analytic:
+        if self.analytic and self._is_pauli_word(observable) and not self._out_of_core():
+            # Pauli words square to the identity
+            var = 1 - self.pauli_word_ev(observable, wires) ** 2
+        elif self.analytic:
             # exact variance value
             A = self.get_operator_matrix_for_measurement(observable, par)
 
@@ -445,15 +1423,194 @@ class DefaultQubit(Device):
         return var
 
     def sample(self, observable, wires, par):
-        A = self.get_operator_matrix_for_measurement(observable, par)
+        """Draw samples of an observable.
+
+        The state is rotated into the eigenbasis of the observable, one factor of a tensor
+        product observable at a time, and the samples are drawn from the marginal probabilities
+        of the computational basis states of the observable wires in the rotated state.
+
+        During the measurement phase of :meth:`execute`, the observables are partitioned into
+        groups of qubit-wise commuting observables. The computational basis states of all wires
+        are sampled once per group, after rotating the state into the shared eigenbasis of the
+        group, and the resulting samples are shared by all observables in the group.
+
+        Args:
+            observable (str or list[str]): name of the observable(s)
+            wires (list[int] or list[list[int]]): subsystems the observable(s) act on
+            par (list[Any] or list[list[Any]]): parameters of the observable(s)
+
+        Returns:
+            array[float]: samples of the eigenvalues of the observable
+        """
+        if isinstance(observable, list):
+            factors = zip(observable, wires, par)
+        else:
+            factors = [(observable, wires, par)]
+
+        eigvals = np.ones(1)
+        rotations = []
+        flat_wires = []
+
+        for name, w, p in factors:
+            w = list(np.hstack(w))
+            a, U = self._measurement_basis(self._get_operator_matrix(name, p))
+
+            eigvals = np.kron(eigvals, a)
+            flat_wires.extend(w)
+
+            if U is not None:
+                rotations.append((U, w))
+
+        if self._out_of_core():
+            # stream the marginal probabilities of the observable wires from the state file
+            prob = np.clip(self._sliced_probability(flat_wires, rotations), 0, None)
+            return np.random.choice(eigvals, self.shots, p=prob / np.sum(prob))
+
+        if self._basis_samples is None:
+            # draw the eigenvalues directly from their probabilities
+            prob = self._marginal_basis_probability(self._rotated_probability(rotations), flat_wires)
+            return np.random.choice(eigvals, self.shots, p=prob)
+
+        bases = _measurement_bases(observable, wires, par)
+        group = next(
+            (
+                g
+                for g in self._basis_samples
+                if all(g["bases"].get(w) == label for w, label in bases.items())
+            ),
+            None,
+        )
+
+        if group is None:
+            # the observable is not in the observable queue
+            group = {"bases": bases, "rotations": rotations, "samples": None}
+            self._basis_samples.append(group)
+
+        if group["samples"] is None:
+            # sample the computational basis states of all wires in the rotated state
+            prob = self._marginal_basis_probability(
+                self._rotated_probability(group["rotations"]), list(range(self.num_wires))
+            )
+            indices = np.random.choice(len(prob), self.shots, p=prob)
+            shifts = np.arange(self.num_wires - 1, -1, -1)
+            group["samples"] = (indices[:, None] >> shifts) & 1
+
+        bits = group["samples"][:, flat_wires]
+        indices = bits @ (2 ** np.arange(len(flat_wires) - 1, -1, -1))
+        return eigvals[indices]
+
+    @staticmethod
+    def _measurement_basis(A):
+        """Eigenvalues of an observable, and the rotation into its eigenbasis.
+
+        Args:
+            A (array): observable matrix
+
+        Returns:
+            tuple[array[float], array or None]: the eigenvalues, in the order of the
+            computational basis states of the rotated state, and the unitary rotating the
+            state into the eigenbasis; None if the observable is diagonal
+        """
+        if np.allclose(A, np.diag(np.diag(A)), atol=tolerance, rtol=0):
+            return np.real(np.diag(A)), None
+
+        entry = spectral_cache[A]
+        return entry["eigval"], entry["eigvec"].conj().T
+
+    def _rotated_probability(self, rotations):
+        """Probabilities of the computational basis states, after rotating the state of the
+        device into a measurement basis.
 
-        a, P = spectral_decomposition(A)
+        Args:
+            rotations (list[tuple[array, list[int]]]): unitaries, and the subsystems they act on
+
+        Returns:
+            array[float]: the probabilities; the state of the device is left unchanged
+        """
+        if not rotations:
+            return self._basis_probability()
+
+        state = self._state
+
+        for U, w in rotations:
+            state = self.mat_vec_product(self._cast(U), state, w)
+
+        return np.abs(state) ** 2
+
+    def _basis_probability(self):
+        r"""Probabilities of the computational basis states of the state of the device.
+
+        The probabilities are computed once, and reused until the state changes.
+
+        Returns:
+            array[float]: the probabilities :math:`|\psi_i|^2`
+        """
+        if self._prob_cache is None or self._prob_cache[0] is not self._state:
+            self._prob_cache = (self._state, self._abs(self._state) ** 2)
+
+        return self._prob_cache[1]
+
+    def _marginal_basis_probability(self, prob, wires):
+        """Marginal probabilities of a subset of the subsystems.
+
+        Args:
+            prob (array[float]): probabilities of the computational basis states of all subsystems
+            wires (Sequence[int]): subsystems to return the marginal probabilities for;
+                the remaining subsystems are traced out
+
+        Returns:
+            array[float]: marginal probabilities, with the basis states in lexicographical
+            order of the subsystems in the order given by ``wires``
+        """
+        prob = np.reshape(prob, [2] * self.num_wires)
+        inactive_wires = tuple(w for w in range(self.num_wires) if w not in wires)
+
+        # the remaining axes are in ascending order of the subsystems
+        prob = np.sum(prob, axis=inactive_wires)
+        prob = np.transpose(prob, np.argsort(np.argsort(wires))).ravel()
+
+        # remove the rounding errors of the simulation, which exceed
+        # the tolerance of np.random.choice in single precision
+        prob = np.clip(prob, 0, None)
+        return prob / np.sum(prob)
+
+    def pre_measure(self):
+        if self._out_of_core():
+            # the observables are sampled one at a time, from the streamed probabilities
+            return
+
+        observables = [
+            obs
+            for obs in self.obs_queue
+            if obs.return_type is Sample
+            or (not self.analytic and obs.return_type in (Expectation, Variance))
+        ]
+
+        self._basis_samples = []
+
+        for group in group_observables(observables):
+            bases = {}
+            rotations = {}
 
-        p = np.zeros(a.shape)
-        for idx, Pi in enumerate(P):
-            p[idx] = self.ev(Pi, wires)
+            for obs in (observables[i] for i in group):
+                bases.update(_measurement_bases(obs.name, obs.wires, obs.parameters))
+                factors = obs.obs if isinstance(obs, Tensor) else [obs]
 
-        return np.random.choice(a, self.shots, p=p)
+                for factor in factors:
+                    w = list(np.hstack(factor.wires))
+                    U = self._measurement_basis(
+                        self._get_operator_matrix(factor.name, factor.parameters)
+                    )[1]
+
+                    if U is not None:
+                        rotations[tuple(w)] = (U, w)
+
+            self._basis_samples.append(
+                {"bases": bases, "rotations": list(rotations.values()), "samples": None}
+            )
+
+    def post_measure(self):
+        self._basis_samples = None
 
     def _get_operator_matrix(self, operation, par):
         """Get the operator matrix for a given operation or observable.
@@ -468,14 +1625,22 @@ class DefaultQubit(Device):
           array: matrix representation.
         """
 
-        operation_map = {**self._operation_map, **self._observable_map}
-
         if operation.endswith(Operation.string_for_inverse):
-            A = operation_map[operation[:-len(Operation.string_for_inverse)]]
-            return A.conj().T if not callable(A) else A(*par).conj().T
+            A = self._operator_map[operation[:-len(Operation.string_for_inverse)]]
+            return A.conj().T if not callable(A) else self._conj(self._cast(A(*par))).T
 
-        A = operation_map[operation]
-        return A if not callable(A) else A(*par)
+        A = self._operator_map[operation]
+        return A if not callable(A) else self._cast(A(*par))
+
+    def operation_matrix(self, operation, par):
+        name = operation
+        if name.endswith(Operation.string_for_inverse):
+            name = name[: -len(Operation.string_for_inverse)]
+
+        if name not in self._operation_map:
+            return None
+
+        return self._get_operator_matrix(operation, par)
 
     def _get_tensor_operator_matrix(self, obs, par):
         """Get the operator matrix for a given tensor product of operations.
@@ -490,6 +1655,73 @@ class DefaultQubit(Device):
         ops = [self._get_operator_matrix(o, p) for o, p in zip(obs, par)]
         return functools.reduce(np.kron, ops)
 
+    @staticmethod
+    def _is_pauli_word(observable):
+        """Whether an observable is a tensor product of Pauli operators.
+
+        Args:
+            observable (str or list[str]): name of the observable(s)
+
+        Returns:
+            bool: True if the observable is a tensor product of
+            :class:`~.PauliX`, :class:`~.PauliY`, :class:`~.PauliZ` and :class:`~.Identity`
+        """
+        return isinstance(observable, list) and all(
+            name in ("PauliX", "PauliY", "PauliZ", "Identity") for name in observable
+        )
+
+    def pauli_word_ev(self, observable, wires):
+        r"""Expectation value of a tensor product of Pauli operators.
+
+        The operator matrix is never constructed. The Pauli word :math:`P` maps the computational
+        basis state :math:`|b\rangle` to :math:`i^{n_Y} (-1)^{b\cdot z} |b\oplus x\rangle`, where the
+        bit masks :math:`x` and :math:`z` select the subsystems acted on by :math:`X` or :math:`Y`,
+        and by :math:`Z` or :math:`Y`, respectively. The flips are applied by rolling the state
+        tensor along the axes in :math:`x`, and the signs by broadcasting a tensor of signs
+        over the axes in :math:`z`.
+
+        Args:
+            observable (list[str]): names of the Pauli operators
+            wires (list[list[int]]): subsystems the Pauli operators act on
+
+        Returns:
+            float: expectation value :math:`\bra{\psi}P\ket{\psi}`
+        """
+        n = self.num_wires
+        state = self._reshape(self._state, list(np.shape(self._state)[:-1]) + [2] * n)
+
+        flips = []
+        signs = np.ones([1] * n, dtype=np.int8)
+        num_y = 0
+
+        for name, w in zip(observable, wires):
+            w = np.hstack(w)[0]
+
+            if name in ("PauliX", "PauliY"):
+                flips.append(w - n)
+
+            if name in ("PauliZ", "PauliY"):
+                shape = [1] * n
+                shape[w] = 2
+                signs = signs * np.array([1, -1], dtype=np.int8).reshape(shape)
+
+            num_y += name == "PauliY"
+
+        flipped = state
+        if flips:
+            flipped = self._roll(state, np.ones(len(flips), dtype=int), axis=tuple(flips))
+
+        expectation = self._conj(flipped) * state
+
+        if signs.size > 1:
+            expectation = expectation * signs
+
+        expectation = self._sum(expectation, axis=tuple(range(-n, 0)))
+
+        # the real part of the expectation value multiplied by the phase i^num_y
+        ev = self._imag(expectation) if num_y % 2 else self._real(expectation)
+        return ev if num_y % 4 in (0, 3) else -ev
+
     def ev(self, A, wires):
         r"""Expectation value of observable on specified wires.
 
@@ -499,19 +1731,161 @@ class DefaultQubit(Device):
          Returns:
             float: expectation value :math:`\expect{A} = \bra{\psi}A\ket{\psi}`
         """
-        As = self.mat_vec_product(A, self._state, np.hstack(wires).tolist())
-        expectation = np.vdot(self._state, As)
+        if self._out_of_core():
+            expectation = self._sliced_ev(A, np.hstack(wires).tolist())
+        elif np.ndim(self._state) == 2:
+            As = self.mat_vec_product(A, self._state, np.hstack(wires).tolist())
+            # batch of states, return the expectation value for each
+            expectation = np.sum(self._conj(self._state) * As, axis=1)
+        else:
+            As = self.mat_vec_product(A, self._state, np.hstack(wires).tolist())
+            expectation = self._vdot(self._state, As)
+
+        # the rounding errors of single precision exceed the default tolerance
+        tol = max(tolerance, 100 * np.finfo(self.dtype).eps)
+
+        imag = self._imag(expectation)
+        if np.any(np.abs(imag) > tol):
+            warnings.warn('Nonvanishing imaginary part {} in expectation value.'.format(imag), RuntimeWarning)
+        return self._real(expectation)
+
+    def adjoint_jacobian(self, queue, observables, parameters):
+        r"""Calculates the Jacobian of the circuit using the adjoint method.
+
+        The circuit is simulated once to obtain the final state :math:`|\psi\rangle`,
+        and the state :math:`O|\psi\rangle` is prepared for each observable :math:`O`.
+        Both states are then propagated backwards through the circuit by applying the
+        inverse of each operation. If :math:`|\phi\rangle` and :math:`|\lambda\rangle`
+        are the propagated states directly after an operation :math:`U(\theta)=e^{is\theta G}`,
+        the derivative with respect to :math:`\theta` is
+        :math:`-2s\,\text{Im}\langle\lambda|G|\phi\rangle`.
+
+        The whole Jacobian is therefore computed at the cost of roughly two
+        circuit simulations, independently of the number of parameters.
+
+        Args:
+            queue (list[Operation]): operations to be applied to the device
+            observables (list[Observable]): observables to be measured; their
+                return type must be :attr:`~.ObservableReturnTypes.Expectation`
+            parameters (dict[int, list[ParameterDependency]]): reference dictionary
+                mapping the free parameter indices to differentiate with respect to,
+                to the operations that depend on them
+
+        Returns:
+            array[float]: Jacobian matrix of size ``(len(observables), len(parameters))``,
+            with the columns in the order of ``parameters``
+
+        Raises:
+            DeviceError: if an observable is not an expectation value, or if a
+                parameter is used in an operation that does not declare a generator
+        """
+        for obs in observables:
+            if obs.return_type is not Expectation:
+                raise DeviceError(
+                    "Adjoint differentiation only supports expectation values, "
+                    "not {} of {}.".format(obs.return_type, obs.name)
+                )
+
+        # operations whose derivatives are required
+        trainable = {id(d.op): d.op for deps in parameters.values() for d in deps}
+
+        for op in trainable.values():
+            if op.generator[0] is None:
+                raise DeviceError(
+                    "Adjoint differentiation is not supported for operation {}, "
+                    "as it has no generator.".format(op.name)
+                )
+
+        self.check_validity(queue, observables)
+        self.reset()
+
+        for op in queue:
+            self.apply(op.name, op.wires, op.parameters)
+
+        ket = self._state
+
+        # the states O|psi> for each observable, stacked along a batch dimension
+        bras = np.stack(
+            [
+                self.mat_vec_product(
+                    self.get_operator_matrix_for_measurement(obs.name, obs.parameters),
+                    ket,
+                    np.hstack(obs.wires).tolist(),
+                )
+                for obs in observables
+            ]
+        )
+
+        # derivatives of each expectation value with respect to the trainable operations
+        op_derivatives = {}
+
+        for op in reversed(queue):
+            if op.name in ("BasisState", "QubitStateVector"):
+                break
+
+            wires = list(op.wires)
 
-        if np.abs(expectation.imag) > tolerance:
-            warnings.warn('Nonvanishing imaginary part {} in expectation value.'.format(expectation.imag), RuntimeWarning)
-        return expectation.real
+            if id(op) in trainable:
+                gen, scale = op.generator
+
+                if isinstance(gen, type) and issubclass(gen, Observable):
+                    gen = self._get_operator_matrix(gen.__name__, [])
+
+                if op.inverse:
+                    scale = -scale
+
+                Gket = self.mat_vec_product(gen, ket, wires)
+                op_derivatives[id(op)] = -2 * scale * np.sum(bras.conj() * Gket, axis=1).imag
+
+            Uinv = self._get_operator_matrix(op.name, op.parameters).conj().T
+            ket = self.mat_vec_product(Uinv, ket, wires)
+            bras = self.mat_vec_product(Uinv, bras, wires)
+
+        jac = np.zeros((len(observables), len(parameters)))
+
+        for i, deps in enumerate(parameters.values()):
+            for d in deps:
+                # chain rule for the scalar multiplier of the Variable
+                jac[:, i] += op_derivatives[id(d.op)] * d.op.params[d.par_idx].mult
+
+        return jac
 
     def reset(self):
         """Reset the device"""
+        self._first_operation = True
+        self._basis_samples = None
+        self._prob_cache = None
+
+        if self.memmap_dir is not None:
+            if not isinstance(self._state, np.memmap):
+                # a new file is filled with zeros, and removed once it is no longer referenced
+                self._state = np.memmap(
+                    tempfile.TemporaryFile(dir=self.memmap_dir),
+                    dtype=self.dtype,
+                    mode="w+",
+                    shape=(2 ** self.num_wires,),
+                )
+            else:
+                self._state.fill(0)
+
+            self._state[0] = 1
+            return
+
+        if self.inplace:
+            if self._scratch is None:
+                self._scratch = np.empty(2**self.num_wires, dtype=self.dtype)
+
+            if np.shape(self._state) != np.shape(self._scratch):
+                self._state = np.empty_like(self._scratch)
+
+            # init the state buffer to |00..0>
+            self._state.fill(0)
+            self._state[0] = 1
+            return
+
         # init the state vector to |00..0>
-        self._state = np.zeros(2**self.num_wires, dtype=complex)
+        self._state = np.zeros(2**self.num_wires, dtype=self.dtype)
         self._state[0] = 1
-        self._first_operation = True
 
     @property
     def operations(self):
@@ -522,15 +1896,24 @@ class DefaultQubit(Device):
         return set(self._observable_map.keys())
 
     def probability(self, wires=None):
-        if self._state is None:
+        prob = self.marginal_probability(wires=wires)
+
+        if prob is None:
             return None
 
-        prob = np.abs(self._state.reshape([2] * self.num_wires)) ** 2
+        basis_states = itertools.product(range(2), repeat=int(np.log2(len(prob))))
+        return OrderedDict(zip(basis_states, prob))
+
+    def marginal_probability(self, wires=None):
+        if self._state is None:
+            return None
 
         wires = wires or range(self.num_wires)
         wires = np.hstack(wires)
 
-        basis_states = itertools.product(range(2), repeat=len(wires))
-        inactive_wires = list(set(range(self.num_wires)) - set(wires))
-        prob = np.apply_over_axes(np.sum, prob, inactive_wires).flatten()
-        return OrderedDict(zip(basis_states, prob))
+        if self._out_of_core():
+            return self._sliced_probability(sorted(set(wires.tolist())))
+
+        prob = np.reshape(self._basis_probability(), [2] * self.num_wires)
+        inactive_wires = tuple(sorted(set(range(self.num_wires)) - set(wires)))
+        return np.sum(prob, axis=inactive_wires).ravel()
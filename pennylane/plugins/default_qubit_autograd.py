@@ -0,0 +1,203 @@
+# Copyright 2019 Xanadu Quantum Technologies Inc.
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+
+#     http://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+r"""
+Default qubit simulator plugin, using the Autograd backend for
+Jacobian computations.
+"""
+import copy
+import functools
+
+import autograd
+from autograd import numpy as anp
+
+from pennylane.operation import Expectation, Variance, Probability
+from pennylane.qnodes import QuantumFunctionError
+from pennylane.variable import Variable
+
+from . import default_qubit
+from .default_qubit import DefaultQubit
+
+
+def _vdot(a, b):
+    """Differentiable equivalent of ``numpy.vdot`` for one-dimensional arrays."""
+    return anp.dot(anp.conj(a), b)
+
+
+class DefaultQubitAutograd(DefaultQubit):
+    """Default qubit device for PennyLane, supporting Autograd backpropagation.
+
+    **Short name:** ``default.qubit.autograd``
+
+    This device extends ``default.qubit`` by performing the simulation using
+    the ``autograd.numpy`` versions of the NumPy functions. As a result, the
+    device provides its own Jacobian, computed using reverse-mode automatic
+    differentiation through the state vector simulation. The cost of this is a
+    single forward simulation, plus a backward pass for each output of the circuit,
+    rather than two circuit evaluations per parameter required by the
+    parameter-shift rule.
+
+    **Example:**
+
+    >>> dev = qml.device("default.qubit.autograd", wires=1)
+    >>> @qml.qnode(dev, interface="autograd", diff_method="best")
+    >>> def circuit(x):
+    ...     qml.RX(x[1], wires=0)
+    ...     qml.Rot(x[0], x[1], x[2], wires=0)
+    ...     return qml.expval(qml.PauliZ(0))
+    >>> grad_fn = qml.grad(circuit, argnum=[0])
+    >>> print(grad_fn([0.2, 0.5, 0.1]))
+    ([array(-0.22526717), array(-1.00864546), array(6.9388939e-18)],)
+
+    .. note::
+
+        Autograd is used as the device backend, and is independent
+        of the chosen QNode interface; the device can also be used with
+        the ``torch`` and the ``tf`` interfaces.
+
+    Args:
+        wires (int): the number of modes to initialize the device in
+        shots (int): the number of shots used for returning samples
+    """
+
+    name = "Default qubit (Autograd) PennyLane plugin"
+    short_name = "default.qubit.autograd"
+    _capabilities = {
+        "model": "qubit",
+        "tensor_observables": True,
+        "inverse_operations": True,
+        "provides_jacobian": True,
+    }
+
+    # the parametrized gates of default.qubit, building their matrices using autograd.numpy
+    _operation_map = copy.copy(DefaultQubit._operation_map)
+    _operation_map.update(
+        {
+            name: functools.partial(gate, xp=anp)
+            for name, gate in {
+                "PhaseShift": default_qubit.Rphi,
+                "RX": default_qubit.Rotx,
+                "RY": default_qubit.Roty,
+                "RZ": default_qubit.Rotz,
+                "Rot": default_qubit.Rot3,
+                "CRX": default_qubit.CRotx,
+                "CRY": default_qubit.CRoty,
+                "CRZ": default_qubit.CRotz,
+                "CRot": default_qubit.CRot3,
+            }.items()
+        }
+    )
+
+    _reshape = staticmethod(anp.reshape)
+    _tensordot = staticmethod(anp.tensordot)
+    _transpose = staticmethod(anp.transpose)
+    _einsum = staticmethod(anp.einsum)
+    _vdot = staticmethod(_vdot)
+    _conj = staticmethod(anp.conj)
+    _real = staticmethod(anp.real)
+    _imag = staticmethod(anp.imag)
+    _abs = staticmethod(anp.abs)
+    _diag = staticmethod(anp.diag)
+    _roll = staticmethod(anp.roll)
+    _sum = staticmethod(anp.sum)
+    _swapaxes = staticmethod(anp.swapaxes)
+    _stack = staticmethod(anp.stack)
+
+    def __init__(self, wires, *, shots=1000):
+        super().__init__(wires, shots=shots, analytic=True)
+
+    def jacobian(self, queue, observables, parameters):
+        """Calculates the Jacobian of the device circuit using Autograd
+        backpropagation.
+
+        Args:
+            queue (list[Operation]): operations to be applied to the device
+            observables (list[Observable]): observables to be measured
+            parameters (dict[int, ParameterDependency]): reference dictionary
+                mapping free parameter values to the operations that
+                depend on them
+
+        Returns:
+            array[float]: Jacobian matrix of size (``num_outputs``, ``num_params``)
+
+        Raises:
+            QuantumFunctionError: if the value of :attr:`~.Observable.return_type`
+                is not supported
+        """
+        self.check_validity(queue, observables)
+
+        # the unscaled values of the free parameters, as stored by the QNode
+        indices = list(parameters)
+        free_params = anp.array([Variable.free_param_values[idx] for idx in indices], dtype=float)
+
+        def circuit(x):
+            """The device circuit, as a function of the free parameters"""
+            # Numeric parameter values of each operation, with the free
+            # parameters replaced by the (possibly scaled) entries of x.
+            op_params = {op: list(op.parameters) for op in queue}
+
+            for i, idx in enumerate(indices):
+                for p in parameters[idx]:
+                    op_params[p.op][p.par_idx] = x[i] * p.op.params[p.par_idx].mult
+
+            self.reset()
+
+            for operation in queue:
+                self.apply(operation.name, operation.wires, op_params[operation])
+
+            results = []
+
+            for obs in observables:
+                if obs.return_type is Expectation:
+                    results.append(anp.reshape(self.expval(obs.name, obs.wires, obs.parameters), [-1]))
+
+                elif obs.return_type is Variance:
+                    results.append(anp.reshape(self.var(obs.name, obs.wires, obs.parameters), [-1]))
+
+                elif obs.return_type is Probability:
+                    results.append(self.marginal_probability(obs.wires))
+
+                else:
+                    raise QuantumFunctionError(
+                        "Unsupported return type specified for observable {}".format(obs.name)
+                    )
+
+            return anp.concatenate(results)
+
+        jac = autograd.jacobian(circuit)(free_params)
+
+        # the simulation has left a traced state behind
+        self.reset()
+
+        return anp.real(jac)
+
+    def marginal_probability(self, wires=None):
+        """Differentiable marginal probabilities of the computational basis states.
+
+        Unlike ``default.qubit``, the probabilities are not cached, as the state
+        may be traced by Autograd.
+
+        Args:
+            wires (Sequence[int]): Sequence of wires to return marginal probabilities for.
+                Wires not provided are traced out of the system.
+
+        Returns:
+            array[float]: marginal probabilities, with the basis states in lexicographical order
+        """
+        if self._state is None:
+            return None
+
+        wires = wires or range(self.num_wires)
+        prob = self._abs(self._reshape(self._state, [2] * self.num_wires)) ** 2
+        inactive_wires = tuple(w for w in range(self.num_wires) if w not in wires)
+        return anp.reshape(anp.sum(prob, axis=inactive_wires), [-1])
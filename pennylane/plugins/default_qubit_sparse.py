@@ -0,0 +1,360 @@
+# Copyright 2019 Xanadu Quantum Technologies Inc.
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+
+#     http://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+r"""
+Sparse qubit simulator plugin, storing only the nonzero amplitudes of the state.
+
+The cost of the simulation is proportional to the number of nonzero amplitudes rather than
+to :math:`2^n`, so that circuits that start in a computational basis state, and consist mostly
+of operations permuting the basis states, can be simulated on many wires.
+"""
+from collections import OrderedDict
+import itertools
+
+import numpy as np
+
+from pennylane import Device, DeviceError
+from pennylane.operation import Operation
+from pennylane.utils import spectral_cache
+
+from .default_qubit import DefaultQubit, tolerance
+
+
+class DefaultQubitSparse(Device):
+    """Sparse state vector qubit device for PennyLane.
+
+    The state is stored as a dictionary mapping the computational basis states, labelled by
+    integers, to their nonzero amplitudes. Wire 0 corresponds to the most significant bit of
+    the label. An operation acting on :math:`k` wires maps each amplitude to at most
+    :math:`2^k` amplitudes, given by the nonzero elements of a column of its matrix, so that
+    permutations and diagonal operations preserve the number of nonzero amplitudes.
+    Amplitudes with a magnitude below :attr:`cutoff` are discarded after each operation.
+
+    Args:
+        wires (int): the number of modes to initialize the device in
+        shots (int): How many times the circuit should be evaluated (or sampled) to estimate
+            the expectation values. Defaults to 1000 if not specified.
+            If ``analytic == True``, then the number of shots is ignored
+            in the calculation of expectation values and variances, and only controls the number
+            of samples returned by ``sample``.
+        analytic (bool): indicates if the device should calculate expectations
+            and variances analytically
+        cutoff (float): amplitudes with a smaller magnitude are set to zero
+    """
+
+    name = "Default sparse qubit PennyLane plugin"
+    short_name = "default.qubit.sparse"
+    pennylane_requires = "0.8"
+    version = "0.8.0"
+    author = "Xanadu Inc."
+    _capabilities = {"model": "qubit", "tensor_observables": True, "inverse_operations": True}
+
+    _operation_map = DefaultQubit._operation_map
+    _observable_map = DefaultQubit._observable_map
+
+    def __init__(self, wires, *, shots=1000, analytic=True, cutoff=tolerance):
+        super().__init__(wires, shots)
+        self.analytic = analytic
+        self.cutoff = cutoff
+
+        self._state = None
+        """dict[int, complex]: the nonzero amplitudes of the computational basis states"""
+
+        self._first_operation = True
+
+    def pre_apply(self):
+        self.reset()
+
+    def apply(self, operation, wires, par):
+        if operation in ("BasisState", "QubitStateVector"):
+            if not self._first_operation:
+                raise DeviceError(
+                    "Operation {} cannot be used after other Operations have already been "
+                    "applied on a {} device.".format(operation, self.short_name)
+                )
+
+            self._first_operation = False
+
+            if operation == "BasisState":
+                self._apply_basis_state(par[0], wires)
+            else:
+                self._apply_state_vector(par[0], wires)
+            return
+
+        self._first_operation = False
+        A = self._get_operator_matrix(operation, par)
+        self._state = self._sparse_mat_vec_product(A, self._state, wires, cutoff=self.cutoff)
+
+    def _apply_basis_state(self, state, wires):
+        """Initialize the device in a computational basis state.
+
+        Args:
+            state (array[int]): basis state of the given wires, consisting of 0 and 1
+            wires (Sequence[int]): wires the basis state is prepared on
+        """
+        if not set(state).issubset({0, 1}):
+            raise ValueError("BasisState parameter must consist of 0 or 1 integers.")
+        if len(state) != len(wires):
+            raise ValueError("BasisState parameter and wires must be of equal length.")
+
+        self._state = {self._embed(0, wires, self._bits_to_int(state)): 1.0 + 0j}
+
+    def _apply_state_vector(self, state, wires):
+        """Initialize the device in a state vector of a subset of the wires.
+
+        Args:
+            state (array[complex]): state vector of the given wires, of length ``2**len(wires)``
+            wires (Sequence[int]): wires the state is prepared on
+        """
+        state = np.asarray(state, dtype=np.complex128)
+
+        if state.ndim != 1 or state.shape[0] != 2 ** len(wires):
+            raise ValueError("State vector must be of length 2**wires.")
+        if not np.isclose(np.linalg.norm(state, 2), 1.0, atol=tolerance):
+            raise ValueError("Sum of amplitudes-squared does not equal one.")
+
+        self._state = {
+            self._embed(0, wires, int(i)): state[i] for i in np.flatnonzero(np.abs(state) > 0)
+        }
+
+    @staticmethod
+    def _bits_to_int(bits):
+        """Integer label of a computational basis state, with the first bit the most significant.
+
+        Args:
+            bits (Sequence[int]): the basis state, consisting of 0 and 1
+
+        Returns:
+            int: the label
+        """
+        return int("".join(str(int(b)) for b in bits) or "0", 2)
+
+    def _extract(self, index, wires):
+        """Local label of the basis state of a subset of the wires.
+
+        Args:
+            index (int): label of a basis state of all wires
+            wires (Sequence[int]): subset of the wires
+
+        Returns:
+            int: label of the basis state of ``wires``, in the order they are given
+        """
+        local = 0
+        for w in wires:
+            local = (local << 1) | ((index >> (self.num_wires - 1 - w)) & 1)
+        return local
+
+    def _embed(self, index, wires, local):
+        """Set the bits of a subset of the wires in the label of a basis state.
+
+        Args:
+            index (int): label of a basis state of all wires, with the bits of ``wires`` cleared
+            wires (Sequence[int]): subset of the wires
+            local (int): label of the basis state of ``wires``, in the order they are given
+
+        Returns:
+            int: the label of the basis state of all wires
+        """
+        for k, w in enumerate(reversed(wires)):
+            index |= ((local >> k) & 1) << (self.num_wires - 1 - w)
+        return index
+
+    def _sparse_mat_vec_product(self, mat, state, wires, cutoff=0):
+        """Apply a matrix to subsystems of a sparse state.
+
+        Args:
+            mat (array): matrix to multiply, of shape ``(2**k, 2**k)``
+            state (dict[int, complex]): nonzero amplitudes of the state
+            wires (Sequence[int]): target subsystems
+            cutoff (float): amplitudes of the result with a smaller magnitude are discarded
+
+        Returns:
+            dict[int, complex]: nonzero amplitudes of the resulting vector
+        """
+        wires = list(wires)
+        mat = np.asarray(mat)
+
+        # nonzero elements of each column of the matrix
+        columns = [
+            [(j, mat[j, l]) for j in np.flatnonzero(mat[:, l]).tolist()]
+            for l in range(mat.shape[1])
+        ]
+
+        mask = self._embed(0, wires, 2 ** len(wires) - 1)
+        out = {}
+
+        for index, amplitude in state.items():
+            rest = index & ~mask
+            for j, element in columns[self._extract(index, wires)]:
+                target = self._embed(rest, wires, j)
+                out[target] = out.get(target, 0) + element * amplitude
+
+        return {k: v for k, v in out.items() if abs(v) > cutoff}
+
+    def _get_operator_matrix(self, operation, par):
+        """Get the operator matrix for a given operation or observable.
+
+        If the inverse was defined for an operation, returns the
+        conjugate transpose of the operator matrix.
+
+        Args:
+          operation    (str): name of the operation/observable
+          par (tuple[float]): parameter values
+
+        Returns:
+          array: matrix representation
+        """
+        operator_map = {**self._operation_map, **self._observable_map}
+
+        if operation.endswith(Operation.string_for_inverse):
+            A = operator_map[operation[: -len(Operation.string_for_inverse)]]
+            return A.conj().T if not callable(A) else A(*par).conj().T
+
+        A = operator_map[operation]
+        return A if not callable(A) else A(*par)
+
+    def _factors(self, observable, wires, par):
+        """Split a (tensor product) observable into its factors.
+
+        Returns:
+            list[tuple[array, list[int]]]: the matrix of each factor, and the wires it acts on
+        """
+        if not isinstance(observable, list):
+            observable, wires, par = [observable], [wires], [par]
+
+        return [
+            (self._get_operator_matrix(o, p), list(np.hstack(w).tolist()))
+            for o, w, p in zip(observable, wires, par)
+        ]
+
+    def _apply_observable(self, observable, wires, par):
+        r"""Apply an observable to the state.
+
+        Returns:
+            dict[int, complex]: nonzero amplitudes of :math:`A\ket{\psi}`
+        """
+        state = self._state
+        for A, w in self._factors(observable, wires, par):
+            state = self._sparse_mat_vec_product(A, state, w)
+        return state
+
+    def expval(self, observable, wires, par):
+        if not self.analytic:
+            return np.mean(self.sample(observable, wires, par))
+
+        As = self._apply_observable(observable, wires, par)
+        ev = sum(np.conj(a) * As.get(i, 0) for i, a in self._state.items())
+        return np.real(ev)
+
+    def var(self, observable, wires, par):
+        if not self.analytic:
+            return np.var(self.sample(observable, wires, par))
+
+        # the observables are Hermitian, so that <A^2> = <A psi|A psi>
+        As = self._apply_observable(observable, wires, par)
+        ev = sum(np.conj(a) * As.get(i, 0) for i, a in self._state.items())
+        return sum(abs(a) ** 2 for a in As.values()) - np.real(ev) ** 2
+
+    def sample(self, observable, wires, par):
+        """Draw samples of an observable.
+
+        The state is rotated into the eigenbasis of each factor of the observable, and the
+        samples are drawn from the marginal probabilities of the nonzero amplitudes of the
+        observable wires.
+
+        Args:
+            observable (str or list[str]): name of the observable(s)
+            wires (list[int] or list[list[int]]): subsystems the observable(s) act on
+            par (list[Any] or list[list[Any]]): parameters of the observable(s)
+
+        Returns:
+            array[float]: samples of the eigenvalues of the observable
+        """
+        state = self._state
+        factors = []
+
+        for A, w in self._factors(observable, wires, par):
+            if np.allclose(A, np.diag(np.diag(A)), atol=tolerance, rtol=0):
+                factors.append((np.real(np.diag(A)), w))
+                continue
+
+            entry = spectral_cache[A]
+            state = self._sparse_mat_vec_product(entry["eigvec"].conj().T, state, w)
+            factors.append((entry["eigval"], w))
+
+        flat_wires = [i for _, w in factors for i in w]
+        prob = self._marginal(state, flat_wires)
+        outcomes = list(prob.keys())
+
+        # eigenvalue of each outcome, as the product of the eigenvalues of the factors
+        eigvals = np.ones(len(outcomes))
+        shift = len(flat_wires)
+        for a, w in factors:
+            shift -= len(w)
+            local = [(i >> shift) & (2 ** len(w) - 1) for i in outcomes]
+            eigvals *= np.asarray(a)[local]
+
+        p = np.array([prob[i] for i in outcomes])
+        samples = np.random.choice(len(outcomes), self.shots, p=p / np.sum(p))
+        return eigvals[samples]
+
+    def _marginal(self, state, wires):
+        """Marginal probabilities of the nonzero amplitudes of a subset of the wires.
+
+        Args:
+            state (dict[int, complex]): nonzero amplitudes of the state
+            wires (Sequence[int]): subsystems to return the marginal probabilities for
+
+        Returns:
+            dict[int, float]: mapping from the labels of the basis states of ``wires``,
+            in the order they are given, to their nonzero probabilities
+        """
+        prob = {}
+        for index, amplitude in state.items():
+            local = self._extract(index, wires)
+            prob[local] = prob.get(local, 0) + abs(amplitude) ** 2
+        return prob
+
+    def probability(self, wires=None):
+        prob = self.marginal_probability(wires=wires)
+
+        if prob is None:
+            return None
+
+        basis_states = itertools.product(range(2), repeat=int(np.log2(len(prob))))
+        return OrderedDict(zip(basis_states, prob))
+
+    def marginal_probability(self, wires=None):
+        if self._state is None:
+            return None
+
+        wires = sorted(set(np.hstack(wires or range(self.num_wires)).tolist()))
+        prob = np.zeros(2 ** len(wires))
+
+        for local, p in self._marginal(self._state, wires).items():
+            prob[local] = p
+
+        return prob
+
+    def reset(self):
+        """Reset the device"""
+        self._first_operation = True
+        self._state = {0: 1.0 + 0j}
+
+    @property
+    def operations(self):
+        return set(self._operation_map.keys())
+
+    @property
+    def observables(self):
+        return set(self._observable_map.keys())
@@ -17,6 +17,7 @@ This package contains the new-style QNodes.
 .. currentmodule:: pennylane.beta.qnodes
 """
 from .base import BaseQNode, QuantumFunctionError
+from .adjoint import AdjointQNode
 from .cv import CVQNode
 from .decorator import qnode, QNode
 from .jacobian import JacobianQNode
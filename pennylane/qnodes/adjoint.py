@@ -0,0 +1,90 @@
+# Copyright 2019 Xanadu Quantum Technologies Inc.
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+
+#     http://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+Adjoint quantum node.
+
+A QNode that computes the gradient using the adjoint method of
+statevector simulators, falling back to the parameter-shift rule
+for parameters the adjoint method does not support.
+"""
+from collections.abc import Iterable
+
+import numpy as np
+
+from pennylane.operation import ObservableReturnTypes
+
+from .qubit import QubitQNode
+
+
+class AdjointQNode(QubitQNode):
+    """Quantum node for differentiation using the adjoint method of the device.
+
+    The device must provide an ``adjoint_jacobian`` method. Parameters that are only
+    used in operations with a generator are differentiated using the adjoint method.
+    All other parameters, or all parameters of circuits returning quantities other than
+    expectation values, are differentiated using the parameter-shift rule, with
+    finite differences as a fallback.
+    """
+
+    def _adjoint_supported(self, idx):
+        """Determine whether the adjoint method can be used for a free parameter.
+
+        Args:
+            idx (int): free parameter index
+
+        Returns:
+            bool: True if the partial derivative can be computed using the adjoint method
+        """
+        if idx not in self.variable_deps or self.par_to_grad_method[idx] is None:
+            return False
+
+        if any(
+            ob.return_type is not ObservableReturnTypes.Expectation
+            for ob in self.circuit.observables
+        ):
+            return False
+
+        return all(d.op.generator[0] is not None for d in self.variable_deps[idx])
+
+    def jacobian(self, args, kwargs=None, *, wrt=None, method="best", options=None):
+        if method != "best":
+            return super().jacobian(args, kwargs, wrt=wrt, method=method, options=options)
+
+        if not isinstance(args, Iterable):
+            args = (args,)
+
+        # (re-)construct the circuit if necessary
+        if self.circuit is None or self.mutable:
+            self._construct(args, self._default_args(kwargs or {}))
+
+        wrt = range(self.num_variables) if wrt is None else wrt
+
+        adjoint = [i for i, k in enumerate(wrt) if self._adjoint_supported(k)]
+        other = [i for i in range(len(wrt)) if i not in adjoint]
+
+        if not adjoint:
+            return super().jacobian(args, kwargs, wrt=wrt, method="best", options=options)
+
+        jac = np.zeros((self.output_dim, len(wrt)), dtype=float)
+
+        jac[:, adjoint] = super().jacobian(
+            args, kwargs, wrt=[wrt[i] for i in adjoint], method="adjoint", options=options
+        )
+
+        if other:
+            jac[:, other] = super().jacobian(
+                args, kwargs, wrt=[wrt[i] for i in other], method="best", options=options
+            )
+
+        return jac
@@ -16,14 +16,15 @@ Base QNode class and utilities
 """
 from collections.abc import Sequence
 from collections import namedtuple, OrderedDict
+import copy
 import inspect
 import itertools
 
 import numpy as np
 
 import pennylane as qml
-from pennylane.operation import Observable, CV, Wires, ObservableReturnTypes
-from pennylane.utils import _flatten, unflatten
+from pennylane.operation import Observable, CV, Wires, ObservableReturnTypes, Tensor
+from pennylane.utils import _circuit_structure, _flatten, unflatten, expand
 from pennylane.circuit_graph import CircuitGraph, _is_observable
 from pennylane.variable import Variable
 
@@ -86,6 +87,28 @@ def _get_signature(func):
     func.n_pos = n_pos
 
 
+def _bind_parameters(op):
+    """Copy an Operator, replacing its free parameters with their current numerical values.
+
+    The copy no longer depends on the :class:`~.variable.Variable` class attributes,
+    and can be executed even after the parameter values have been changed.
+
+    Args:
+        op (Operator): operator to copy
+
+    Returns:
+        Operator: shallow copy of ``op`` with numerical parameters
+    """
+    new = copy.copy(op)
+
+    if isinstance(op, Tensor):
+        new.obs = [_bind_parameters(o) for o in op.obs]
+    else:
+        new.params = op.parameters
+
+    return new
+
+
 def _decompose_queue(ops, device):
     """Recursively loop through a queue and decompose
     operations that are not supported by a device.
@@ -129,6 +152,107 @@ def decompose_queue(ops, device):
     return new_ops
 
 
+def _fixed_matrix(op, device):
+    """Matrix of an operation that does not depend on any free or auxiliary parameters.
+
+    Args:
+        op (~.Operation): operation
+        device (~.Device): device providing the matrix representation of the operation
+
+    Returns:
+        array or None: matrix of the operation, or None if it depends on a
+        :class:`~.Variable`, or the device knows no matrix representation of it
+    """
+    if any(isinstance(p, Variable) for p in _flatten(op.params)):
+        return None
+
+    return device.operation_matrix(op.name, op.parameters)
+
+
+def fuse_gates(ops, device, max_wires=2):
+    """Fuse runs of adjacent fixed gates into single :class:`~.QubitUnitary` operations.
+
+    Gates that do not depend on any free or auxiliary parameters, act on at most
+    ``max_wires`` wires, and whose matrix is provided by
+    :meth:`~.Device.operation_matrix`, are multiplied together for as long as the union of the wires
+    they act on does not exceed ``max_wires`` wires. Every fused block of two or more
+    gates is then replaced by a single :class:`~.QubitUnitary`, which reduces the number
+    of times the device has to apply an operation to the full state.
+
+    Operations that depend on free parameters are left in place, so the
+    :class:`ParameterDependency` instances of the circuit remain valid.
+
+    Args:
+        ops (List[~.Operation]): operation queue
+        device (~.Device): device the operations are executed on
+        max_wires (int): maximum number of wires a fused gate may act on
+
+    Returns:
+        List[~.Operation]: operation queue with the fixed gates fused
+    """
+    new_ops = []
+    blocks = {}  # wire -> the open block acting on it
+
+    def emit(block):
+        """Append a fused block to the new operation queue."""
+        for w in block["wires"]:
+            del blocks[w]
+
+        if len(block["ops"]) == 1:
+            new_ops.append(block["ops"][0])
+            return
+
+        wires = sorted(block["wires"])
+        U = np.identity(2 ** len(wires), dtype=np.complex128)
+
+        for op, A in zip(block["ops"], block["matrices"]):
+            U = expand(A, [wires.index(w) for w in op.wires], len(wires)) @ U
+
+        new_ops.append(qml.QubitUnitary(U, wires=wires, do_queue=False))
+
+    def emit_touching(wires):
+        """Emit all the open blocks acting on the given wires, in creation order."""
+        touching = {id(blocks[w]): blocks[w] for w in wires if w in blocks}
+        for block in sorted(touching.values(), key=lambda b: b["order"]):
+            emit(block)
+
+    for order, op in enumerate(ops):
+        A = None
+
+        if len(op.wires) <= max_wires and op.name not in ("BasisState", "QubitStateVector"):
+            A = _fixed_matrix(op, device)
+
+        if A is None:
+            emit_touching(op.wires)
+            new_ops.append(op)
+            continue
+
+        touching = {id(blocks[w]): blocks[w] for w in op.wires if w in blocks}.values()
+        wires = set(op.wires).union(*(b["wires"] for b in touching))
+
+        if len(wires) > max_wires:
+            emit_touching(op.wires)
+            touching = []
+            wires = set(op.wires)
+
+        # merge the touching blocks, in creation order, and append the gate
+        block = {"ops": [], "matrices": [], "wires": wires, "order": order}
+        for b in sorted(touching, key=lambda b: b["order"]):
+            block["ops"].extend(b["ops"])
+            block["matrices"].extend(b["matrices"])
+            block["order"] = min(block["order"], b["order"])
+
+        block["ops"].append(op)
+        block["matrices"].append(A)
+
+        for w in wires:
+            blocks[w] = block
+
+    # emit the remaining blocks, in creation order
+    emit_touching(list(blocks))
+    return new_ops
+
+
 class BaseQNode:
     """Base class for quantum nodes in the hybrid computational graph.
 
@@ -159,7 +283,21 @@ class BaseQNode:
             and returning a tuple of measured :class:`~.operation.Observable` instances.
         device (~pennylane._device.Device): computational device to execute the function on
         mutable (bool): whether the circuit is mutable, see above
-        properties (dict[str, Any] or None): additional keyword properties for adjusting the QNode behavior
+        properties (dict[str, Any] or None): additional keyword properties for adjusting the QNode behavior.
+            Setting ``"fuse_gates"`` to True fuses adjacent fixed gates acting on at most two wires
+            into single :class:`~.QubitUnitary` operations before they are submitted to the device,
+            provided the device supports them; see :func:`fuse_gates`.
+            Setting ``"shared_wires"`` to True allows the measured observables to act on
+            the same wires, which is only meaningful on devices that compute the exact expectation
+            values from the simulated state.
+            Setting ``"jacobian_workers"`` to an integer larger than one distributes the circuits
+            required for the Jacobian of a :class:`~.JacobianQNode` over that many replicas
+            of the device, executed concurrently by a pool of workers; ``"jacobian_pool"``
+            selects a pool of ``"thread"`` (default) or ``"process"`` workers.
+            Setting ``"group_observables"`` to True evaluates the node using
+            :meth:`.Device.execute_grouped`, which measures each group of qubit-wise commuting
+            observables in a single rotated circuit; this requires ``"shared_wires"`` if
+            the observables act on the same wires.
     """
 
     # pylint: disable=too-many-instance-attributes
@@ -189,6 +327,15 @@ class BaseQNode:
         self._metric_tensor_subcircuits = None
         """dict[tuple[int], dict[str, Any]]: circuit descriptions for computing the metric tensor"""
 
+        self._fused_ops = None
+        """List[Operation] or None: operation queue with the fixed gates fused, see :func:`fuse_gates`"""
+
+        self._structure = None
+        """tuple: hashable description of the structure of the circuit, see :func:`~.utils._circuit_structure`"""
+
+        self._plan = None
+        """tuple[tuple, object]: circuit structure, and the execution plan the device compiled for it"""
+
         # introspect the quantum function signature
         _get_signature(self.func)
 
@@ -203,6 +350,18 @@ class BaseQNode:
 
     __repr__ = __str__
 
+    @property
+    def device_queue(self):
+        """List[Operation]: operation queue that is submitted to the device
+
+        This is the operation queue of the circuit, with the fixed gates fused if the
+        ``"fuse_gates"`` property is set. Assumes :meth:`construct` has already been called.
+        """
+        if self._fused_ops is not None:
+            return self._fused_ops
+
+        return self.circuit.operations
+
     def print_applied(self):
         """Prints the most recently applied operations from the QNode."""
         if self.circuit is None:
@@ -378,6 +537,14 @@ class BaseQNode:
         # generate the DAG
         self.circuit = CircuitGraph(self.ops, self.variable_deps)
 
+        self._fused_ops = None
+        if self.properties.get("fuse_gates", False) and self.device.supports_operation(
+            "QubitUnitary"
+        ):
+            self._fused_ops = fuse_gates(self.circuit.operations, self.device)
+
+        self._structure = _circuit_structure(self.device_queue, self.circuit.observables)
+
         # check for unused positional params
         if self.properties.get("par_check", False):
             unused = [k for k, v in self.variable_deps.items() if not v]
@@ -453,7 +620,7 @@ class BaseQNode:
 
         # check that no wires are measured more than once
         m_wires = list(w for ob in res for w in _flatten(ob.wires))
-        if len(m_wires) != len(set(m_wires)):
+        if len(m_wires) != len(set(m_wires)) and not self.properties.get("shared_wires", False):
             raise QuantumFunctionError(
                 "Each wire in the quantum circuit can only be measured once."
             )
@@ -569,12 +736,111 @@ class BaseQNode:
         if self.circuit is None or self.mutable:
             self._construct(args, kwargs)
 
+        if self.properties.get("group_observables", False):
+            # one rotated circuit for each group of qubit-wise commuting observables
+            self.device.reset()
+            ret = self.device.execute_grouped(*self._bound_circuit(args, kwargs))
+            return self.output_conversion(ret)
+
+        plan = self._compiled_plan()
+
         self.device.reset()
-        ret = self.device.execute(
-            self.circuit.operations, self.circuit.observables, self.variable_deps
+        ret = self.device.execute_compiled(
+            plan, self.device_queue, self.circuit.observables, self.variable_deps
         )
         return self.output_conversion(ret)
 
+    def evaluate_batch(self, args, kwargs):
+        """Evaluate the quantum function on a batch of inputs.
+
+        Every positional argument carries a leading batch axis of the same size, and row
+        ``b`` of the batch consists of the ``b``-th entry of each of them. The circuit is
+        constructed once, a copy of it is bound to the parameter values of each row, and
+        all the copies are submitted to the device in a single call to
+        :meth:`.Device.batch_execute`. Simulators can then evaluate the rows together;
+        ``default.qubit`` uses parameter broadcasting.
+
+        Since positional arguments cannot change the structure of the circuit, the rows
+        only differ in their parameter values. The result is not differentiable.
+
+        **Example:**
+
+        >>> dev = qml.device("default.qubit", wires=1)
+        >>> def circuit(x):
+        ...     qml.RX(x, wires=0)
+        ...     return qml.expval(qml.PauliZ(0))
+        >>> node = qml.QNode(circuit, dev)
+        >>> node.evaluate_batch([np.array([0.0, np.pi])], {})
+        array([ 1., -1.])
+
+        Args:
+            args (Sequence[array]): positional arguments to the quantum function,
+                each with a leading batch axis
+            kwargs (dict[str, Any]): auxiliary arguments, shared by all the rows
+
+        Raises:
+            QuantumFunctionError: if the positional arguments do not have the same batch size
+
+        Returns:
+            array[float]: output measured value(s), with a leading batch axis
+        """
+        kwargs = self._default_args(kwargs)
+
+        batch_sizes = {len(a) for a in args}
+        if len(batch_sizes) != 1:
+            raise QuantumFunctionError(
+                "The positional arguments must have a leading batch axis of the same size."
+            )
+
+        rows = list(zip(*args))
+
+        if self.circuit is None or self.mutable:
+            self._set_variables(rows[0], kwargs)
+            self._construct(rows[0], kwargs)
+
+        circuits = [self._bound_circuit(row, kwargs) for row in rows]
+        results = self.device.batch_execute(circuits)
+        return np.array([self.output_conversion(res) for res in results])
+
+    def _compiled_plan(self):
+        """Device execution plan for the circuit.
+
+        The plan is compiled using :meth:`.Device.compile` the first time it is required,
+        and then reused for as long as the structure of the circuit does not change.
+
+        Returns:
+            object or None: the execution plan
+        """
+        if self._plan is None or self._plan[0] != self._structure:
+            plan = self.device.compile(self.device_queue, self.circuit.observables)
+            self._plan = (self._structure, plan)
+
+        return self._plan[1]
+
+    def _bound_circuit(self, args, kwargs, obs=None):
+        """Snapshot of the circuit, with the given parameter values bound to its operators.
+
+        Assumes :meth:`construct` has already been called.
+
+        Args:
+            args (array[float]): positional arguments to the quantum function (differentiable)
+            kwargs (dict[str, Any]): auxiliary arguments (not differentiable)
+            obs (Iterable[Observable], None): observables to measure, by default the
+                observables of the circuit
+
+        Returns:
+            tuple[list[Operation], list[Observable]]: operation queue and observables of the
+            circuit, suitable for :meth:`.Device.batch_execute`
+        """
+        # temporarily store the parameter values in the Variable class
+        self._set_variables(args, kwargs)
+
+        if obs is None:
+            obs = self.circuit.observables
+
+        queue = [_bind_parameters(op) for op in self.device_queue]
+        return queue, [_bind_parameters(ob) for ob in obs]
+
     def evaluate_obs(self, obs, args, kwargs):
         """Evaluate the value of the given observables.
 
@@ -592,5 +858,5 @@ class BaseQNode:
         self._set_variables(args, kwargs)
 
         self.device.reset()
-        ret = self.device.execute(self.circuit.operations, obs, self.circuit.variable_deps)
+        ret = self.device.execute(self.device_queue, obs, self.circuit.variable_deps)
         return ret
@@ -143,7 +143,7 @@ class CVQNode(JacobianQNode):
         return qml.expval(qml.PolyXP(qp, wires=range(w), do_queue=False))
 
     def _pd_analytic(self, idx, args, kwargs, **options):
-        """Partial derivative of the node using the analytic parameter shift method.
+        """Circuits for the partial derivative of the node using the analytic parameter shift method.
 
         The 2nd order method can handle also first order observables, but
         1st order method may be more efficient unless it's really easy to
@@ -158,13 +158,17 @@ class CVQNode(JacobianQNode):
             force_order2 (bool): iff True, use the order-2 method even if not necessary
 
         Returns:
-            array[float]: partial derivative of the node
+            tuple[list[tuple], callable]: circuits to execute, and a function mapping
+            the list of their results to the partial derivative of the node
         """
         force_order2 = options.get("force_order2", False)
 
         n = self.num_variables
         w = self.num_wires
-        pd = np.zeros(self.output_dim)
+        circuits = []
+        # one entry per operator: (multiplier, None) for the basic method,
+        # (None, observable indices) for the order-2 method
+        terms = []
         # find the Operators in which the free parameter appears, use the product rule
         for op, p_idx in self.variable_deps[idx]:
 
@@ -188,10 +192,10 @@ class CVQNode(JacobianQNode):
             if not force_order2 and op.use_method != "B":
                 # basic parameter-shift method, for Gaussian CV gates
                 # succeeded by order-1 observables
-                # evaluate the circuit at two points with shifted parameter values
-                y2 = np.asarray(self.evaluate(shift_p1, kwargs))
-                y1 = np.asarray(self.evaluate(shift_p2, kwargs))
-                pd += (y2 - y1) * multiplier
+                # the circuit at two points with shifted parameter values
+                circuits.append(self._bound_circuit(shift_p1, kwargs))
+                circuits.append(self._bound_circuit(shift_p2, kwargs))
+                terms.append((multiplier, None))
             else:
                 # order-2 parameter-shift method, for gaussian CV gates
                 # succeeded by order-2 observables
@@ -226,19 +230,34 @@ class CVQNode(JacobianQNode):
                 # Measure the transformed observables.
                 # The other observables do not depend on this parameter instance,
                 # hence their partial derivatives are zero.
-                res = self.evaluate_obs(obs, unshifted_args, kwargs)
+                circuits.append(self._bound_circuit(unshifted_args, kwargs, obs=obs))
 
-                # add the measured pd's to the correct locations
+                # the measured pd's belong to these locations
                 inds = [self.circuit.observables.index(x) for x in desc]
-                pd[inds] += res
+                terms.append((None, inds))
 
             # restore the original parameter
             op.params[p_idx] = orig
 
-        return pd
+        def postprocess(results):
+            pd = np.zeros(self.output_dim)
+            k = 0
+            for multiplier, inds in terms:
+                if inds is None:
+                    y2 = np.asarray(self.output_conversion(results[k]))
+                    y1 = np.asarray(self.output_conversion(results[k + 1]))
+                    pd += (y2 - y1) * multiplier
+                    k += 2
+                else:
+                    # add the measured pd's to the correct locations
+                    pd[inds] += results[k]
+                    k += 1
+            return pd
+
+        return circuits, postprocess
 
     def _pd_analytic_var(self, idx, args, kwargs, **options):
-        """Partial derivative of the variance of an observable using the parameter-shift method.
+        """Circuits for the partial derivative of the variance of an observable using the parameter-shift method.
 
         Args:
             idx (int): flattened index of the parameter wrt. which the p.d. is computed
@@ -246,7 +265,8 @@ class CVQNode(JacobianQNode):
             kwargs (dict[str, Any]): auxiliary arguments
 
         Returns:
-            array[float]: partial derivative of the node
+            tuple[list[tuple], callable]: circuits to execute, and a function mapping
+            the list of their results to the partial derivative of the node
         """
         # boolean mask: elements are True where the return type is a variance, False for expectations
         where_var = [
@@ -278,24 +298,33 @@ class CVQNode(JacobianQNode):
             self.circuit.update_node(e, new)
             new_observables.append(new)
 
-        # calculate the analytic derivatives of the <A^2> observables
-        pdA2 = self._pd_analytic(idx, args, kwargs, force_order2=True)
+        # circuits for the analytic derivatives of the <A^2> observables
+        pdA2_circuits, pdA2_postprocess = self._pd_analytic(idx, args, kwargs, force_order2=True)
 
         # restore the original observables, but convert their return types to expectation
         for e, new in zip(var_observables, new_observables):
             self.circuit.update_node(new, e)
             e.return_type = ObservableReturnTypes.Expectation
 
-        # evaluate <A>
-        evA = np.asarray(self.evaluate(args, kwargs))
+        # circuit for <A>
+        evA_circuit = self._bound_circuit(args, kwargs)
 
-        # evaluate the analytic derivative of <A>
-        pdA = self._pd_analytic(idx, args, kwargs)
+        # circuits for the analytic derivative of <A>
+        pdA_circuits, pdA_postprocess = self._pd_analytic(idx, args, kwargs)
 
         # restore return types
         for e in var_observables:
             e.return_type = ObservableReturnTypes.Variance
 
-        # return d(var(A))/dp = d<A^2>/dp -2 * <A> * d<A>/dp for the variances,
-        # d<A>/dp for plain expectations
-        return np.where(where_var, pdA2 - 2 * evA * pdA, pdA)
+        n2 = len(pdA2_circuits)
+
+        def postprocess(results):
+            pdA2 = pdA2_postprocess(results[:n2])
+            evA = np.asarray(self.output_conversion(results[n2]))
+            pdA = pdA_postprocess(results[n2 + 1 :])
+
+            # return d(var(A))/dp = d<A^2>/dp -2 * <A> * d<A>/dp for the variances,
+            # d<A>/dp for plain expectations
+            return np.where(where_var, pdA2 - 2 * evA * pdA, pdA)
+
+        return pdA2_circuits + [evA_circuit] + pdA_circuits, postprocess
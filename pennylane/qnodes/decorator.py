@@ -16,6 +16,7 @@ QNode decorator.
 """
 from functools import lru_cache
 
+from .adjoint import AdjointQNode
 from .base import BaseQNode
 from .cv import CVQNode
 from .device_jacobian import DeviceJacobianQNode
@@ -24,7 +25,7 @@ from .qubit import QubitQNode
 
 
 PARAMETER_SHIFT_QNODES = {"qubit": QubitQNode, "cv": CVQNode}
-ALLOWED_DIFF_METHODS = ("best", "parameter-shift", "finite-diff")
+ALLOWED_DIFF_METHODS = ("best", "parameter-shift", "finite-diff", "adjoint")
 ALLOWED_INTERFACES = ("autograd", "numpy", "torch", "tf")
 
 
@@ -77,6 +78,12 @@ def QNode(func, device, *, interface="autograd", mutable=True, diff_method="best
 
             * ``"finite-diff"``: Uses numerical finite-differences.
 
+            * ``"adjoint"``: Uses the adjoint method of the device, which computes the
+              gradient using a single forward and backward pass through the circuit.
+              Only supported by statevector simulators such as ``default.qubit``.
+              Parameter-shift and finite-differences are used as a fallback for
+              operations without a generator.
+
             * ``None``: a non-differentiable QNode is returned.
 
         properties (dict[str->Any]): additional keyword properties passed to the QNode
@@ -97,7 +104,16 @@ def QNode(func, device, *, interface="autograd", mutable=True, diff_method="best
     model = device.capabilities().get("model", "qubit")
     device_jacobian = device.capabilities().get("provides_jacobian", False)
 
-    if device_jacobian and (diff_method == "best"):
+    if diff_method == "adjoint":
+        if not device.capabilities().get("provides_adjoint_jacobian", False):
+            raise ValueError(
+                "The {} device does not support the adjoint "
+                "differentiation method.".format(device.short_name)
+            )
+
+        node = AdjointQNode(func, device, mutable=mutable, properties=properties)
+
+    elif device_jacobian and (diff_method == "best"):
         # hand off differentiation to the device
         node = DeviceJacobianQNode(func, device, mutable=mutable, properties=properties)
 
@@ -177,6 +193,12 @@ def qnode(device, *, interface="autograd", mutable=True, diff_method="best", pro
 
             * ``"finite-diff"``: Uses numerical finite-differences.
 
+            * ``"adjoint"``: Uses the adjoint method of the device, which computes the
+              gradient using a single forward and backward pass through the circuit.
+              Only supported by statevector simulators such as ``default.qubit``.
+              Parameter-shift and finite-differences are used as a fallback for
+              operations without a generator.
+
             * ``None``: a non-differentiable QNode is returned.
 
         properties (dict[str->Any]): additional keyword properties passed to the QNode
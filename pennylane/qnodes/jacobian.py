@@ -15,6 +15,9 @@
 Differentiable quantum nodes.
 """
 from collections.abc import Iterable
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+import copy
+import weakref
 
 import numpy as np
 
@@ -35,6 +38,11 @@ class JacobianQNode(BaseQNode):
         """dict[int, str]: map from flattened quantum function positional parameter index
         to the gradient method to be used with that parameter"""
 
+        self._jacobian_pool = None
+        """tuple or None: type and size of the pool of workers executing the Jacobian
+        circuits, the pool itself, and the device replicas used by the threads; created on
+        the first parallel Jacobian evaluation and reused afterwards"""
+
     metric_tensor = None
 
     @property
@@ -146,6 +154,10 @@ class JacobianQNode(BaseQNode):
         * Device method (``'device'``): Delegates the computation of the Jacobian to the
           device executing the circuit.
 
+        * Adjoint method (``'adjoint'``): Delegates the computation of the Jacobian to the
+          :meth:`adjoint_jacobian` method of the device, which computes all the partial
+          derivatives using a single forward and backward pass through the circuit.
+
         .. note::
            The finite difference method is sensitive to statistical noise in the circuit output,
            since it compares the output at two points infinitesimally close to each other. Hence the
@@ -157,7 +169,8 @@ class JacobianQNode(BaseQNode):
             wrt (Sequence[int] or None): Indices of the flattened positional parameters with respect
                 to which to compute the Jacobian. None means all the parameters.
                 Note that you cannot compute the Jacobian with respect to the kwargs.
-            method (str): Jacobian computation method, in ``{'F', 'A', 'best', 'device'}``, see above
+            method (str): Jacobian computation method, in ``{'F', 'A', 'best', 'device', 'adjoint'}``,
+                see above
             options (dict[str, Any]): additional options for the computation methods
 
                 * h (float): finite difference method step size
@@ -218,7 +231,15 @@ class JacobianQNode(BaseQNode):
         if method == "device":
             self._set_variables(args, kwargs)
             return self.device.jacobian(
-                self.circuit.operations, self.circuit.observables, self.variable_deps
+                self.device_queue, self.circuit.observables, self.variable_deps
+            )
+
+        if method == "adjoint":
+            self._set_variables(args, kwargs)
+            return self.device.adjoint_jacobian(
+                self.device_queue,
+                self.circuit.observables,
+                {k: self.variable_deps[k] for k in wrt},
             )
 
         if method == "A":
@@ -244,22 +265,17 @@ class JacobianQNode(BaseQNode):
                 # the value of the circuit at args, computed only once here
                 options["y0"] = np.asarray(self.evaluate(args, kwargs))
 
-        # In the following, to evaluate the Jacobian we call self.evaluate several times using
-        # modified args (and possibly modified circuit Operators).
-        # We do not want evaluate to call _construct again. This would only be necessary if the
-        # auxiliary args changed, since only they can change the structure of the circuit,
-        # and we do not modify them. To achieve this, we temporarily make the circuit immutable.
-        mutable = self.mutable
-        self.mutable = False
-
         # flatten the nested Sequence of input arguments
         flat_args = np.array(list(_flatten(args)), dtype=float)
         variances_required = any(
             ob.return_type is ObservableReturnTypes.Variance for ob in self.circuit.observables
         )
 
-        # compute the partial derivative wrt. each parameter using the appropriate method
-        grad = np.zeros((self.output_dim, len(wrt)), dtype=float)
+        # Construct the circuits required for the partial derivative wrt. each parameter,
+        # using the appropriate method. The circuits are bound to the shifted parameter values,
+        # so they can all be submitted to the device in a single batch.
+        circuits = []
+        recipes = []
         for i, k in enumerate(wrt):
             par_method = method[k]
 
@@ -269,19 +285,104 @@ class JacobianQNode(BaseQNode):
 
             if par_method == "A":
                 if variances_required:
-                    grad[:, i] = self._pd_analytic_var(k, flat_args, kwargs, **options)
+                    pd_circuits, postprocess = self._pd_analytic_var(k, flat_args, kwargs, **options)
                 else:
-                    grad[:, i] = self._pd_analytic(k, flat_args, kwargs, **options)
+                    pd_circuits, postprocess = self._pd_analytic(k, flat_args, kwargs, **options)
             elif par_method == "F":
-                grad[:, i] = self._pd_finite_diff(k, flat_args, kwargs, **options)
+                pd_circuits, postprocess = self._pd_finite_diff(k, flat_args, kwargs, **options)
             else:
                 raise ValueError("Unknown gradient method.")
 
-        self.mutable = mutable  # restore original mutability
+            recipes.append((i, len(pd_circuits), postprocess))
+            circuits.extend(pd_circuits)
+
+        results = self._execute_circuits(circuits) if circuits else []
+
+        # compute the partial derivatives from the results of the executed circuits
+        grad = np.zeros((self.output_dim, len(wrt)), dtype=float)
+        start = 0
+        for i, num_circuits, postprocess in recipes:
+            grad[:, i] = postprocess(results[start : start + num_circuits])
+            start += num_circuits
+
         return grad
 
+    def _execute_circuits(self, circuits):
+        """Execute the circuits required for the Jacobian.
+
+        If the ``"jacobian_workers"`` property of the node is larger than one, the circuits are
+        split into contiguous chunks, one for each worker. Each chunk is executed by a separate
+        copy of the device, so that the workers do not share any device state, using a pool
+        of threads, or of processes if the ``"jacobian_pool"`` property is ``"process"``.
+        The pool and the device copies are kept by the node and reused by later calls.
+
+        Args:
+            circuits (list[tuple[list[Operation], list[Observable]]]): circuits with their
+                parameters bound, in the form of (operation queue, observables) pairs
+
+        Returns:
+            list[array[float]]: measured value(s) for each circuit, in the order the
+            circuits were given
+        """
+        workers = min(self.properties.get("jacobian_workers", 1), len(circuits))
+
+        if workers <= 1:
+            return self.device.batch_execute(circuits)
+
+        chunk_size = -(-len(circuits) // workers)  # ceiling division
+        chunks = [circuits[i : i + chunk_size] for i in range(0, len(circuits), chunk_size)]
+
+        executor, replicas = self._get_jacobian_pool()
+        chunk_results = list(executor.map(_batch_execute, replicas[: len(chunks)], chunks))
+
+        return [res for chunk in chunk_results for res in chunk]
+
+    def _get_jacobian_pool(self):
+        """Pool of workers and device replicas executing the Jacobian circuits.
+
+        The pool is created on the first call, with as many workers as the
+        ``"jacobian_workers"`` property, and shut down when the node is garbage collected.
+
+        Returns:
+            tuple[Executor, list[Device]]: the pool of workers, and a device for each worker
+        """
+        pool = self.properties.get("jacobian_pool", "thread")
+        if pool not in ("thread", "process"):
+            raise ValueError("Unknown Jacobian worker pool {}.".format(pool))
+
+        workers = self.properties["jacobian_workers"]
+
+        if self._jacobian_pool is None or self._jacobian_pool[:2] != (pool, workers):
+            if self._jacobian_pool is not None:
+                # the properties of the node have changed since the pool was created
+                self._jacobian_pool[2].shutdown(wait=False)
+
+            if pool == "process":
+                executor = ProcessPoolExecutor(max_workers=workers)
+                replicas = None
+            else:
+                executor = ThreadPoolExecutor(max_workers=workers)
+                replicas = [copy.deepcopy(self.device) for _ in range(workers)]
+
+            weakref.finalize(self, executor.shutdown, wait=False)
+            self._jacobian_pool = pool, workers, executor, replicas
+
+        _, _, executor, replicas = self._jacobian_pool
+
+        if replicas is None:
+            # each process receives its own copy of the device when the arguments are pickled
+            return executor, [self.device] * workers
+
+        # the device settings may have been changed since the replicas were created
+        for replica in replicas:
+            replica.shots = self.device.shots
+            if hasattr(self.device, "analytic"):
+                replica.analytic = self.device.analytic
+
+        return executor, replicas
+
     def _pd_finite_diff(self, idx, args, kwargs, **options):
-        """Partial derivative of the node using the finite difference method.
+        """Circuits for the partial derivative of the node using the finite difference method.
 
         Args:
             idx (int): flattened index of the parameter wrt. which the p.d. is computed
@@ -294,7 +395,8 @@ class JacobianQNode(BaseQNode):
             order (int): finite difference method order, 1 or 2
 
         Returns:
-            array[float]: partial derivative of the node
+            tuple[list[tuple], callable]: circuits to execute, and a function mapping
+            the list of their results to the partial derivative of the node
         """
         y0 = options.get("y0", None)
         h = options.get("h", 1e-7)
@@ -304,22 +406,27 @@ class JacobianQNode(BaseQNode):
         if order == 1:
             # shift the parameter by h
             shift_args[idx] += h
-            y = np.asarray(self.evaluate(shift_args, kwargs))
-            return (y - y0) / h
-
-        if order == 2:
+            circuits = [self._bound_circuit(shift_args, kwargs)]
+        elif order == 2:
             # symmetric difference
             # shift the parameter by +-h/2
             shift_args[idx] += 0.5 * h
-            y2 = np.asarray(self.evaluate(shift_args, kwargs))
+            circuits = [self._bound_circuit(shift_args, kwargs)]
             shift_args[idx] = args[idx] - 0.5 * h
-            y1 = np.asarray(self.evaluate(shift_args, kwargs))
-            return (y2 - y1) / h
+            circuits.append(self._bound_circuit(shift_args, kwargs))
+        else:
+            raise ValueError("Order must be 1 or 2.")
+
+        def postprocess(results):
+            y = [np.asarray(self.output_conversion(r)) for r in results]
+            # the first order difference is taken wrt. the unshifted value y0
+            y1 = y[1] if order == 2 else y0
+            return (y[0] - y1) / h
 
-        raise ValueError("Order must be 1 or 2.")
+        return circuits, postprocess
 
     def _pd_analytic(self, idx, args, kwargs, **options):
-        """Partial derivative of the node using an analytic method.
+        """Circuits for the partial derivative of the node using an analytic method.
 
         Args:
             idx (int): flattened index of the parameter wrt. which the p.d. is computed
@@ -327,12 +434,13 @@ class JacobianQNode(BaseQNode):
             kwargs (dict[str, Any]): auxiliary arguments
 
         Returns:
-            array[float]: partial derivative of the node
+            tuple[list[tuple], callable]: circuits to execute, and a function mapping
+            the list of their results to the partial derivative of the node
         """
         raise NotImplementedError
 
     def _pd_analytic_var(self, idx, args, kwargs, **options):
-        """Partial derivative of the variance of an observable using an analytic method.
+        """Circuits for the partial derivative of the variance of an observable using an analytic method.
 
         Args:
             idx (int): flattened index of the parameter wrt. which the p.d. is computed
@@ -340,7 +448,8 @@ class JacobianQNode(BaseQNode):
             kwargs (dict[str, Any]): auxiliary arguments
 
         Returns:
-            array[float]: partial derivative of the node
+            tuple[list[tuple], callable]: circuits to execute, and a function mapping
+            the list of their results to the partial derivative of the node
         """
         raise NotImplementedError
 
@@ -396,3 +505,18 @@ class JacobianQNode(BaseQNode):
             ) from None
 
         return _to_autograd(self)
+
+
+def _batch_execute(device, circuits):
+    """Execute a batch of circuits on a device.
+
+    Defined at module level, so that it can be sent to the workers of a process pool.
+
+    Args:
+        device (~.Device): device to execute the circuits on
+        circuits (list[tuple[list[Operation], list[Observable]]]): circuits to execute
+
+    Returns:
+        list[array[float]]: measured value(s) for each circuit
+    """
+    return device.batch_execute(circuits)
@@ -104,17 +104,20 @@ class QubitQNode(JacobianQNode):
         return "A"
 
     def _pd_analytic(self, idx, args, kwargs, **options):
-        """Partial derivative of the node using the analytic parameter shift method.
+        """Circuits for the partial derivative of the node using the analytic parameter shift method.
+
         Args:
             idx (int): flattened index of the parameter wrt. which the p.d. is computed
             args (array[float]): flattened positional arguments at which to evaluate the p.d.
             kwargs (dict[str, Any]): auxiliary arguments
 
         Returns:
-            array[float]: partial derivative of the node
+            tuple[list[tuple], callable]: circuits to execute, and a function mapping
+            the list of their results to the partial derivative of the node
         """
         n = self.num_variables
-        pd = 0.0
+        circuits = []
+        multipliers = []
         # find the Operators in which the free parameter appears, use the product rule
         for op, p_idx in self.variable_deps[idx]:
 
@@ -135,18 +138,26 @@ class QubitQNode(JacobianQNode):
             shift_p1 = np.r_[args, args[idx] + shift]
             shift_p2 = np.r_[args, args[idx] - shift]
 
-            # evaluate the circuit at two points with shifted parameter values
-            y2 = np.asarray(self.evaluate(shift_p1, kwargs))
-            y1 = np.asarray(self.evaluate(shift_p2, kwargs))
-            pd += (y2 - y1) * multiplier
+            # the circuit at two points with shifted parameter values
+            circuits.append(self._bound_circuit(shift_p1, kwargs))
+            circuits.append(self._bound_circuit(shift_p2, kwargs))
+            multipliers.append(multiplier)
 
             # restore the original parameter
             op.params[p_idx] = orig
 
-        return pd
+        def postprocess(results):
+            pd = 0.0
+            for k, multiplier in enumerate(multipliers):
+                y2 = np.asarray(self.output_conversion(results[2 * k]))
+                y1 = np.asarray(self.output_conversion(results[2 * k + 1]))
+                pd += (y2 - y1) * multiplier
+            return pd
+
+        return circuits, postprocess
 
     def _pd_analytic_var(self, idx, args, kwargs, **options):
-        """Partial derivative of the variance of an observable using the parameter-shift method.
+        """Circuits for the partial derivative of the variance of an observable using the parameter-shift method.
 
         Args:
             idx (int): flattened index of the parameter wrt. which the p.d. is computed
@@ -154,7 +165,8 @@ class QubitQNode(JacobianQNode):
             kwargs (dict[str, Any]): auxiliary arguments
 
         Returns:
-            array[float]: partial derivative of the node
+            tuple[list[tuple], callable]: circuits to execute, and a function mapping
+            the list of their results to the partial derivative of the node
         """
         # boolean mask: elements are True where the return type is a variance, False for expectations
         where_var = [
@@ -187,27 +199,36 @@ class QubitQNode(JacobianQNode):
             self.circuit.update_node(e, new)
             new_observables.append(new)
 
-        # calculate the analytic derivatives of the <A^2> observables
-        pdA2 = self._pd_analytic(idx, args, kwargs)
+        # circuits for the analytic derivatives of the <A^2> observables
+        pdA2_circuits, pdA2_postprocess = self._pd_analytic(idx, args, kwargs)
 
         # restore the original observables, but convert their return types to expectation
         for e, new in zip(var_observables, new_observables):
             self.circuit.update_node(new, e)
             e.return_type = ObservableReturnTypes.Expectation
 
-        # evaluate <A>
-        evA = np.asarray(self.evaluate(args, kwargs))
+        # circuit for <A>
+        evA_circuit = self._bound_circuit(args, kwargs)
 
-        # evaluate the analytic derivative of <A>
-        pdA = self._pd_analytic(idx, args, kwargs)
+        # circuits for the analytic derivative of <A>
+        pdA_circuits, pdA_postprocess = self._pd_analytic(idx, args, kwargs)
 
         # restore return types
         for e in var_observables:
             e.return_type = ObservableReturnTypes.Variance
 
-        # return d(var(A))/dp = d<A^2>/dp -2 * <A> * d<A>/dp for the variances,
-        # d<A>/dp for plain expectations
-        return np.where(where_var, pdA2 - 2 * evA * pdA, pdA)
+        n2 = len(pdA2_circuits)
+
+        def postprocess(results):
+            pdA2 = pdA2_postprocess(results[:n2])
+            evA = np.asarray(self.output_conversion(results[n2]))
+            pdA = pdA_postprocess(results[n2 + 1 :])
+
+            # return d(var(A))/dp = d<A^2>/dp -2 * <A> * d<A>/dp for the variances,
+            # d<A>/dp for plain expectations
+            return np.where(where_var, pdA2 - 2 * evA * pdA, pdA)
+
+        return pdA2_circuits + [evA_circuit] + pdA_circuits, postprocess
 
     def _construct_metric_tensor(self, *, diag_approx=False):
         """Construct metric tensor subcircuits for qubit circuits.
@@ -366,7 +387,7 @@ class QubitQNode(JacobianQNode):
 
                 unitary_op = qml.QubitUnitary(V, wires=list(range(self.num_wires)), do_queue=False)
                 self.device.execute(circuit["queue"] + [unitary_op], circuit["observable"])
-                probs = list(self.device.probability().values())
+                probs = self.device.marginal_probability()
 
                 first_order_ev = np.zeros([len(params)])
                 second_order_ev = np.zeros([len(params), len(params)])
@@ -22,6 +22,7 @@ import numbers
 import functools
 import inspect
 import itertools
+import threading
 
 import numpy as np
 
@@ -203,6 +204,338 @@ def pauli_eigs(n):
         return np.array([1, -1])
     return np.concatenate([pauli_eigs(n - 1), -pauli_eigs(n - 1)])
 
+
+def _circuit_structure(operations, observables, fixed_params=False):
+    """Hashable description of the structure of a circuit.
+
+    Two circuits with the same structure contain the same operations and observables,
+    acting on the same wires, and may only differ in their parameter values.
+
+    Args:
+        operations (Iterable[~.Operation]): operation queue of the circuit
+        observables (Iterable[~.Observable]): observables measured by the circuit
+        fixed_params (bool): if True, the parameters of the state preparations and of the
+            observables are part of the structure, so that circuits with the same structure
+            only differ in their gate parameters
+
+    Returns:
+        tuple: the structure of the circuit
+    """
+
+    def param_bytes(op):
+        return np.asarray(list(_flatten(op.parameters))).tobytes()
+
+    ops = []
+    for op in operations:
+        if fixed_params and op.name in ("BasisState", "QubitStateVector"):
+            ops.append((op.name, tuple(op.wires), param_bytes(op)))
+        else:
+            ops.append((op.name, tuple(op.wires)))
+
+    obs = []
+    for ob in observables:
+        name = tuple(ob.name) if isinstance(ob.name, list) else ob.name
+        key = (name, tuple(_flatten(ob.wires)), ob.return_type)
+        obs.append(key + (param_bytes(ob),) if fixed_params else key)
+
+    return tuple(ops), tuple(obs)
+
+
+def _measurement_bases(names, wires, params):
+    """Measurement basis of each wire an observable acts on.
+
+    The basis of a wire is labelled by the factor of the (tensor product) observable
+    acting on it; two factors are measured in the same basis if and only if they are
+    identical. The identity does not constrain the basis of its wires.
+
+    Args:
+        names (str or list[str]): name of the observable, or the names of the factors
+            of a tensor product observable
+        wires (list[int] or list[list[int]]): subsystems the observable(s) act on
+        params (list[Any] or list[list[Any]]): parameters of the observable(s)
+
+    Returns:
+        dict[int, tuple]: mapping from each wire to the label of its measurement basis
+    """
+    if not isinstance(names, list):
+        names, wires, params = [names], [wires], [params]
+
+    bases = {}
+
+    for name, w, par in zip(names, wires, params):
+        if name == "Identity":
+            continue
+
+        w = tuple(_flatten(w))
+        label = (name, w, tuple(np.asarray(p).tobytes() for p in par))
+        bases.update({i: label for i in w})
+
+    return bases
+
+
+def group_observables(observables):
+    """Partition observables into groups of qubit-wise commuting observables.
+
+    Observables are qubit-wise commuting if, on every wire they share, their factors
+    are identical or one of them is the identity. All observables in a group can therefore
+    be estimated from the same samples, measured after a single basis rotation
+    (see :func:`measurement_rotations`). The observables are assigned greedily, in the
+    order they are given, to the first group they are compatible with.
+
+    **Example:**
+
+    >>> obs = [qml.PauliX(0) @ qml.PauliZ(1), qml.PauliY(1), qml.PauliZ(1) @ qml.PauliZ(2)]
+    >>> group_observables(obs)
+    [[0, 2], [1]]
+
+    Args:
+        observables (Iterable[~.Observable]): qubit observables
+
+    Returns:
+        list[list[int]]: indices of the observables in each group
+    """
+    groups = []
+    group_bases = []
+
+    for idx, obs in enumerate(observables):
+        bases = _measurement_bases(obs.name, obs.wires, obs.parameters)
+
+        for group, group_basis in zip(groups, group_bases):
+            if all(group_basis.get(w, label) == label for w, label in bases.items()):
+                group.append(idx)
+                group_basis.update(bases)
+                break
+        else:
+            groups.append([idx])
+            group_bases.append(bases)
+
+    return groups
+
+
+def measurement_rotations(observables):
+    """Operations rotating the state into the shared eigenbasis of a group of
+    qubit-wise commuting observables.
+
+    After the rotations, each of the observables is diagonal in the computational basis,
+    so that the observables can be estimated from the same computational basis samples.
+    Hermitian observables are rotated into the basis of the eigenvectors returned by
+    :func:`numpy.linalg.eigh`.
+
+    Args:
+        observables (Iterable[~.Observable]): qubit-wise commuting observables, for
+            example a group returned by :func:`group_observables`
+
+    Raises:
+        ValueError: if the observables are not qubit-wise commuting, or the rotation
+            into the eigenbasis of an observable is not known
+
+    Returns:
+        list[~.Operation]: the rotations
+    """
+    bases = {}
+    rotations = []
+
+    for obs in observables:
+        factors = obs.obs if isinstance(obs, qml.operation.Tensor) else [obs]
+
+        for factor in factors:
+            factor_bases = _measurement_bases(factor.name, factor.wires, factor.parameters)
+
+            if not factor_bases or all(bases.get(w) == l for w, l in factor_bases.items()):
+                # the identity, or a factor that has already been rotated
+                continue
+
+            if any(bases.setdefault(w, l) != l for w, l in factor_bases.items()):
+                raise ValueError("The observables are not qubit-wise commuting.")
+
+            w = factor.wires
+
+            if factor.name == "PauliZ":
+                continue
+
+            if factor.name == "PauliX":
+                rotations.append(qml.Hadamard(wires=w, do_queue=False))
+            elif factor.name == "PauliY":
+                rotations.extend(
+                    [
+                        qml.PauliZ(wires=w, do_queue=False),
+                        qml.S(wires=w, do_queue=False),
+                        qml.Hadamard(wires=w, do_queue=False),
+                    ]
+                )
+            elif factor.name == "Hadamard":
+                rotations.append(qml.RY(-np.pi / 4, wires=w, do_queue=False))
+            elif factor.name == "Hermitian":
+                U = spectral_cache[factor.parameters[0]]["eigvec"]
+                rotations.append(qml.QubitUnitary(U.conj().T, wires=w, do_queue=False))
+            else:
+                raise ValueError(
+                    "The rotation into the eigenbasis of {} is not known.".format(factor.name)
+                )
+
+    return rotations
+
+
+def _rotated_observable(obs):
+    """Diagonal observable that is measured in place of an observable, after the state
+    has been rotated by the operations returned by :func:`measurement_rotations`.
+
+    PauliX, PauliY and Hadamard factors are replaced by PauliZ, and Hermitian factors by
+    the diagonal matrix of their eigenvalues. PauliZ and Identity factors are kept.
+
+    Args:
+        obs (~.Observable): observable
+
+    Returns:
+        ~.Observable: the diagonal observable, with the return type of ``obs``
+    """
+    factors = obs.obs if isinstance(obs, qml.operation.Tensor) else [obs]
+    diagonal = []
+
+    for factor in factors:
+        if factor.name in ("PauliX", "PauliY", "Hadamard"):
+            diagonal.append(qml.PauliZ(wires=factor.wires, do_queue=False))
+        elif factor.name == "Hermitian":
+            w = spectral_cache[factor.parameters[0]]["eigval"]
+            diagonal.append(qml.Hermitian(np.diag(w), wires=factor.wires, do_queue=False))
+        else:
+            diagonal.append(factor.__class__(wires=factor.wires, do_queue=False))
+
+    if isinstance(obs, qml.operation.Tensor):
+        rotated = qml.operation.Tensor(*diagonal)
+    else:
+        rotated = diagonal[0]
+
+    rotated.return_type = obs.return_type
+    return rotated
+
+
+class SpectralCache:
+    """Least-recently-used cache of the eigendecompositions of Hermitian matrices.
+
+    Matrices are looked up by their shape, data type and raw data buffer, so that a lookup
+    hashes the bytes of the matrix rather than building a tuple of its elements. Each entry
+    stores the eigenvalues and eigenvectors returned by :func:`numpy.linalg.eigh`; the
+    projectors onto the eigenvectors are computed the first time they are requested,
+    and then kept with the entry. Lookups and evictions are guarded by a lock, so that
+    the cache can be shared by devices evaluating circuits in several threads.
+
+    **Example:**
+
+    >>> cache = SpectralCache(maxsize=2)
+    >>> entry = cache[np.array([[0, 1], [1, 0]])]
+    >>> entry["eigval"]
+    array([-1.,  1.])
+    >>> len(entry["projectors"])
+    2
+
+    Args:
+        maxsize (int): the maximum number of matrices to store the eigendecomposition of;
+            once exceeded, the least recently used entry is discarded
+    """
+
+    def __init__(self, maxsize=128):
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        self.maxsize = maxsize
+
+    @property
+    def maxsize(self):
+        """int: the maximum number of cached eigendecompositions"""
+        return self._maxsize
+
+    @maxsize.setter
+    def maxsize(self, maxsize):
+        if maxsize < 1:
+            raise ValueError("The size of the spectral cache must be at least one.")
+
+        with self._lock:
+            self._maxsize = maxsize
+            self._evict()
+
+    @staticmethod
+    def key(A):
+        """Cache key of a matrix.
+
+        Args:
+            A (array): the matrix
+
+        Returns:
+            tuple: the shape, data type and data buffer of the matrix
+        """
+        A = np.ascontiguousarray(A)
+        return A.shape, A.dtype.str, A.tobytes()
+
+    def __getitem__(self, A):
+        """Eigendecomposition of a Hermitian matrix.
+
+        Args:
+            A (array): Hermitian matrix
+
+        Returns:
+            dict: the eigenvalues ``"eigval"``, the eigenvectors ``"eigvec"`` (as the columns
+            of a matrix), and the list of hermitian projectors ``"projectors"`` such that
+            :math:`A = \\sum_k a_k P_k`
+        """
+        key = self.key(A)
+
+        with self._lock:
+            if key in self._entries:
+                self._entries.move_to_end(key)
+                return self._entries[key]
+
+        # the decomposition is computed outside of the lock, so that threads looking up
+        # other matrices are not blocked; if another thread stored the same matrix in
+        # the meantime, its entry is kept
+        w, U = np.linalg.eigh(np.asarray(A))
+        entry = _SpectralEntry(eigval=w, eigvec=U)
+
+        with self._lock:
+            entry = self._entries.setdefault(key, entry)
+            self._entries.move_to_end(key)
+            self._evict()
+
+        return entry
+
+    def __contains__(self, A):
+        key = self.key(A)
+
+        with self._lock:
+            return key in self._entries
+
+    def __len__(self):
+        return len(self._entries)
+
+    def clear(self):
+        """Remove all entries from the cache."""
+        with self._lock:
+            self._entries.clear()
+
+    def _evict(self):
+        # must be called while holding the lock
+        while len(self._entries) > self._maxsize:
+            self._entries.popitem(last=False)
+
+
+class _SpectralEntry(dict):
+    """Entry of the :class:`SpectralCache`, computing the projectors onto the
+    eigenvectors when they are first accessed."""
+
+    def __missing__(self, key):
+        if key != "projectors":
+            raise KeyError(key)
+
+        U = self["eigvec"]
+        self["projectors"] = [np.outer(U[:, k], U[:, k].conj()) for k in range(U.shape[1])]
+        return self["projectors"]
+
+
+spectral_cache = SpectralCache()
+"""SpectralCache: eigendecompositions of observable matrices, shared by the Hermitian
+observable and the simulator devices. The number of cached matrices can be changed
+by setting :attr:`SpectralCache.maxsize`."""
+
+
 class Recorder:
     """Recorder class used by the :class:`~.OperationRecorder`.
 
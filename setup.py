@@ -49,6 +49,9 @@ info = {
     'entry_points': {
         'pennylane.plugins': [
             'default.qubit = pennylane.plugins:DefaultQubit',
+            'default.qubit.autograd = pennylane.plugins:DefaultQubitAutograd',
+            'default.qubit.sparse = pennylane.plugins:DefaultQubitSparse',
+            'default.clifford = pennylane.plugins:DefaultClifford',
             'default.gaussian = pennylane.plugins:DefaultGaussian',
             'expt.tensornet = pennylane.beta.plugins.expt_tensornet:TensorNetwork',
             'expt.tensornet.tf = pennylane.beta.plugins.expt_tensornet_tf:TensorNetworkTF'
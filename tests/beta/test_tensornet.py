@@ -882,3 +882,353 @@ class TestTensorSample:
             )
         ) / 16
         assert np.allclose(var, expected, atol=tol, rtol=0)
+
+
+def mps_queue():
+    """Returns an operation queue on 5 wires containing operations on
+    adjacent, non-adjacent and unordered wires"""
+    return [
+        qml.BasisState(np.array([1, 0, 1, 1, 0]), wires=[0, 1, 2, 3, 4]),
+        qml.Hadamard(wires=0),
+        qml.RY(0.4, wires=2),
+        qml.CNOT(wires=[0, 1]),
+        qml.CRX(0.3, wires=[4, 1]),
+        qml.Toffoli(wires=[3, 0, 2]),
+        qml.QubitUnitary(U2, wires=[3, 1]),
+        qml.Rot(0.1, 0.2, 0.3, wires=4),
+        qml.CSWAP(wires=[1, 4, 2]),
+        qml.CZ(wires=[2, 3]),
+    ]
+
+
+class TestMatrixProductState:
+    """Tests for the matrix product state representation of expt.tensornet"""
+
+    @pytest.mark.parametrize(
+        "obs",
+        [
+            qml.expval(qml.PauliX(0) @ qml.PauliY(2)),
+            qml.expval(qml.PauliZ(4) @ qml.Hermitian(U_swap, wires=[3, 0])),
+            qml.var(qml.Hermitian(H, wires=1) @ qml.PauliZ(3)),
+            qml.var(qml.Hadamard(2)),
+        ],
+    )
+    def test_agrees_with_default_qubit(self, obs, tol):
+        """Test that the expectation values and variances agree with default.qubit"""
+        dev = qml.device("expt.tensornet", wires=5, representation="mps")
+        res = dev.execute(mps_queue(), [obs])
+        expected = qml.device("default.qubit", wires=5).execute(mps_queue(), [obs])
+
+        assert np.allclose(res, expected, atol=tol, rtol=0)
+        assert dev.truncation_error < tol
+
+    def test_state(self, tol):
+        """Test that the contracted matrix product state agrees with default.qubit"""
+        dev = qml.device("expt.tensornet", wires=5, representation="mps")
+        dev.execute(mps_queue(), [qml.expval(qml.PauliZ(0))])
+
+        expected = qml.device("default.qubit", wires=5)
+        expected.execute(mps_queue(), [qml.expval(qml.PauliZ(0))])
+
+        assert np.allclose(dev._state.flatten(), expected._state, atol=tol, rtol=0)
+
+    def test_short_basis_state(self, tol):
+        """Test that the wires beyond a short basis state are prepared in the |0> state"""
+        dev = qml.device("expt.tensornet", wires=3, representation="mps")
+        dev.reset()
+        dev.apply("BasisState", [], [np.array([1, 1])])
+
+        assert len(dev._site_nodes) == 3
+        assert np.allclose(dev._state[1, 1, 0], 1, atol=tol, rtol=0)
+
+    def test_state_vector(self, tol):
+        """Test that a state vector is split into a matrix product state"""
+        state = np.array([1, 0, 0, 1j, 0, 1, -1, 0]) / 2
+        dev = qml.device("expt.tensornet", wires=3, representation="mps")
+        dev.reset()
+        dev.apply("QubitStateVector", [0, 1, 2], [state])
+
+        assert np.allclose(dev._state.flatten(), state, atol=tol, rtol=0)
+        assert dev._site_nodes[1].tensor.shape == (2, 2, 2)
+
+    def test_many_wires(self, tol):
+        """Test a shallow circuit on 100 wires"""
+        n = 100
+        dev = qml.device("expt.tensornet", wires=n, representation="mps")
+        ops = [qml.Hadamard(wires=0)] + [qml.CNOT(wires=[i, i + 1]) for i in range(n - 1)]
+        ops += [qml.RX(0.3, wires=50), qml.CZ(wires=[10, 90])]
+
+        res = dev.execute(
+            ops,
+            [
+                qml.expval(qml.PauliZ(0) @ qml.PauliZ(99)),
+                qml.expval(qml.PauliZ(50)),
+                qml.var(qml.PauliX(3)),
+            ],
+        )
+
+        assert max(node.tensor.shape[2] for node in dev._site_nodes) == 2
+        assert np.allclose(res, [1, 0, 1], atol=tol, rtol=0)
+
+    def test_truncation_error(self, tol):
+        """Test that the discarded weight is reported if the bond dimension is limited"""
+        theta = 0.4
+        dev = qml.device("expt.tensornet", wires=2, representation="mps", max_bond_dim=1)
+        res = dev.execute(
+            [qml.RY(theta, wires=0), qml.CNOT(wires=[0, 1])], [qml.expval(qml.PauliZ(1))]
+        )
+
+        # the larger Schmidt coefficient is kept
+        assert np.allclose(dev.truncation_error, np.sin(theta / 2) ** 2, atol=tol, rtol=0)
+        assert np.allclose(res, 1, atol=tol, rtol=0)
+
+        dev.reset()
+        assert dev.truncation_error == 0
+
+    def test_unknown_representation(self):
+        """Test that an exception is raised for an unknown state representation"""
+        with pytest.raises(ValueError, match="Unknown state representation"):
+            qml.device("expt.tensornet", wires=2, representation="peps")
+
+
+class TestDeferredContraction:
+    """Tests for the deferred contraction of expt.tensornet"""
+
+    @pytest.mark.parametrize("contraction", ["greedy", "optimal"])
+    @pytest.mark.parametrize(
+        "obs",
+        [
+            qml.expval(qml.PauliX(0) @ qml.PauliY(2)),
+            qml.expval(qml.PauliZ(4) @ qml.Hermitian(U_swap, wires=[3, 0])),
+            qml.var(qml.Hermitian(H, wires=1) @ qml.PauliZ(3)),
+        ],
+    )
+    def test_agrees_with_default_qubit(self, contraction, obs, tol):
+        """Test that the expectation values and variances agree with default.qubit"""
+        dev = qml.device("expt.tensornet", wires=5, contraction=contraction)
+        res = dev.execute(mps_queue(), [obs])
+        expected = qml.device("default.qubit", wires=5).execute(mps_queue(), [obs])
+
+        assert np.allclose(res, expected, atol=tol, rtol=0)
+
+    def test_state(self, tol):
+        """Test that the contracted state agrees with default.qubit"""
+        dev = qml.device("expt.tensornet", wires=5, contraction="greedy")
+        dev.execute(mps_queue(), [qml.expval(qml.PauliZ(0))])
+
+        expected = qml.device("default.qubit", wires=5)
+        expected.execute(mps_queue(), [qml.expval(qml.PauliZ(0))])
+
+        assert np.allclose(dev._state.flatten(), expected._state, atol=tol, rtol=0)
+
+    def test_path_cached(self, monkeypatch):
+        """Test that the contraction path is only searched for once per circuit structure"""
+        from pennylane.beta.plugins import expt_tensornet
+
+        calls = []
+        greedy_path = expt_tensornet._greedy_path
+
+        def spy(inputs, sizes):
+            calls.append(len(inputs))
+            return greedy_path(inputs, sizes)
+
+        monkeypatch.setattr(expt_tensornet, "_greedy_path", spy)
+        dev = qml.device("expt.tensornet", wires=3, contraction="greedy")
+
+        for x in [0.1, 0.2, 0.3]:
+            ops = [qml.RX(x, wires=0), qml.CNOT(wires=[0, 2])]
+            dev.execute(ops, [qml.expval(qml.PauliZ(2))])
+
+        assert len(calls) == 1
+
+        dev.execute([qml.RX(0.1, wires=0), qml.CNOT(wires=[0, 1])], [qml.expval(qml.PauliZ(2))])
+        assert len(calls) == 2
+        assert len(dev._paths) == 2
+
+    def test_optimal_path(self):
+        """Test that the exhaustive search finds a contraction path no more
+        expensive than the greedy heuristic"""
+        from pennylane.beta.plugins.expt_tensornet import _greedy_path, _optimal_path
+
+        # a ring of 6 tensors with alternating bond dimensions
+        inputs = [frozenset([i, (i + 1) % 6]) for i in range(6)]
+        sizes = {i: 2 if i % 2 else 10 for i in range(6)}
+
+        def cost(path):
+            tensors = dict(enumerate(inputs))
+            total = 0
+            for k, (a, b) in enumerate(path):
+                total += np.prod([sizes[e] for e in tensors[a] | tensors[b]])
+                tensors[len(inputs) + k] = tensors.pop(a) ^ tensors.pop(b)
+            assert list(tensors.values()) == [frozenset()]
+            return total
+
+        assert cost(_optimal_path(inputs, sizes)) <= cost(_greedy_path(inputs, sizes))
+
+    def test_many_wires(self, tol):
+        """Test that a device with 40 wires can be created and contracted"""
+        n = 40
+        dev = qml.device("expt.tensornet", wires=n, contraction="greedy")
+        ops = [qml.Hadamard(wires=0)] + [qml.CNOT(wires=[i, i + 1]) for i in range(n - 1)]
+
+        res = dev.execute(
+            ops, [qml.expval(qml.PauliZ(0) @ qml.PauliZ(n - 1)), qml.expval(qml.PauliX(5))]
+        )
+        assert np.allclose(res, [1, 0], atol=tol, rtol=0)
+
+    def test_invalid_contraction(self):
+        """Test that an exception is raised for an unknown contraction strategy,
+        or a deferred contraction of a matrix product state"""
+        with pytest.raises(ValueError, match="Unknown contraction strategy"):
+            qml.device("expt.tensornet", wires=2, contraction="random")
+
+        with pytest.raises(ValueError, match="contracted eagerly"):
+            qml.device("expt.tensornet", wires=2, representation="mps", contraction="greedy")
+
+
+class TestReducedDensityMatrix:
+    """Tests for the measurements read from the reduced density matrices of expt.tensornet"""
+
+    @pytest.mark.parametrize(
+        "kwargs", [{}, {"contraction": "greedy"}, {"representation": "mps"}]
+    )
+    def test_agrees_with_default_qubit(self, kwargs, tol):
+        """Test that the expectation values, variances and probabilities agree with
+        default.qubit"""
+        obs = [
+            qml.expval(qml.PauliX(0) @ qml.PauliY(2)),
+            qml.var(qml.Hermitian(H, wires=1) @ qml.PauliZ(3)),
+            qml.expval(qml.Hermitian(U_swap, wires=[3, 0])),
+        ]
+
+        dev = qml.device("expt.tensornet", wires=5, **kwargs)
+        expected = qml.device("default.qubit", wires=5)
+        assert np.allclose(
+            dev.execute(mps_queue(), obs), expected.execute(mps_queue(), obs), atol=tol, rtol=0
+        )
+
+        obs = [qml.probs(wires=[4, 1, 2])]
+        assert np.allclose(
+            dev.execute(mps_queue(), obs), expected.execute(mps_queue(), obs), atol=tol, rtol=0
+        )
+
+    def test_computed_once(self, monkeypatch, tol):
+        """Test that the network of the state is only contracted once per execution"""
+        dev = qml.device("expt.tensornet", wires=4)
+        calls = []
+        contract = dev._network_reduced_density_matrix
+
+        def spy(wires):
+            calls.append(wires)
+            return contract(wires)
+
+        monkeypatch.setattr(dev, "_network_reduced_density_matrix", spy)
+
+        ops = [qml.Hadamard(wires=0), qml.CNOT(wires=[0, 1]), qml.RX(0.3, wires=3)]
+        obs = [
+            qml.expval(qml.PauliZ(0)),
+            qml.var(qml.PauliZ(0) @ qml.PauliZ(1)),
+            qml.expval(qml.PauliZ(3)),
+            qml.expval(qml.PauliX(0) @ qml.PauliX(1)),
+        ]
+        res = dev.execute(ops, obs)
+
+        assert calls == [(0, 1, 3)]
+        assert np.allclose(res, [0, 0, np.cos(0.3), 1], atol=tol, rtol=0)
+
+        # the cached reduced density matrices are discarded when the state changes
+        dev.apply("PauliX", [3], [])
+        assert np.allclose(dev.expval("PauliZ", [3], []), -np.cos(0.3), atol=tol, rtol=0)
+        assert calls == [(0, 1, 3), (3,)]
+
+    def test_sample_many_observables(self, monkeypatch, tol):
+        """Test that the probabilities of the samples of a tensor product of
+        many observables are read from the reduced density matrix"""
+        dev = qml.device("expt.tensornet", wires=6)
+        dev.reset()
+        dev.apply("RY", [0], [0.4])
+        for i in range(5):
+            dev.apply("CNOT", [i, i + 1], [])
+
+        with monkeypatch.context() as m:
+            m.setattr("numpy.random.choice", lambda x, y, p: (x, p))
+            s, p = dev.sample(["PauliZ"] * 6, [[i] for i in range(6)], [[]] * 6)
+
+        assert len(s) == 2 ** 6
+        assert np.allclose(s @ p, 1, atol=tol, rtol=0)
+        # the eigenvalues are in ascending order, so that the first outcome is |111111>
+        assert np.allclose(p[0], np.sin(0.2) ** 2, atol=tol, rtol=0)
+        assert np.allclose(p[-1], np.cos(0.2) ** 2, atol=tol, rtol=0)
+
+    def test_many_measured_wires(self, tol):
+        """Test that observables acting on more wires than the reduced density
+        matrices are contracted with the state directly"""
+        n = 12
+        dev = qml.device("expt.tensornet", wires=n, representation="mps")
+        ops = [qml.Hadamard(wires=0)] + [qml.CNOT(wires=[i, i + 1]) for i in range(n - 1)]
+
+        obs = qml.PauliX(0)
+        for i in range(1, n):
+            obs = obs @ qml.PauliX(i)
+
+        res = dev.execute(ops, [qml.expval(obs), qml.var(obs)])
+        assert dev._rdm_cache == {}
+        assert np.allclose(res, [1, 0], atol=tol, rtol=0)
+
+
+class TestSeparableState:
+    """Tests for the separable factors of the state of expt.tensornet"""
+
+    def test_initial_state(self):
+        """Test that the initial state of a device with 40 wires has one factor per wire"""
+        dev = qml.device("expt.tensornet", wires=40)
+
+        assert len(dev._factors) == 40
+        assert all(A.shape == (2,) and wires == (w,) for w, (A, wires) in enumerate(dev._factors))
+
+    def test_basis_state(self):
+        """Test that a basis state is prepared with one factor per wire"""
+        dev = qml.device("expt.tensornet", wires=3)
+        dev.reset()
+        dev.apply("BasisState", [0, 1, 2], [np.array([1, 0, 1])])
+
+        assert [wires for _, wires in dev._factors] == [(0,), (1,), (2,)]
+        assert np.allclose(dev._state[1, 0, 1], 1)
+
+    def test_short_basis_state(self):
+        """Test that the wires beyond a short basis state are prepared in the |0> state"""
+        dev = qml.device("expt.tensornet", wires=3)
+        dev.reset()
+        dev.apply("BasisState", [], [np.array([1, 1])])
+
+        assert [wires for _, wires in dev._factors] == [(0,), (1,), (2,)]
+        assert np.allclose(dev._state[1, 1, 0], 1)
+
+    def test_factors_merged(self, tol):
+        """Test that the factors are only merged by operations acting on several of them"""
+        n = 40
+        dev = qml.device("expt.tensornet", wires=n)
+        ops = [
+            qml.Hadamard(wires=0),
+            qml.CNOT(wires=[0, 1]),
+            qml.RX(0.3, wires=2),
+            qml.PauliX(wires=3),
+            qml.CNOT(wires=[3, 4]),
+            qml.CRY(0.4, wires=[5, 4]),
+        ]
+        obs = [
+            qml.expval(qml.PauliZ(0) @ qml.PauliZ(1)),
+            qml.expval(qml.PauliZ(2)),
+            qml.var(qml.PauliZ(4) @ qml.PauliZ(n - 1)),
+            qml.probs(wires=[1, 0]),
+        ]
+        res = dev.execute(ops, obs)
+
+        factor_wires = sorted(wires for _, wires in dev._factors)
+        assert factor_wires[:4] == [(0, 1), (2,), (3, 4, 5), (6,)]
+        assert len(factor_wires) == n - 3
+
+        assert np.allclose(res[0], 1, atol=tol, rtol=0)
+        assert np.allclose(res[1], np.cos(0.3), atol=tol, rtol=0)
+        assert np.allclose(res[2], 0, atol=tol, rtol=0)
+        assert np.allclose(res[3], [0.5, 0, 0, 0.5], atol=tol, rtol=0)
@@ -214,6 +214,143 @@ class TestHamiltonian:
             H = qml.beta.vqe.Hamiltonian(coeffs, obs)
 
 
+PAULI_HAMILTONIANS = [
+    ((0.5, -0.2, 0.3), (qml.PauliZ(0), qml.PauliX(0) @ qml.PauliY(1), qml.PauliY(2) @ qml.PauliX(0))),
+    ((1.1, 0.4), (qml.Identity(0), qml.PauliZ(2) @ qml.PauliZ(1))),
+    ((-0.7,), (qml.PauliY(0) @ qml.PauliY(1) @ qml.PauliY(2),)),
+]
+
+
+def dense_matrix(coeffs, observables, num_wires):
+    """Dense matrix of a Hamiltonian consisting of Pauli words"""
+    paulis = {
+        "Identity": np.eye(2),
+        "PauliX": np.array([[0, 1], [1, 0]]),
+        "PauliY": np.array([[0, -1j], [1j, 0]]),
+        "PauliZ": np.diag([1, -1]),
+    }
+    H = 0
+    for c, obs in zip(coeffs, observables):
+        factors = obs.obs if isinstance(obs, qml.operation.Tensor) else [obs]
+        ops = {f.wires[0]: paulis[f.name] for f in factors}
+        term = np.eye(1)
+        for w in range(num_wires):
+            term = np.kron(term, ops.get(w, np.eye(2)))
+        H = H + c * term
+    return H
+
+
+class TestPauliHamiltonian:
+    """Test the PauliHamiltonian class"""
+
+    @pytest.mark.parametrize("coeffs, ops", PAULI_HAMILTONIANS)
+    def test_masks(self, coeffs, ops):
+        """Tests that the masks represent the Pauli words"""
+        H = qml.beta.vqe.PauliHamiltonian.from_hamiltonian(qml.beta.vqe.Hamiltonian(coeffs, ops))
+        assert np.array_equal(H.coeffs, coeffs)
+        assert H.num_wires == 3
+        assert len(H) == len(coeffs)
+
+        for x, z, obs in zip(H.x_mask, H.z_mask, ops):
+            factors = obs.obs if isinstance(obs, qml.operation.Tensor) else [obs]
+            names = {f.wires[0]: f.name for f in factors}
+            for w in range(3):
+                expected = {
+                    (False, False): "Identity",
+                    (True, False): "PauliX",
+                    (False, True): "PauliZ",
+                    (True, True): "PauliY",
+                }[(x[w], z[w])]
+                assert names.get(w, "Identity") == expected
+
+    @pytest.mark.parametrize("coeffs, ops", PAULI_HAMILTONIANS)
+    def test_sparse_matrix(self, coeffs, ops, tol):
+        """Tests that the sparse matrix of the Hamiltonian is correct"""
+        H = qml.beta.vqe.PauliHamiltonian.from_hamiltonian(qml.beta.vqe.Hamiltonian(coeffs, ops))
+        res = H.sparse_matrix()
+
+        assert res is H.sparse_matrix()
+        assert np.allclose(res.toarray(), dense_matrix(coeffs, ops, 3), atol=tol, rtol=0)
+
+    @pytest.mark.parametrize("coeffs, ops", PAULI_HAMILTONIANS)
+    def test_round_trip(self, coeffs, ops, tol):
+        """Tests that the Hamiltonian can be converted back to observables"""
+        H = qml.beta.vqe.PauliHamiltonian.from_hamiltonian(qml.beta.vqe.Hamiltonian(coeffs, ops))
+        res_coeffs, res_ops = H.terms
+
+        assert np.allclose(res_coeffs, coeffs, atol=tol, rtol=0)
+        assert np.allclose(
+            dense_matrix(res_coeffs, res_ops, 3), dense_matrix(coeffs, ops, 3), atol=tol, rtol=0
+        )
+
+    def test_simplify(self, tol):
+        """Tests that terms with the same Pauli word are merged"""
+        ops = [
+            qml.PauliX(0) @ qml.PauliZ(1),
+            qml.PauliY(1),
+            qml.PauliZ(1) @ qml.PauliX(0),
+            qml.PauliY(1) @ qml.Identity(0),
+            qml.PauliZ(0),
+        ]
+        H = qml.beta.vqe.Hamiltonian([0.5, 0.2, 0.25, -0.2, 1.0], ops)
+        P = qml.beta.vqe.PauliHamiltonian.from_hamiltonian(H)
+        res = P.simplify()
+
+        assert len(res) == 2
+        assert np.allclose(
+            res.sparse_matrix().toarray(), P.sparse_matrix().toarray(), atol=tol, rtol=0
+        )
+        assert sorted(res.coeffs) == [0.75, 1.0]
+
+    def test_save_load(self, tmpdir):
+        """Tests that the Hamiltonian can be saved to and loaded from a file"""
+        coeffs, ops = PAULI_HAMILTONIANS[0]
+        H = qml.beta.vqe.PauliHamiltonian.from_hamiltonian(qml.beta.vqe.Hamiltonian(coeffs, ops))
+
+        filename = str(tmpdir.join("hamiltonian.npz"))
+        H.save(filename)
+        res = qml.beta.vqe.PauliHamiltonian.load(filename)
+
+        assert np.array_equal(res.coeffs, H.coeffs)
+        assert np.array_equal(res.x_mask, H.x_mask)
+        assert np.array_equal(res.z_mask, H.z_mask)
+
+    @pytest.mark.parametrize("coeffs, ops", PAULI_HAMILTONIANS)
+    def test_expval(self, coeffs, ops, tol):
+        """Tests that the expectation value in the state of a statevector device agrees
+        with the cost function"""
+        dev = qml.device("default.qubit", wires=3)
+        hamiltonian = qml.beta.vqe.Hamiltonian(coeffs, ops)
+        params = qml.init.strong_ent_layers_normal(n_layers=2, n_wires=3, seed=4)
+        ansatz = qml.templates.layers.StronglyEntanglingLayers
+
+        expected = qml.beta.vqe.cost([params], ansatz, hamiltonian, dev)
+
+        H = qml.beta.vqe.PauliHamiltonian.from_hamiltonian(hamiltonian)
+        assert np.allclose(H.expval(dev._state), expected, atol=tol, rtol=0)
+
+        cost = qml.beta.vqe.VQECost(ansatz, H, dev)
+        assert np.allclose(cost(params), expected, atol=tol, rtol=0)
+
+    def test_not_pauli_word(self):
+        """Tests that an exception is raised for observables that are not Pauli words"""
+        H = qml.beta.vqe.Hamiltonian((1.0,), [qml.Hermitian(H_ONE_QUBIT, 0)])
+        with pytest.raises(ValueError, match="Hermitian is not a Pauli operator"):
+            qml.beta.vqe.PauliHamiltonian.from_hamiltonian(H)
+
+        H = qml.beta.vqe.Hamiltonian((1.0,), [qml.PauliX(0) @ qml.PauliZ(0)])
+        with pytest.raises(ValueError, match="wire 0 is repeated"):
+            qml.beta.vqe.PauliHamiltonian.from_hamiltonian(H)
+
+    def test_invalid_init(self):
+        """Tests that an exception is raised for masks of the wrong shape"""
+        with pytest.raises(ValueError, match="number of coefficients and Pauli words"):
+            qml.beta.vqe.PauliHamiltonian([1.0, 2.0], [[0, 1]], [[1, 0]])
+
+        with pytest.raises(ValueError, match="not real-valued"):
+            qml.beta.vqe.PauliHamiltonian([1j], [[0, 1]], [[1, 0]])
+
+
 class TestVQE:
     """Test the core functionality of the VQE module"""
 
@@ -294,6 +431,160 @@ class TestVQE:
             cost = qml.beta.vqe.cost([], 4, hamiltonian, mock_device)
 
 
+class TestVQECost:
+    """Tests for the persistent VQE cost function"""
+
+    @pytest.mark.parametrize("ansatz, params", CIRCUITS)
+    @pytest.mark.parametrize("coeffs, observables", [z for z in zip(COEFFS, OBSERVABLES)])
+    def test_agrees_with_cost(self, params, ansatz, coeffs, observables, tol):
+        """Tests that the cost object agrees with the cost function"""
+        hamiltonian = qml.beta.vqe.Hamiltonian(coeffs, observables)
+        dev = qml.device("default.qubit", wires=3)
+
+        cost = qml.beta.vqe.VQECost(ansatz, hamiltonian, dev, mutable=True)
+        expected = qml.beta.vqe.cost(params, ansatz, hamiltonian, dev)
+
+        assert np.allclose(cost(*params), expected, atol=tol, rtol=0)
+
+    @pytest.mark.parametrize("coeffs, observables, expected", hamiltonians_with_expvals)
+    def test_expvals(self, coeffs, observables, expected, tol):
+        """Tests that the cost object returns correct expectation values"""
+        dev = qml.device("default.qubit", wires=2)
+        hamiltonian = qml.beta.vqe.Hamiltonian(coeffs, observables)
+        cost = qml.beta.vqe.VQECost(lambda *params, **kwargs: None, hamiltonian, dev)
+        assert np.allclose(cost(), sum(expected), atol=tol, rtol=0)
+
+    def test_single_execution(self, monkeypatch):
+        """Tests that the ansatz is constructed once, and simulated once per evaluation
+        on statevector devices"""
+        dev = qml.device("default.qubit", wires=2)
+        hamiltonian = qml.beta.vqe.Hamiltonian(COEFFS[0], OBSERVABLES[0])
+
+        calls = []
+
+        def ansatz(*params, wires=None):
+            calls.append(params)
+            custom_var_ansatz(*params, wires=wires)
+
+        cost = qml.beta.vqe.VQECost(ansatz, hamiltonian, dev)
+        assert len(cost.qnodes) == 1
+
+        executions = []
+        execute = dev._execute
+
+        def mock_execute(plan, queue, observables, parameters):
+            executions.append(len(observables))
+            return execute(plan, queue, observables, parameters)
+
+        monkeypatch.setattr(dev, "_execute", mock_execute)
+
+        for x in [0.1, 0.2, 0.3]:
+            cost(x)
+
+        assert len(calls) == 1
+        assert executions == [3, 3, 3]
+
+    def test_shared_shifted_states(self, monkeypatch, tol):
+        """Tests that each shifted circuit of the gradient is executed once for all terms"""
+        dev = qml.device("default.qubit", wires=1)
+
+        def ansatz(*params, **kwargs):
+            qml.RX(params[0], wires=0)
+            qml.RY(params[1], wires=0)
+
+        coeffs = [0.2, 0.5]
+        observables = [qml.PauliX(0), qml.PauliY(0)]
+        cost = qml.beta.vqe.VQECost(ansatz, qml.beta.vqe.Hamiltonian(coeffs, observables), dev)
+
+        batches = []
+        batch_execute = dev.batch_execute
+
+        def mock_batch_execute(circuits):
+            batches.append([len(obs) for _, obs in circuits])
+            return batch_execute(circuits)
+
+        monkeypatch.setattr(dev, "batch_execute", mock_batch_execute)
+
+        a, b = 0.54, 0.123
+        res = qml.grad(cost, argnum=[0, 1])(a, b)
+
+        expected = [
+            -coeffs[0] * np.sin(a) * np.sin(b) - coeffs[1] * np.cos(a),
+            coeffs[0] * np.cos(a) * np.cos(b),
+        ]
+
+        assert np.allclose(res, expected, atol=tol, rtol=0)
+        assert batches == [[2, 2, 2, 2]]
+
+    def test_immutable_template(self, tol):
+        """Tests that templates can be used as immutable ansaetze"""
+        dev = qml.device("default.qubit", wires=3)
+        hamiltonian = qml.beta.vqe.Hamiltonian(COEFFS[1], OBSERVABLES[1])
+        ansatz = qml.templates.layers.StronglyEntanglingLayers
+
+        cost = qml.beta.vqe.VQECost(ansatz, hamiltonian, dev)
+
+        for seed in range(3):
+            params = qml.init.strong_ent_layers_normal(n_layers=2, n_wires=3, seed=seed)
+            expected = qml.beta.vqe.cost([params], ansatz, hamiltonian, dev)
+            assert np.allclose(cost(params), expected, atol=tol, rtol=0)
+
+    @pytest.mark.parametrize("wires", [3, 4])
+    @pytest.mark.parametrize("coeffs, ops", PAULI_HAMILTONIANS)
+    def test_sparse_agrees_with_terms(self, coeffs, ops, wires, monkeypatch, tol):
+        """Tests that the sparse expectation value of a PauliHamiltonian, and its gradient,
+        agree with the expectation values of its terms"""
+        dev = qml.device("default.qubit", wires=wires)
+        hamiltonian = qml.beta.vqe.Hamiltonian(coeffs, ops)
+        H = qml.beta.vqe.PauliHamiltonian.from_hamiltonian(hamiltonian)
+        ansatz = qml.templates.layers.StronglyEntanglingLayers
+        params = qml.init.strong_ent_layers_normal(n_layers=2, n_wires=wires, seed=3)
+
+        terms_cost = qml.beta.vqe.VQECost(ansatz, hamiltonian, dev)
+        sparse_cost = qml.beta.vqe.VQECost(ansatz, H, dev)
+        assert not terms_cost._sparse
+        assert sparse_cost._sparse
+
+        expected = terms_cost(params)
+        expected_grad = qml.grad(terms_cost, argnum=0)(params)
+
+        executions = []
+        execute = dev._execute
+
+        def mock_execute(plan, queue, observables, parameters):
+            executions.append(len(observables))
+            return execute(plan, queue, observables, parameters)
+
+        monkeypatch.setattr(dev, "_execute", mock_execute)
+
+        assert np.allclose(sparse_cost(params), expected, atol=tol, rtol=0)
+        assert executions == [1]
+
+        res = qml.grad(sparse_cost, argnum=0)(params)
+        assert np.allclose(res, expected_grad, atol=tol, rtol=0)
+
+        # the terms are evaluated separately on devices that estimate expectation values
+        dev = qml.device("default.qubit", wires=wires, analytic=False)
+        assert not qml.beta.vqe.VQECost(ansatz, H, dev)._sparse
+
+    def test_non_statevector_device(self, mock_device):
+        """Tests that one QNode per term is evaluated on other devices"""
+        mock_device.num_wires = 2
+        hamiltonian = qml.beta.vqe.Hamiltonian(COEFFS[0], OBSERVABLES[0])
+
+        cost = qml.beta.vqe.VQECost(custom_var_ansatz, hamiltonian, mock_device)
+        assert len(cost.qnodes) == 3
+        assert cost(0.5) == sum(COEFFS[0])
+
+    @pytest.mark.parametrize("ansatz", JUNK_INPUTS)
+    def test_invalid_ansatz(self, ansatz):
+        """Tests that an exception is raised if the ansatz is not valid"""
+        dev = qml.device("default.qubit", wires=1)
+        hamiltonian = qml.beta.vqe.Hamiltonian((1.0,), [qml.PauliZ(0)])
+        with pytest.raises(ValueError, match="The ansatz is not a callable function."):
+            qml.beta.vqe.VQECost(ansatz, hamiltonian, dev)
+
+
 class TestAutogradInterface:
     """Tests for the Autograd interface (and the NumPy interface for backward compatibility)"""
 
@@ -40,7 +40,7 @@ class TestQubit:
     @pytest.mark.parametrize("observable, eigvals, eigvecs", EIGVALS_TEST_DATA)
     def test_hermitian_eigvals_eigvecs(self, observable, eigvals, eigvecs, tol):
         """Tests that the eigvals method of the Hermitian class returns the correct results."""
-        key = tuple(observable.flatten().tolist())
+        key = observable
         qml.Hermitian.eigvals(observable)
         assert np.allclose(qml.Hermitian._eigs[key]["eigval"], eigvals, atol=tol, rtol=0)
         assert np.allclose(qml.Hermitian._eigs[key]["eigvec"], eigvecs, atol=tol, rtol=0)
@@ -58,7 +58,7 @@ class TestQubit:
         observable_1_eigvals = obs1[1]
         observable_1_eigvecs = obs1[2]
 
-        key = tuple(observable_1.flatten().tolist())
+        key = observable_1
 
         qml.Hermitian.eigvals(observable_1)
         assert np.allclose(qml.Hermitian._eigs[key]["eigval"], observable_1_eigvals, atol=tol, rtol=0)
@@ -69,7 +69,7 @@ class TestQubit:
         observable_2_eigvals = obs2[1]
         observable_2_eigvecs = obs2[2]
 
-        key_2 = tuple(observable_2.flatten().tolist())
+        key_2 = observable_2
 
         qml.Hermitian.eigvals(observable_2)
         assert np.allclose(qml.Hermitian._eigs[key_2]["eigval"], observable_2_eigvals, atol=tol, rtol=0)
@@ -79,7 +79,7 @@ class TestQubit:
     @pytest.mark.parametrize("observable, eigvals, eigvecs", EIGVALS_TEST_DATA)
     def test_hermitian_eigvals_eigvecs_same_observable_twice(self, observable, eigvals, eigvecs, tol):
         """Tests that the eigvals method of the Hermitian class keeps the same dictionary entries upon multiple calls."""
-        key = tuple(observable.flatten().tolist())
+        key = observable
 
         qml.Hermitian.eigvals(observable)
         assert np.allclose(qml.Hermitian._eigs[key]["eigval"], eigvals, atol=tol, rtol=0)
@@ -96,7 +96,7 @@ class TestQubit:
         """Tests that the diagonalizing_gates method of the Hermitian class returns the correct results."""
         qubit_unitary = qml.Hermitian.diagonalizing_gates(observable, wires = [0])
 
-        key = tuple(observable.flatten().tolist())
+        key = observable
         assert np.allclose(qml.Hermitian._eigs[key]["eigval"], eigvals, atol=tol, rtol=0)
         assert np.allclose(qml.Hermitian._eigs[key]["eigvec"], eigvecs, atol=tol, rtol=0)
 
@@ -117,7 +117,7 @@ class TestQubit:
 
         qubit_unitary = qml.Hermitian.diagonalizing_gates(observable_1, wires = [0])
 
-        key = tuple(observable_1.flatten().tolist())
+        key = observable_1
         assert np.allclose(qml.Hermitian._eigs[key]["eigval"], observable_1_eigvals, atol=tol, rtol=0)
         assert np.allclose(qml.Hermitian._eigs[key]["eigvec"], observable_1_eigvecs, atol=tol, rtol=0)
 
@@ -130,7 +130,7 @@ class TestQubit:
 
         qubit_unitary_2 = qml.Hermitian.diagonalizing_gates(observable_2, wires = [0])
 
-        key = tuple(observable_2.flatten().tolist())
+        key = observable_2
         assert np.allclose(qml.Hermitian._eigs[key]["eigval"], observable_2_eigvals, atol=tol, rtol=0)
         assert np.allclose(qml.Hermitian._eigs[key]["eigvec"], observable_2_eigvecs, atol=tol, rtol=0)
 
@@ -142,7 +142,7 @@ class TestQubit:
         """Tests that the diagonalizing_gates method of the Hermitian class keeps the same dictionary entries upon multiple calls."""
         qubit_unitary = qml.Hermitian.diagonalizing_gates(observable, wires = [0])
 
-        key = tuple(observable.flatten().tolist())
+        key = observable
         assert np.allclose(qml.Hermitian._eigs[key]["eigval"], eigvals, atol=tol, rtol=0)
         assert np.allclose(qml.Hermitian._eigs[key]["eigvec"], eigvecs, atol=tol, rtol=0)
 
@@ -151,7 +151,7 @@ class TestQubit:
 
         qubit_unitary = qml.Hermitian.diagonalizing_gates(observable, wires = [0])
 
-        key = tuple(observable.flatten().tolist())
+        key = observable
         assert np.allclose(qml.Hermitian._eigs[key]["eigval"], eigvals, atol=tol, rtol=0)
         assert np.allclose(qml.Hermitian._eigs[key]["eigvec"], eigvecs, atol=tol, rtol=0)
 
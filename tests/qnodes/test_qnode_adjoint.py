@@ -0,0 +1,185 @@
+# Copyright 2019 Xanadu Quantum Technologies Inc.
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+
+#     http://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+Unit tests for the PennyLane :class:`~.AdjointQNode` class.
+"""
+import pytest
+import numpy as np
+
+import pennylane as qml
+from pennylane import DeviceError
+from pennylane.qnodes.adjoint import AdjointQNode
+from pennylane.qnodes.qubit import QubitQNode
+
+
+thetas = np.linspace(-2 * np.pi, 2 * np.pi, 7)
+
+
+def circuit(x, y, z):
+    """Circuit containing all the operations that declare a generator"""
+    qml.Hadamard(wires=0)
+    qml.RX(x, wires=0)
+    qml.RY(0.3 * y, wires=1)
+    qml.CNOT(wires=[0, 1])
+    qml.RZ(z, wires=1)
+    qml.PhaseShift(x, wires=1)
+    qml.CRX(y, wires=[1, 2])
+    qml.CRY(z, wires=[2, 0]).inv()
+    qml.CRZ(-2 * x, wires=[2, 3])
+    return (
+        qml.expval(qml.PauliZ(0)),
+        qml.expval(qml.PauliX(1) @ qml.PauliY(2)),
+        qml.expval(qml.Hermitian(np.array([[1, 2j], [-2j, 0]]), wires=3)),
+    )
+
+
+class TestAdjointJacobian:
+    """Tests for the adjoint Jacobian of default.qubit"""
+
+    @pytest.mark.parametrize("theta", thetas)
+    def test_agrees_with_finite_diff(self, theta, tol):
+        """Test that the adjoint method agrees with finite differences.
+
+        The two-term parameter-shift rule is not exact for the controlled
+        rotations, so the second-order finite-difference method is used instead."""
+        dev = qml.device("default.qubit", wires=4)
+        args = (theta, 0.5 * theta + 0.1, -0.7)
+
+        adjoint = AdjointQNode(circuit, dev)
+        finite_diff = QubitQNode(circuit, dev)
+
+        res = adjoint.jacobian(args)
+        expected = finite_diff.jacobian(args, method="F", options={"order": 2})
+
+        assert res.shape == (3, 3)
+        assert np.allclose(res, expected, atol=tol, rtol=0)
+
+    def test_single_simulation(self, monkeypatch):
+        """Test that no circuits are executed by the QNode"""
+        dev = qml.device("default.qubit", wires=4)
+        adjoint = AdjointQNode(circuit, dev)
+
+        def mock_batch_execute(circuits):
+            raise AssertionError("no circuits should be executed")
+
+        monkeypatch.setattr(dev, "batch_execute", mock_batch_execute)
+        adjoint.jacobian([0.1, 0.2, 0.3])
+
+    def test_wrt(self, tol):
+        """Test that the Jacobian with respect to a subset of parameters is returned"""
+        dev = qml.device("default.qubit", wires=4)
+        args = (0.1, 0.2, 0.3)
+
+        res = AdjointQNode(circuit, dev).jacobian(args, wrt=[2, 0])
+        expected = QubitQNode(circuit, dev).jacobian(args, method="F", options={"order": 2})
+
+        assert np.allclose(res, expected[:, [2, 0]], atol=tol, rtol=0)
+
+    def test_fallback_no_generator(self, tol):
+        """Test that parameters of operations without a generator are differentiated
+        using the parameter-shift rule, and the remaining ones using the adjoint method"""
+        dev = qml.device("default.qubit", wires=2)
+
+        def circuit(x, y):
+            qml.RX(x, wires=0)
+            qml.Rot(y, x, 0.4, wires=1)
+            qml.CNOT(wires=[0, 1])
+            qml.RY(y, wires=0)
+            return qml.expval(qml.PauliZ(0)), qml.expval(qml.PauliZ(1))
+
+        node = AdjointQNode(circuit, dev)
+        node._construct([0.1, 0.2], {})
+
+        assert not node._adjoint_supported(0)
+        assert not node._adjoint_supported(1)
+
+        def circuit2(x, y):
+            qml.RX(x, wires=0)
+            qml.Rot(0.3, 0.2, 0.4, wires=1)
+            qml.CNOT(wires=[0, 1])
+            qml.Rot(y, 0.1, 0.1, wires=0)
+            return qml.expval(qml.PauliZ(0)), qml.expval(qml.PauliZ(1))
+
+        node = AdjointQNode(circuit2, dev)
+        node._construct([0.1, 0.2], {})
+
+        assert node._adjoint_supported(0)
+        assert not node._adjoint_supported(1)
+
+        res = node.jacobian([0.1, 0.2])
+        expected = QubitQNode(circuit2, dev).jacobian([0.1, 0.2])
+        assert np.allclose(res, expected, atol=tol, rtol=0)
+
+    def test_fallback_variance(self, tol):
+        """Test that the parameter-shift rule is used for circuits returning variances"""
+        dev = qml.device("default.qubit", wires=1)
+
+        def circuit(x):
+            qml.RX(x, wires=0)
+            return qml.var(qml.PauliZ(0))
+
+        node = AdjointQNode(circuit, dev)
+        res = node.jacobian([0.5])
+
+        assert not node._adjoint_supported(0)
+        assert np.allclose(res, [[np.sin(1.0)]], atol=tol, rtol=0)
+
+    def test_state_preparation(self, tol):
+        """Test that the adjoint method supports state preparations"""
+        dev = qml.device("default.qubit", wires=2)
+
+        def circuit(x):
+            qml.QubitStateVector(np.array([1, 0, 0, 1j]) / np.sqrt(2), wires=[0, 1])
+            qml.RX(x, wires=0)
+            qml.CNOT(wires=[0, 1])
+            return qml.expval(qml.PauliY(0))
+
+        res = AdjointQNode(circuit, dev).jacobian([0.2])
+        expected = QubitQNode(circuit, dev).jacobian([0.2])
+
+        assert np.allclose(res, expected, atol=tol, rtol=0)
+
+    def test_gradient(self, tol):
+        """Test that the adjoint method is used by the autograd interface"""
+        dev = qml.device("default.qubit", wires=1)
+
+        @qml.qnode(dev, diff_method="adjoint")
+        def circuit(x):
+            qml.RX(x, wires=0)
+            return qml.expval(qml.PauliZ(0))
+
+        res = qml.grad(circuit, argnum=0)(0.4)
+        assert np.allclose(res, -np.sin(0.4), atol=tol, rtol=0)
+
+    def test_device_errors(self):
+        """Test that the device raises an exception for unsupported circuits"""
+        dev = qml.device("default.qubit", wires=1)
+
+        def circuit(x):
+            qml.Rot(x, 0.1, 0.2, wires=0)
+            return qml.expval(qml.PauliZ(0))
+
+        node = AdjointQNode(circuit, dev)
+
+        with pytest.raises(DeviceError, match="Rot, as it has no generator"):
+            node.jacobian([0.4], method="adjoint")
+
+        def circuit(x):
+            qml.RX(x, wires=0)
+            return qml.probs(wires=0)
+
+        node = AdjointQNode(circuit, dev)
+
+        with pytest.raises(DeviceError, match="only supports expectation values"):
+            node.jacobian([0.4], method="adjoint")
@@ -23,7 +23,7 @@ import numpy as np
 
 import pennylane as qml
 from pennylane._device import Device
-from pennylane.qnodes.base import BaseQNode, QuantumFunctionError, decompose_queue
+from pennylane.qnodes.base import BaseQNode, QuantumFunctionError, decompose_queue, fuse_gates
 
 
 @pytest.fixture(scope="function")
@@ -330,6 +330,19 @@ class TestQNodeExceptions:
         with pytest.raises(QuantumFunctionError, match="can only be measured once"):
             node(0.5)
 
+    def test_shared_wires_property(self, tol):
+        """Measuring the same wire multiple times is allowed if requested using the QNode properties."""
+
+        def circuit(x):
+            qml.RX(x, wires=[0])
+            qml.CNOT(wires=[0, 1])
+            return qml.expval(qml.PauliZ(0)), qml.expval(qml.PauliZ(1)), qml.expval(qml.PauliY(0))
+
+        dev = qml.device("default.qubit", wires=2)
+        node = BaseQNode(circuit, dev, properties={"shared_wires": True})
+        res = node(0.5)
+        assert np.allclose(res, [np.cos(0.5), np.cos(0.5), 0], atol=tol, rtol=0)
+
     def test_invisible_operations(self, operable_mock_device_2_wires):
         """Error: an operation does not affect the measurements."""
 
@@ -745,6 +758,60 @@ class TestQNodeCaching:
         assert len(node.circuit.operations) == 2
         node.ops[0] is temp  # it's the same circuit with the same objects
 
+    def test_compiled_once(self, monkeypatch):
+        """Test that the execution plan of a non-mutable circuit is only compiled once."""
+        dev = qml.device("default.qubit", wires=2)
+
+        def circuit(x):
+            qml.RX(x, wires=0)
+            qml.CNOT(wires=[0, 1])
+            return qml.expval(qml.PauliZ(1))
+
+        node = BaseQNode(circuit, dev, mutable=False)
+
+        compiled = []
+        compile_fn = dev.compile
+
+        def mock_compile(queue, observables):
+            compiled.append(len(queue))
+            return compile_fn(queue, observables)
+
+        monkeypatch.setattr(dev, "compile", mock_compile)
+
+        for x in [0.1, 0.2, 0.3]:
+            assert np.allclose(node(x), np.cos(x))
+
+        assert compiled == [2]
+
+    def test_recompiled_when_structure_changes(self, monkeypatch):
+        """Test that the execution plan of a mutable circuit is only compiled
+        again if the structure of the circuit changes."""
+        dev = qml.device("default.qubit", wires=2)
+
+        def mutable_circuit(x, *, c=None):
+            qml.RX(x, wires=0)
+            for i in range(c):
+                qml.RX(x, wires=i)
+            return qml.expval(qml.PauliZ(0))
+
+        node = BaseQNode(mutable_circuit, dev, mutable=True)
+
+        compiled = []
+        compile_fn = dev.compile
+
+        def mock_compile(queue, observables):
+            compiled.append(len(queue))
+            return compile_fn(queue, observables)
+
+        monkeypatch.setattr(dev, "compile", mock_compile)
+
+        assert np.allclose(node(0.1, c=0), np.cos(0.1))
+        assert np.allclose(node(0.2, c=0), np.cos(0.2))
+        assert np.allclose(node(0.2, c=1), np.cos(0.4))
+        assert np.allclose(node(0.3, c=1), np.cos(0.6))
+
+        assert compiled == [1, 2]
+
 
 
 class TestQNodeEvaluate:
@@ -796,6 +863,83 @@ class TestQNodeEvaluate:
         expected = np.cos(y)
         assert np.allclose(res, expected, atol=tol, rtol=0)
 
+    def test_evaluate_batch(self, monkeypatch, tol):
+        """Tests that a batch of input rows is submitted to the device in a single call,
+        and agrees with evaluating the rows one at a time"""
+        dev = qml.device("default.qubit", wires=2)
+
+        def circuit(x, y):
+            qml.RX(x, wires=[0])
+            qml.RY(y[0], wires=[1])
+            qml.CNOT(wires=[0, 1])
+            qml.RZ(y[1], wires=[1])
+            return qml.expval(qml.PauliZ(0) @ qml.PauliX(1)), qml.expval(qml.PauliZ(1))
+
+        xs = np.linspace(-1, 2, 50)
+        ys = np.stack([xs ** 2 / 3, -xs], axis=1)
+
+        node = BaseQNode(circuit, dev)
+        expected = np.array([node.evaluate([x, y], {}) for x, y in zip(xs, ys)])
+
+        calls = []
+        batch_execute = dev.batch_execute
+
+        def mock_batch_execute(circuits):
+            calls.append(len(circuits))
+            return batch_execute(circuits)
+
+        monkeypatch.setattr(dev, "batch_execute", mock_batch_execute)
+        res = node.evaluate_batch([xs, ys], {})
+
+        assert calls == [50]
+        assert res.shape == (50, 2)
+        assert np.allclose(res, expected, atol=tol, rtol=0)
+
+    def test_group_observables(self, monkeypatch, tol):
+        """Tests that the observables are measured in groups if requested"""
+        dev = qml.device("default.qubit", wires=2)
+
+        def circuit(x, y):
+            qml.RX(x, wires=[0])
+            qml.RY(y, wires=[1])
+            qml.CNOT(wires=[0, 1])
+            return (
+                qml.expval(qml.PauliX(0) @ qml.PauliZ(1)),
+                qml.expval(qml.PauliY(0)),
+                qml.expval(qml.PauliX(0)),
+            )
+
+        expected = BaseQNode(circuit, dev, properties={"shared_wires": True})(0.3, 0.4)
+
+        calls = []
+        execute_grouped = dev.execute_grouped
+
+        def mock_execute_grouped(queue, observables):
+            calls.append(len(observables))
+            return execute_grouped(queue, observables)
+
+        monkeypatch.setattr(dev, "execute_grouped", mock_execute_grouped)
+        node = BaseQNode(
+            circuit, dev, properties={"shared_wires": True, "group_observables": True}
+        )
+        res = node(0.3, 0.4)
+
+        assert calls == [3]
+        assert np.allclose(res, expected, atol=tol, rtol=0)
+
+    def test_evaluate_batch_size_mismatch(self):
+        """Tests that an exception is raised if the batch sizes of the arguments differ"""
+        dev = qml.device("default.qubit", wires=2)
+
+        def circuit(x, y):
+            qml.RX(x, wires=[0])
+            qml.RY(y, wires=[1])
+            return qml.expval(qml.PauliZ(0))
+
+        node = BaseQNode(circuit, dev)
+        with pytest.raises(QuantumFunctionError, match="batch axis of the same size"):
+            node.evaluate_batch([np.zeros(3), np.zeros(4)], {})
+
     def test_single_mode_sample(self):
         """Test that there is only one array of values returned
         for single mode samples"""
@@ -883,3 +1027,122 @@ class TestDecomposition:
 
         with pytest.raises(qml.DeviceError, match="DummyOp not supported on device"):
             decompose_queue(queue, operable_mock_device_2_wires)
+
+
+class TestGateFusion:
+    """Tests for the fusion of fixed gates"""
+
+    @staticmethod
+    def circuit(x, y):
+        """Circuit mixing fixed and parametrized gates"""
+        qml.Hadamard(wires=0)
+        qml.S(wires=0).inv()
+        qml.CNOT(wires=[0, 1])
+        qml.RX(x, wires=0)
+        qml.RY(0.4, wires=1)
+        qml.CZ(wires=[1, 2])
+        qml.T(wires=2)
+        qml.PauliX(wires=0)
+        qml.Toffoli(wires=[0, 1, 2])
+        qml.CRY(y, wires=[2, 0])
+        qml.SWAP(wires=[1, 2])
+        qml.RZ(0.2, wires=2)
+        return qml.expval(qml.PauliZ(0)), qml.expval(qml.PauliY(1) @ qml.PauliX(2))
+
+    def test_fuse_gates(self):
+        """Test that adjacent fixed gates are fused, and other operations left in place"""
+        ops = [
+            qml.Hadamard(wires=0),
+            qml.RX(0.1, wires=1),
+            qml.CNOT(wires=[0, 1]),
+            qml.PauliX(wires=2),
+            qml.CNOT(wires=[1, 2]),
+            qml.BasisState(np.array([1]), wires=[0]),
+            qml.T(wires=0),
+        ]
+
+        res = fuse_gates(ops, qml.device("default.qubit", wires=3))
+
+        # the CNOT on wires [1, 2] cannot be fused with both open blocks
+        assert [op.name for op in res] == [
+            "QubitUnitary",
+            "PauliX",
+            "BasisState",
+            "CNOT",
+            "T",
+        ]
+        assert res[0].wires == [0, 1]
+        assert res[1] is ops[3]
+        assert res[3] is ops[4]
+
+        # H on wire 0, then RX on wire 1, then CNOT
+        H = np.array([[1, 1], [1, -1]]) / np.sqrt(2)
+        RX = np.array([[np.cos(0.05), -1j * np.sin(0.05)], [-1j * np.sin(0.05), np.cos(0.05)]])
+        CNOT = np.array([[1, 0, 0, 0], [0, 1, 0, 0], [0, 0, 0, 1], [0, 0, 1, 0]])
+        expected = CNOT @ np.kron(H, RX)
+        assert np.allclose(res[0].parameters[0], expected)
+
+    def test_unknown_matrix_not_fused(self, operable_mock_device_2_wires):
+        """Test that gates are not fused if the device does not provide their matrices"""
+        ops = [qml.Hadamard(wires=0), qml.CNOT(wires=[0, 1]), qml.T(wires=1)]
+        assert fuse_gates(ops, operable_mock_device_2_wires) == ops
+
+    def test_variables_not_fused(self):
+        """Test that operations depending on free parameters are not fused"""
+        dev = qml.device("default.qubit", wires=3)
+        node = BaseQNode(self.circuit, dev, properties={"fuse_gates": True})
+        node._construct([0.1, 0.2], {})
+
+        names = [op.name for op in node.device_queue]
+        assert names == [
+            "QubitUnitary",
+            "RX",
+            "QubitUnitary",
+            "PauliX",
+            "Toffoli",
+            "CRY",
+            "QubitUnitary",
+        ]
+
+        for deps in node.variable_deps.values():
+            for d in deps:
+                assert d.op in node.device_queue
+
+    def test_disabled_by_default(self):
+        """Test that the gates are not fused unless requested"""
+        dev = qml.device("default.qubit", wires=3)
+        node = BaseQNode(self.circuit, dev)
+        node._construct([0.1, 0.2], {})
+
+        assert node.device_queue == node.circuit.operations
+
+    def test_device_without_qubit_unitary(self, operable_mock_device_2_wires):
+        """Test that the gates are not fused if the device does not support QubitUnitary"""
+
+        def circuit(x):
+            qml.RX(x, wires=0)
+            qml.CNOT(wires=[0, 1])
+            qml.RY(0.2, wires=0)
+            return qml.expval(qml.PauliZ(0))
+
+        node = BaseQNode(circuit, operable_mock_device_2_wires, properties={"fuse_gates": True})
+        node._construct([0.1], {})
+
+        assert node.device_queue == node.circuit.operations
+
+    @pytest.mark.parametrize("diff_method", ["parameter-shift", "adjoint"])
+    def test_results_agree(self, diff_method, tol):
+        """Test that fusing the gates does not change the output or the gradient"""
+        dev = qml.device("default.qubit", wires=3)
+
+        fused = qml.QNode(self.circuit, dev, diff_method=diff_method, properties={"fuse_gates": True})
+        plain = qml.QNode(self.circuit, dev, diff_method="finite-diff")
+
+        args = (0.543, -0.654)
+        assert np.allclose(fused(*args), plain(*args), atol=tol, rtol=0)
+
+        res = fused.jacobian(args, method="F", options={"order": 2})
+        expected = plain.jacobian(args, method="F", options={"order": 2})
+        assert np.allclose(res, expected, atol=tol, rtol=0)
+
+        assert np.allclose(fused.jacobian(args)[:, 0], expected[:, 0], atol=tol, rtol=0)
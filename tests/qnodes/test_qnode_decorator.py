@@ -19,7 +19,7 @@ import numpy as np
 import pytest
 
 import pennylane as qml
-from pennylane.qnodes import qnode, CVQNode, JacobianQNode, BaseQNode, QubitQNode
+from pennylane.qnodes import qnode, CVQNode, JacobianQNode, BaseQNode, QubitQNode, AdjointQNode
 
 
 def test_create_qubit_qnode():
@@ -92,6 +92,32 @@ def test_finite_diff_qubit_qnode():
     assert hasattr(circuit, "jacobian")
 
 
+def test_adjoint_qubit_qnode():
+    """Test that an adjoint differentiable qubit QNode
+    is correctly created when diff_method='adjoint'"""
+    dev = qml.device('default.qubit', wires=1)
+
+    @qnode(dev, diff_method="adjoint")
+    def circuit(a):
+        qml.RX(a, wires=0)
+        return qml.expval(qml.PauliZ(wires=0))
+
+    assert isinstance(circuit, AdjointQNode)
+    assert hasattr(circuit, "jacobian")
+
+
+def test_adjoint_unsupported_device():
+    """Test exception raised if the adjoint diff method
+    is requested on a device that does not support it"""
+    dev = qml.device('default.gaussian', wires=1)
+
+    with pytest.raises(ValueError, match="does not support the adjoint differentiation method"):
+        @qnode(dev, diff_method="adjoint")
+        def circuit(a):
+            qml.Displacement(a, 0, wires=0)
+            return qml.expval(qml.X(wires=0))
+
+
 def test_tf_interface(skip_if_no_tf_support):
     """Test tf interface conversion"""
     dev = qml.device('default.qubit', wires=1)
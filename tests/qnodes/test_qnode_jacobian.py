@@ -168,6 +168,161 @@ class TestJacobianQNodeExceptions:
             node.jacobian(0.5, method="F", options={'order': 3})
 
 
+class TestBatchedJacobian:
+    """Tests that the Jacobian circuits are submitted to the device in a single batch."""
+
+    @pytest.mark.parametrize("method, num_circuits", [("F", 3), ("A", 6)])
+    def test_single_batch(self, qubit_device_2_wires, monkeypatch, method, num_circuits, tol):
+        """The circuits for all partial derivatives are executed using a single
+        call to Device.batch_execute."""
+        dev = qubit_device_2_wires
+
+        def circuit(x, y, z):
+            qml.RX(x, wires=[0])
+            qml.RY(y, wires=[1])
+            qml.CNOT(wires=[0, 1])
+            qml.RX(z, wires=[1])
+            return qml.expval(qml.PauliZ(0)), qml.expval(qml.PauliZ(1))
+
+        node = qml.qnodes.QubitQNode(circuit, dev)
+
+        batches = []
+        original = type(dev).batch_execute
+
+        def mock_batch_execute(self, circuits):
+            batches.append(len(circuits))
+            return original(self, circuits)
+
+        with monkeypatch.context() as m:
+            m.setattr(type(dev), "batch_execute", mock_batch_execute)
+            res = node.jacobian([0.1, 0.2, 0.3], method=method)
+
+        assert batches == [num_circuits]
+
+        x, y, z = 0.1, 0.2, 0.3
+        expected = np.array(
+            [
+                [-np.sin(x), 0, 0],
+                [
+                    -np.sin(x) * np.cos(y) * np.cos(z),
+                    -np.cos(x) * np.sin(y) * np.cos(z),
+                    -np.cos(x) * np.cos(y) * np.sin(z),
+                ],
+            ]
+        )
+        assert np.allclose(res, expected, atol=tol, rtol=0)
+
+    def test_bound_circuits_independent_of_variables(self, qubit_device_2_wires):
+        """The circuits are bound to the shifted parameter values, and do not
+        depend on the values stored in the Variable class."""
+
+        def circuit(x):
+            qml.RX(x, wires=[0])
+            return qml.expval(qml.PauliZ(0))
+
+        node = qml.qnodes.QubitQNode(circuit, qubit_device_2_wires)
+        node._construct([0.5], {})
+
+        queue, obs = node._bound_circuit(np.array([0.7]), {})
+        node._set_variables([0.1], {})
+
+        assert queue[0].parameters == [0.7]
+        assert node.circuit.operations[0].parameters == [0.1]
+        assert obs[0].return_type is qml.operation.Expectation
+
+
+class TestParallelJacobian:
+    """Tests that the Jacobian circuits can be executed by a pool of device replicas."""
+
+    @staticmethod
+    def circuit(x, y, z):
+        """Circuit with three parameters and two outputs"""
+        qml.RX(x, wires=[0])
+        qml.RY(y, wires=[1])
+        qml.CNOT(wires=[0, 1])
+        qml.RX(z, wires=[1])
+        return qml.expval(qml.PauliZ(0)), qml.expval(qml.PauliZ(1))
+
+    @pytest.mark.parametrize("workers", [2, 4, 10])
+    @pytest.mark.parametrize("method", ["F", "A"])
+    def test_agrees_with_serial(self, qubit_device_2_wires, workers, method, tol):
+        """The Jacobian computed by a pool of threads agrees with the serial computation."""
+        node = qml.qnodes.QubitQNode(self.circuit, qubit_device_2_wires)
+        expected = node.jacobian([0.1, 0.2, 0.3], method=method)
+
+        node = qml.qnodes.QubitQNode(
+            self.circuit, qubit_device_2_wires, properties={"jacobian_workers": workers}
+        )
+        res = node.jacobian([0.1, 0.2, 0.3], method=method)
+        assert np.allclose(res, expected, atol=tol, rtol=0)
+
+    def test_replicas(self, qubit_device_2_wires, monkeypatch):
+        """Each chunk of circuits is executed by a separate copy of the device."""
+        dev = qubit_device_2_wires
+        node = qml.qnodes.QubitQNode(self.circuit, dev, properties={"jacobian_workers": 4})
+
+        batches = []
+        original = type(dev).batch_execute
+
+        def mock_batch_execute(self, circuits):
+            batches.append((id(self), len(circuits)))
+            return original(self, circuits)
+
+        with monkeypatch.context() as m:
+            m.setattr(type(dev), "batch_execute", mock_batch_execute)
+            node.jacobian([0.1, 0.2, 0.3], method="A")
+
+        # the six circuits are split into three chunks of two
+        assert [n for _, n in batches] == [2, 2, 2]
+        assert len({i for i, _ in batches}) == 3
+        assert id(dev) not in {i for i, _ in batches}
+
+    def test_pool_reused(self, qubit_device_2_wires, monkeypatch):
+        """The pool of workers and the device replicas are reused by later Jacobian calls."""
+        dev = qubit_device_2_wires
+        node = qml.qnodes.QubitQNode(self.circuit, dev, properties={"jacobian_workers": 2})
+
+        node.jacobian([0.1, 0.2, 0.3], method="A")
+        pool = node._jacobian_pool
+
+        batches = []
+        original = type(dev).batch_execute
+
+        def mock_batch_execute(self, circuits):
+            batches.append(id(self))
+            return original(self, circuits)
+
+        with monkeypatch.context() as m:
+            m.setattr(type(dev), "batch_execute", mock_batch_execute)
+            node.jacobian([0.4, 0.5, 0.6], method="A")
+
+        assert node._jacobian_pool is pool
+        assert set(batches) == {id(replica) for replica in pool[3]}
+
+    def test_process_pool(self, qubit_device_2_wires, tol):
+        """The Jacobian can be computed by a pool of processes."""
+        node = qml.qnodes.QubitQNode(self.circuit, qubit_device_2_wires)
+        expected = node.jacobian([0.1, 0.2, 0.3], method="A")
+
+        node = qml.qnodes.QubitQNode(
+            self.circuit,
+            qubit_device_2_wires,
+            properties={"jacobian_workers": 2, "jacobian_pool": "process"},
+        )
+        res = node.jacobian([0.1, 0.2, 0.3], method="A")
+        assert np.allclose(res, expected, atol=tol, rtol=0)
+
+    def test_unknown_pool(self, qubit_device_2_wires):
+        """An exception is raised for an unknown type of worker pool."""
+        node = qml.qnodes.QubitQNode(
+            self.circuit,
+            qubit_device_2_wires,
+            properties={"jacobian_workers": 2, "jacobian_pool": "cluster"},
+        )
+        with pytest.raises(ValueError, match="Unknown Jacobian worker pool cluster"):
+            node.jacobian([0.1, 0.2, 0.3])
+
+
 class TestBestMethod:
     """Test different flows of _best_method"""
 
@@ -0,0 +1,162 @@
+# Copyright 2019 Xanadu Quantum Technologies Inc.
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+
+#     http://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+Unit tests for the :mod:`pennylane.plugin.DefaultClifford` device.
+"""
+import itertools
+
+import pytest
+
+import pennylane as qml
+from pennylane import numpy as np, DeviceError
+
+
+def random_clifford_circuit(num_wires, depth, seed):
+    """Returns a random circuit of the Clifford operations supported by the device"""
+    rng = np.random.RandomState(seed)
+    single = [qml.Hadamard, qml.S, qml.PauliX, qml.PauliY, qml.PauliZ]
+    double = [qml.CNOT, qml.CZ, qml.SWAP]
+
+    ops = [qml.BasisState(rng.randint(2, size=num_wires), wires=list(range(num_wires)))]
+
+    for _ in range(depth):
+        if rng.rand() < 0.5:
+            op = single[rng.randint(len(single))](wires=int(rng.randint(num_wires)))
+        else:
+            w = rng.choice(num_wires, size=2, replace=False).tolist()
+            op = double[rng.randint(len(double))](wires=w)
+
+        if rng.rand() < 0.3:
+            op.inv()
+
+        ops.append(op)
+
+    return ops
+
+
+PAULIS = [qml.Identity, qml.PauliX, qml.PauliY, qml.PauliZ]
+
+
+class TestAgreesWithDefaultQubit:
+    """Tests that the stabilizer simulation agrees with the state vector simulation"""
+
+    @pytest.mark.parametrize("seed", range(5))
+    def test_pauli_words(self, seed, tol):
+        """Test the expectation values and variances of all Pauli words on three wires"""
+        ops = random_clifford_circuit(3, 30, seed)
+        obs = []
+
+        for paulis in itertools.product(PAULIS, repeat=3):
+            word = paulis[0](wires=0) @ paulis[1](wires=1) @ paulis[2](wires=2)
+            obs.extend([qml.expval(word), qml.var(word)])
+
+        dev1 = qml.device("default.clifford", wires=3)
+        dev2 = qml.device("default.qubit", wires=3)
+        assert np.allclose(dev1.execute(ops, obs), dev2.execute(ops, obs), atol=tol, rtol=0)
+
+    @pytest.mark.parametrize("seed", range(5))
+    def test_probability(self, seed, tol):
+        """Test the marginal probabilities"""
+        ops = random_clifford_circuit(4, 30, seed)
+        obs = [qml.probs(wires=[0, 1, 2, 3]), qml.probs(wires=[3, 1]), qml.probs(wires=[2])]
+
+        dev1 = qml.device("default.clifford", wires=4)
+        dev2 = qml.device("default.qubit", wires=4)
+
+        for res, expected in zip(dev1.execute(ops, obs), dev2.execute(ops, obs)):
+            assert np.allclose(res, expected, atol=tol, rtol=0)
+
+
+class TestMeasurements:
+    """Tests for the measurements on large stabilizer states"""
+
+    num_wires = 1000
+
+    def ghz(self):
+        """Operations preparing a GHZ state on all wires"""
+        return [qml.Hadamard(wires=0)] + [
+            qml.CNOT(wires=[i, i + 1]) for i in range(self.num_wires - 1)
+        ]
+
+    def test_ghz_state(self, tol):
+        """Test the expectation values of Pauli words in a GHZ state on many wires"""
+        n = self.num_wires
+        dev = qml.device("default.clifford", wires=n)
+
+        x_word = qml.PauliX(0)
+        for i in range(1, n):
+            x_word = x_word @ qml.PauliX(i)
+
+        obs = [
+            qml.expval(qml.PauliZ(0) @ qml.PauliZ(n - 1)),
+            qml.expval(qml.PauliZ(n // 2)),
+            qml.expval(x_word),
+            qml.var(qml.PauliZ(3)),
+        ]
+        res = dev.execute(self.ghz(), obs)
+        assert np.allclose(res, [1, 0, 1, 1], atol=tol, rtol=0)
+
+        res = dev.execute(self.ghz(), [qml.probs(wires=[0, n - 1])])
+        assert np.allclose(res, [[0.5, 0, 0, 0.5]], atol=tol, rtol=0)
+
+    def test_sample(self):
+        """Test that deterministic Pauli words return constant samples, and random ones
+        return both eigenvalues"""
+        n = self.num_wires
+        dev = qml.device("default.clifford", wires=n, shots=100)
+
+        obs = [
+            qml.sample(qml.PauliZ(1) @ qml.PauliZ(2)),
+            qml.sample(qml.PauliY(0) @ qml.PauliY(1) @ qml.PauliX(2)),
+            qml.sample(qml.PauliZ(5)),
+        ]
+        ops = [qml.Hadamard(wires=0), qml.CNOT(wires=[0, 1]), qml.CNOT(wires=[1, 2])]
+        res = dev.execute(ops, obs)
+
+        assert np.all(res[0] == 1)
+        assert np.all(res[1] == -1)
+        assert np.all(res[2] == 1)
+
+        dev.reset()
+        dev.apply("Hadamard", [0], [])
+        assert set(dev.sample("PauliZ", [0], [])) == {-1, 1}
+        assert np.isclose(dev.expval("PauliZ", [0], []), 0)
+
+
+class TestExceptions:
+    """Tests for the exceptions raised by the stabilizer device"""
+
+    def test_too_many_probability_wires(self):
+        """Test that an exception is raised if the probabilities are requested
+        for too many wires"""
+        dev = qml.device("default.clifford", wires=20)
+
+        with pytest.raises(DeviceError, match="at most 16 wires"):
+            dev.execute([qml.Hadamard(wires=0)], [qml.probs(wires=list(range(17)))])
+
+    def test_non_clifford_operation(self):
+        """Test that non-Clifford operations are not supported"""
+        dev = qml.device("default.clifford", wires=2)
+
+        with pytest.raises(DeviceError, match="Gate T not supported"):
+            dev.execute([qml.T(wires=0)], [qml.expval(qml.PauliZ(0))])
+
+    def test_basis_state_after_operations(self):
+        """Test that an exception is raised if the basis state is prepared after
+        other operations"""
+        dev = qml.device("default.clifford", wires=2)
+        ops = [qml.PauliX(wires=0), qml.BasisState(np.array([1, 1]), wires=[0, 1])]
+
+        with pytest.raises(DeviceError, match="cannot be used after other Operations"):
+            dev.execute(ops, [qml.expval(qml.PauliZ(0))])
@@ -22,9 +22,10 @@ import pytest
 import pennylane as qml
 from pennylane import numpy as np, DeviceError
 from pennylane.operation import Operation
+from pennylane.qnodes.qubit import QubitQNode
 from pennylane.plugins.default_qubit import (CRot3, CRotx, CRoty, CRotz,
                                              Rot3, Rotx, Roty, Rotz,
-                                             Rphi, Z, hermitian,
+                                             Rphi, Z, CNOT, hermitian,
                                              spectral_decomposition, unitary)
 
 U = np.array(
@@ -817,6 +818,94 @@ class TestSample:
         # they square to 1
         assert np.allclose(s1**2, 1, atol=tol, rtol=0)
 
+    def test_sample_statistics(self):
+        """Tests that the samples of a rotated tensor product observable
+        have the correct mean"""
+        dev = qml.device("default.qubit", wires=3, shots=100000)
+        dev.reset()
+        dev.apply('RX', wires=[0], par=[0.5])
+        dev.apply('RY', wires=[2], par=[-0.8])
+        dev.apply('CNOT', wires=[2, 1], par=[])
+
+        A = np.array([[2, 1j, 0, 1], [-1j, 0, 1, 0], [0, 1, -1, 0], [1, 0, 0, 1]])
+        obs, wires, par = ["PauliY", "Hermitian"], [[0], [2, 1]], [[], [A]]
+
+        s = dev.sample(obs, wires, par)
+        expected = dev.ev(dev._get_tensor_operator_matrix(obs, par), [0, 2, 1])
+        assert np.allclose(np.mean(s), expected, atol=0.05, rtol=0)
+
+    def test_shared_samples(self):
+        """Tests that observables measured in the same basis share the same samples"""
+        dev = qml.device("default.qubit", wires=2, shots=100)
+
+        queue = [qml.Hadamard(wires=0), qml.CNOT(wires=[0, 1])]
+        observables = [
+            qml.sample(qml.PauliZ(0)),
+            qml.sample(qml.PauliZ(1)),
+            qml.sample(qml.PauliZ(0) @ qml.PauliZ(1)),
+        ]
+
+        s0, s1, s01 = dev.execute(queue, observables)
+
+        # the Bell state outcomes are perfectly correlated
+        assert np.array_equal(s0, s1)
+        assert np.all(s01 == 1)
+
+    def test_single_draw(self, monkeypatch):
+        """Tests that the samples are drawn once per group of qubit-wise commuting observables"""
+        dev = qml.device("default.qubit", wires=3, shots=10, analytic=False)
+
+        queue = [qml.RX(0.2, wires=0), qml.CNOT(wires=[0, 2])]
+        observables = [
+            qml.expval(qml.PauliZ(0)),
+            qml.var(qml.PauliZ(2)),
+            qml.sample(qml.PauliZ(0) @ qml.Identity(1)),
+            qml.expval(qml.PauliX(1)),
+        ]
+
+        draws = []
+        choice = np.random.choice
+
+        def mock_choice(*args, **kwargs):
+            draws.append(args[0])
+            return choice(*args, **kwargs)
+
+        monkeypatch.setattr("numpy.random.choice", mock_choice)
+        dev.execute(queue, observables)
+
+        assert draws == [8]
+        assert dev._basis_samples is None
+
+    def test_qubit_wise_commuting_groups(self, monkeypatch):
+        """Tests that qubit-wise commuting observables measured in different
+        bases share the same samples"""
+        dev = qml.device("default.qubit", wires=3, shots=50)
+
+        queue = [qml.RX(0.7, wires=0), qml.CNOT(wires=[0, 1]), qml.RY(0.3, wires=2)]
+        observables = [
+            qml.sample(qml.PauliX(0)),
+            qml.sample(qml.PauliY(1) @ qml.Hadamard(2)),
+            qml.sample(qml.PauliX(0) @ qml.PauliY(1)),
+            qml.sample(qml.PauliZ(0)),
+            qml.sample(qml.PauliY(1)),
+        ]
+
+        draws = []
+        choice = np.random.choice
+
+        def mock_choice(*args, **kwargs):
+            draws.append(args[0])
+            return choice(*args, **kwargs)
+
+        monkeypatch.setattr("numpy.random.choice", mock_choice)
+        x0, y1h2, x0y1, z0, y1 = dev.execute(queue, observables)
+
+        # one draw for the PauliZ(0) observable, and one for the others
+        assert draws == [8, 8]
+
+        # the samples of the tensor product are the products of the samples of the factors
+        assert np.array_equal(x0 * y1, x0y1)
+
 
 class TestDefaultQubitIntegration:
     """Integration tests for default.qubit. This test ensures it integrates
@@ -1617,3 +1706,809 @@ class TestTensorSample:
             )
         ) / 16
         assert np.allclose(var, expected, atol=tol, rtol=0)
+
+
+class TestPauliWord:
+    """Tests for the expectation values of tensor products of Pauli operators"""
+
+    words = [
+        (["PauliX", "PauliY"], [[0], [2]]),
+        (["PauliZ", "PauliY", "PauliX"], [[3], [1], [0]]),
+        (["PauliY", "Identity", "PauliY", "PauliZ"], [[2], [0], [1], [3]]),
+        (["PauliZ", "PauliZ"], [[1], [0]]),
+    ]
+
+    @staticmethod
+    def prepare(dev):
+        """Prepares an entangled state of four qubits"""
+        dev.reset()
+        for w in range(4):
+            dev.apply("RY", [w], [0.3 * w + 0.2])
+        dev.apply("CNOT", [0, 2], [])
+        dev.apply("CRX", [3, 1], [0.7])
+        dev.apply("Rot", [0], [0.1, -0.4, 1.2])
+
+    @pytest.mark.parametrize("observable, wires", words)
+    def test_expval(self, observable, wires, tol):
+        """Tests that the expectation value agrees with the operator matrix"""
+        dev = qml.device("default.qubit", wires=4)
+        self.prepare(dev)
+
+        res = dev.expval(observable, wires, [[]] * len(observable))
+        A = dev._get_tensor_operator_matrix(observable, [[]] * len(observable))
+        expected = dev.ev(A, wires)
+
+        assert np.allclose(res, expected, atol=tol, rtol=0)
+
+    @pytest.mark.parametrize("observable, wires", words)
+    def test_var(self, observable, wires, tol):
+        """Tests that the variance agrees with the operator matrix"""
+        dev = qml.device("default.qubit", wires=4)
+        self.prepare(dev)
+
+        res = dev.var(observable, wires, [[]] * len(observable))
+        A = dev._get_tensor_operator_matrix(observable, [[]] * len(observable))
+        expected = dev.ev(A @ A, wires) - dev.ev(A, wires) ** 2
+
+        assert np.allclose(res, expected, atol=tol, rtol=0)
+
+    def test_wide_pauli_word(self, monkeypatch, tol):
+        """Tests that the operator matrix of a Pauli word acting on 20 wires is not constructed"""
+        n = 20
+        dev = qml.device("default.qubit", wires=n)
+        dev.reset()
+
+        angles = 0.05 * np.arange(1, n + 1)
+        for w, a in enumerate(angles):
+            dev.apply("RY", [w], [a])
+
+        def mock_matrix(*args):
+            raise AssertionError("the operator matrix should not be constructed")
+
+        monkeypatch.setattr(dev, "_get_tensor_operator_matrix", mock_matrix)
+
+        observable = ["PauliX"] * 8 + ["PauliZ"] * 12
+        res = dev.expval(observable, [[w] for w in range(n)], [[]] * n)
+        expected = np.prod(np.sin(angles[:8])) * np.prod(np.cos(angles[8:]))
+
+        assert np.allclose(res, expected, atol=tol, rtol=0)
+
+    def test_single_precision(self, tol):
+        """Tests that the state precision is preserved"""
+        dev = qml.device("default.qubit", wires=4, dtype=np.complex64)
+        self.prepare(dev)
+
+        res = dev.expval(["PauliY", "PauliX"], [[0], [1]], [[], []])
+        A = dev._get_tensor_operator_matrix(["PauliY", "PauliX"], [[], []])
+
+        assert res.dtype == np.float32
+        assert np.allclose(res, dev.ev(A, [0, 1]), atol=1e-6, rtol=0)
+
+    def test_autograd(self, tol):
+        """Tests that the expectation value can be differentiated by default.qubit.autograd"""
+        dev = qml.device("default.qubit.autograd", wires=2)
+
+        @qml.qnode(dev)
+        def circuit(x):
+            qml.RX(x, wires=0)
+            qml.CNOT(wires=[0, 1])
+            qml.RY(x, wires=1)
+            return qml.expval(qml.PauliY(0) @ qml.PauliX(1))
+
+        x = 0.3
+        expected = QubitQNode(circuit.func, qml.device("default.qubit", wires=2)).jacobian([x])
+        assert np.allclose(circuit.jacobian([x]), expected, atol=tol, rtol=0)
+
+
+class TestCompile:
+    """Tests for the execution plans of default.qubit"""
+
+    def test_compiled_matches_execute(self, tol):
+        """Test that executing a compiled circuit gives the same result as execute"""
+        dev = qml.device("default.qubit", wires=3)
+
+        queue = [
+            qml.BasisState(np.array([1, 0]), wires=[0, 2]),
+            qml.RX(0.4, wires=0),
+            qml.Hadamard(wires=1),
+            qml.S(wires=1).inv(),
+            qml.Rot(0.1, -0.3, 0.2, wires=2).inv(),
+            qml.CRZ(0.7, wires=[2, 0]),
+            qml.Toffoli(wires=[1, 0, 2]),
+        ]
+        observables = [qml.expval(qml.PauliX(0) @ qml.PauliY(1)), qml.var(qml.PauliZ(2))]
+
+        plan = dev.compile(queue, observables)
+        assert len(plan) == len(queue)
+
+        dev.reset()
+        res = dev.execute_compiled(plan, queue, observables)
+
+        dev.reset()
+        expected = dev.execute(queue, observables)
+
+        assert np.allclose(res, expected, atol=tol, rtol=0)
+
+    def test_fixed_matrices_resolved(self):
+        """Test that the matrices of non-parametrized operations,
+        and their inverses, are resolved when compiling"""
+        dev = qml.device("default.qubit", wires=2)
+
+        queue = [qml.Hadamard(wires=1).inv(), qml.RX(0.4, wires=0).inv(), qml.CRY(0.2, wires=[1, 0])]
+        plan = dev.compile(queue, [])
+
+        assert np.allclose(plan[0].matrix, np.array([[1, 1], [1, -1]]) / np.sqrt(2))
+        assert not plan[0].inverse
+        assert plan[1].matrix is Rotx
+        assert plan[1].inverse
+        assert plan[2].wires == [1, 0]
+        assert np.array_equal(plan[2].perm, [1, 0])
+
+    def test_kernels_resolved(self):
+        """Test that diagonal and permutation operations are assigned
+        their specialized kernels when compiling"""
+        dev = qml.device("default.qubit", wires=2)
+
+        queue = [qml.S(wires=1).inv(), qml.RZ(0.4, wires=0), qml.CNOT(wires=[1, 0])]
+        plan = dev.compile(queue, [])
+
+        assert plan[0].kernel == "diagonal"
+        assert np.allclose(plan[0].matrix, [1, -1j])
+        assert not plan[0].inverse
+        assert plan[1].kernel == "diagonal"
+        assert plan[1].matrix is Rotz
+        assert plan[2].kernel == "permutation"
+        assert plan[2].matrix is None
+
+    def test_compile_checks_validity(self):
+        """Test that compiling raises an exception for unsupported operations"""
+        dev = qml.device("default.qubit", wires=1)
+
+        with pytest.raises(DeviceError, match="Gate U3 not supported"):
+            dev.compile([qml.U3(0.1, 0.2, 0.3, wires=0)], [])
+
+
+class TestKernels:
+    """Tests for the specialized kernels applying diagonal and permutation operations"""
+
+    @staticmethod
+    def random_state(num_wires, batch_size=None):
+        """Returns a normalized random state, optionally with a leading batch dimension"""
+        shape = (2 ** num_wires,) if batch_size is None else (batch_size, 2 ** num_wires)
+        state = np.random.random(shape) + 1j * np.random.random(shape)
+        return state / np.linalg.norm(state, axis=-1, keepdims=True)
+
+    @pytest.mark.parametrize(
+        "operation,par,wires",
+        [
+            ("PauliZ", [], [2]),
+            ("S", [], [0]),
+            ("T.inv", [], [3]),
+            ("RZ", [0.4], [1]),
+            ("PhaseShift.inv", [-1.2], [2]),
+            ("CZ", [], [3, 1]),
+            ("CRZ", [0.7], [2, 0]),
+            ("CRZ.inv", [0.7], [1, 3]),
+        ],
+    )
+    def test_diagonal(self, operation, par, wires, tol):
+        """Test that diagonal operations agree with the dense matrix product"""
+        dev = qml.device("default.qubit", wires=4)
+        dev._state = self.random_state(4)
+
+        A = dev._get_operator_matrix(operation, par)
+        expected = dev.mat_vec_product(A, dev._state, wires)
+
+        dev.apply(operation, wires, par)
+        assert np.allclose(dev._state, expected, atol=tol, rtol=0)
+
+    @pytest.mark.parametrize(
+        "operation,wires",
+        [
+            ("PauliX", [0]),
+            ("PauliX", [3]),
+            ("CNOT", [0, 1]),
+            ("CNOT", [3, 1]),
+            ("SWAP", [2, 0]),
+            ("Toffoli", [0, 1, 2]),
+            ("Toffoli", [3, 0, 2]),
+            ("Toffoli.inv", [2, 3, 1]),
+            ("CSWAP", [1, 3, 0]),
+            ("CSWAP", [2, 0, 1]),
+        ],
+    )
+    def test_permutation(self, operation, wires, tol):
+        """Test that permutation operations agree with the dense matrix product"""
+        dev = qml.device("default.qubit", wires=4)
+        dev._state = self.random_state(4)
+
+        A = dev._get_operator_matrix(operation, [])
+        expected = dev.mat_vec_product(A, dev._state, wires)
+
+        dev.apply(operation, wires, [])
+        assert np.allclose(dev._state, expected, atol=tol, rtol=0)
+
+    @pytest.mark.parametrize("operation,wires", [("CZ", [2, 0]), ("Toffoli", [2, 0, 1])])
+    def test_batched_state(self, operation, wires, tol):
+        """Test that the kernels apply the operation to every state in a batch"""
+        dev = qml.device("default.qubit", wires=3)
+        states = self.random_state(3, batch_size=4)
+        dev._state = states
+
+        A = dev._get_operator_matrix(operation, [])
+        dev.apply(operation, wires, [])
+
+        assert dev._state.shape == (4, 8)
+        expected = [dev.mat_vec_product(A, s, wires) for s in states]
+        assert np.allclose(dev._state, expected, atol=tol, rtol=0)
+
+    def test_no_tensordot(self, monkeypatch):
+        """Test that the kernels do not contract the state with the operation matrix"""
+        dev = qml.device("default.qubit", wires=3)
+
+        queue = [
+            qml.PauliX(wires=0),
+            qml.CNOT(wires=[0, 1]),
+            qml.T(wires=2),
+            qml.CRZ(0.3, wires=[1, 2]),
+        ]
+
+        def mock_tensordot(*args, **kwargs):
+            raise AssertionError("the state should not be contracted")
+
+        monkeypatch.setattr(dev, "_tensordot", mock_tensordot)
+        monkeypatch.setattr(dev, "_einsum", mock_tensordot)
+
+        dev.reset()
+        dev.execute(queue, [])
+
+        dev.reset()
+        dev.execute_compiled(dev.compile(queue, []), queue, [])
+
+
+class TestInplace:
+    """Tests for the in-place state updates of default.qubit"""
+
+    @staticmethod
+    def queue(num_wires):
+        """Returns an operation queue containing dense, diagonal and permutation operations"""
+        queue = [qml.Hadamard(wires=i) for i in range(num_wires)]
+        queue += [qml.CRX(0.3 * i, wires=[i, (i + 2) % num_wires]) for i in range(num_wires)]
+        queue += [qml.CNOT(wires=[i, (i + 1) % num_wires]) for i in range(num_wires)]
+        queue += [
+            qml.RZ(0.2, wires=1),
+            qml.CZ(wires=[2, 0]),
+            qml.Toffoli(wires=[0, 3, 1]),
+            qml.CSWAP(wires=[3, 1, 2]),
+            qml.SWAP(wires=[2, 0]),
+            qml.Rot(0.1, 0.2, 0.3, wires=3).inv(),
+            qml.QubitUnitary(U2, wires=[3, 1]),
+        ]
+        return queue
+
+    def test_agrees_with_default(self, tol):
+        """Test that updating the state in place gives the same results"""
+        observables = [qml.expval(qml.PauliX(0) @ qml.PauliY(2)), qml.var(qml.PauliZ(3))]
+
+        dev1 = qml.device("default.qubit", wires=4, inplace=True)
+        dev2 = qml.device("default.qubit", wires=4)
+
+        res = dev1.execute(self.queue(4), observables)
+        expected = dev2.execute(self.queue(4), observables)
+        assert np.allclose(res, expected, atol=tol, rtol=0)
+
+        queue = self.queue(4)
+        res = dev1.execute_compiled(dev1.compile(queue, observables), queue, observables)
+        assert np.allclose(res, expected, atol=tol, rtol=0)
+
+    @pytest.mark.parametrize("state_prep", [
+        qml.BasisState(np.array([1, 0, 1, 1]), wires=[0, 1, 2, 3]),
+        qml.QubitStateVector(np.ones(4) / 2, wires=[1, 3]),
+    ])
+    def test_state_preparation(self, state_prep, tol):
+        """Test that state preparations reuse the state buffer"""
+        dev1 = qml.device("default.qubit", wires=4, inplace=True)
+        dev2 = qml.device("default.qubit", wires=4)
+
+        dev1.reset()
+        buffer = dev1._state
+        dev1.apply(state_prep.name, state_prep.wires, state_prep.parameters)
+        assert dev1._state is buffer
+
+        res = dev1.execute([state_prep] + self.queue(4), [qml.expval(qml.PauliZ(0))])
+        expected = dev2.execute([state_prep] + self.queue(4), [qml.expval(qml.PauliZ(0))])
+        assert np.allclose(res, expected, atol=tol, rtol=0)
+
+    def test_buffers_reused(self):
+        """Test that the state is always held in one of the two buffers of the device"""
+        dev = qml.device("default.qubit", wires=4, inplace=True)
+        dev.reset()
+        buffers = {id(dev._state), id(dev._scratch)}
+
+        for op in self.queue(4):
+            dev.apply(op.name, op.wires, op.parameters)
+            assert {id(dev._state), id(dev._scratch)} == buffers
+
+        dev.reset()
+        assert {id(dev._state), id(dev._scratch)} == buffers
+
+    def test_peak_memory(self):
+        """Test that no copies of the state are allocated while applying the operations"""
+        import tracemalloc
+
+        num_wires = 16
+        dev = qml.device("default.qubit", wires=num_wires, inplace=True)
+        dev.reset()
+        queue = self.queue(num_wires)
+
+        tracemalloc.start()
+        for op in queue:
+            dev.apply(op.name, op.wires, op.parameters)
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+
+        # only the fixed-size iteration buffers of NumPy are allocated
+        assert peak < dev._state.nbytes / 2
+
+    def test_broadcasting(self, tol):
+        """Test that batched states are not updated in place"""
+        dev = qml.device("default.qubit", wires=2, inplace=True)
+
+        circuits = [
+            ([qml.RX(x, wires=0), qml.CNOT(wires=[0, 1]), qml.T(wires=1)], [qml.expval(qml.PauliZ(1))])
+            for x in [0.1, 0.2, 0.3]
+        ]
+        res = dev.batch_execute(circuits)
+        assert np.allclose(np.ravel(res), np.cos([0.1, 0.2, 0.3]), atol=tol, rtol=0)
+
+        dev.reset()
+        assert dev._state.shape == dev._scratch.shape
+
+
+class TestThreading:
+    """Tests for the multi-threaded gate application of default.qubit"""
+
+    @pytest.mark.parametrize("inplace", [False, True])
+    @pytest.mark.parametrize("threads", [2, 3, 8])
+    def test_agrees_with_default(self, threads, inplace, monkeypatch, tol):
+        """Test that applying the operations using several threads gives the same results"""
+        observables = [qml.expval(qml.PauliX(0) @ qml.PauliY(2)), qml.var(qml.PauliZ(3))]
+
+        dev1 = qml.device("default.qubit", wires=4, threads=threads, inplace=inplace)
+        dev2 = qml.device("default.qubit", wires=4)
+        monkeypatch.setattr(dev1, "_min_threaded_size", 1)
+
+        res = dev1.execute(TestInplace.queue(4), observables)
+        expected = dev2.execute(TestInplace.queue(4), observables)
+        assert np.allclose(res, expected, atol=tol, rtol=0)
+
+        queue = TestInplace.queue(4)
+        res = dev1.execute_compiled(dev1.compile(queue, observables), queue, observables)
+        assert np.allclose(res, expected, atol=tol, rtol=0)
+
+    def test_slices_processed_by_pool(self, monkeypatch):
+        """Test that the slices of the state are submitted to the thread pool, and that
+        operations acting on all subsystems are applied directly"""
+        dev = qml.device("default.qubit", wires=3, threads=4)
+        monkeypatch.setattr(dev, "_min_threaded_size", 1)
+        dev.reset()
+
+        dev.apply("RX", [1], [0.3])
+        executor_map = dev._executor.map
+        calls = []
+
+        def spy(fn, slices):
+            calls.append(list(slices))
+            return executor_map(fn, calls[-1])
+
+        monkeypatch.setattr(dev._executor, "map", spy)
+
+        dev.apply("CRY", [2, 0], [0.2])
+        assert calls == [[(0,), (1,)]]
+
+        dev.apply("QubitUnitary", [0, 1, 2], [np.eye(8)])
+        assert len(calls) == 1
+
+    def test_small_states_not_threaded(self):
+        """Test that states below the size threshold are not partitioned"""
+        dev = qml.device("default.qubit", wires=3, threads=4)
+        dev.execute([qml.RX(0.1, wires=0), qml.CNOT(wires=[0, 1])], [qml.expval(qml.PauliZ(1))])
+        assert dev._executor is None
+
+    def test_invalid_threads(self):
+        """Test that an exception is raised if the number of threads is not positive"""
+        with pytest.raises(DeviceError, match="number of threads must be at least one"):
+            qml.device("default.qubit", wires=2, threads=0)
+
+
+class TestOutOfCore:
+    """Tests for the memory-mapped state vector of default.qubit"""
+
+    observables = [
+        qml.expval(qml.PauliX(0) @ qml.PauliY(2)),
+        qml.var(qml.PauliZ(3)),
+        qml.expval(qml.Hermitian(np.kron(H, Z), wires=[1, 3])),
+        qml.var(qml.Hadamard(1) @ qml.PauliZ(0)),
+    ]
+
+    @pytest.mark.parametrize("threads", [1, 2])
+    def test_agrees_with_default(self, threads, tmp_path, monkeypatch, tol):
+        """Test that simulating the circuit out of core, in slices, gives the same results"""
+        dev1 = qml.device("default.qubit", wires=4, memmap_dir=str(tmp_path), threads=threads)
+        dev2 = qml.device("default.qubit", wires=4)
+        monkeypatch.setattr(dev1, "_max_block_size", 4)
+
+        res = dev1.execute(TestInplace.queue(4), self.observables)
+        expected = dev2.execute(TestInplace.queue(4), self.observables)
+        assert np.allclose(res, expected, atol=tol, rtol=0)
+        assert isinstance(dev1._state, np.memmap)
+
+        queue = TestInplace.queue(4)
+        res = dev1.execute_compiled(dev1.compile(queue, self.observables), queue, self.observables)
+        assert np.allclose(res, expected, atol=tol, rtol=0)
+
+    @pytest.mark.parametrize("wires", [None, [2, 0], [1], [0, 1, 2, 3]])
+    def test_probability(self, wires, tmp_path, monkeypatch, tol):
+        """Test that the marginal probabilities are accumulated over the slices of the state"""
+        dev1 = qml.device("default.qubit", wires=4, memmap_dir=str(tmp_path))
+        dev2 = qml.device("default.qubit", wires=4)
+        monkeypatch.setattr(dev1, "_max_block_size", 2)
+
+        for dev in (dev1, dev2):
+            dev.reset()
+            for op in TestInplace.queue(4):
+                dev.apply(op.name, op.wires, op.parameters)
+
+        res = dev1.marginal_probability(wires)
+        expected = dev2.marginal_probability(wires)
+        assert np.allclose(res, expected, atol=tol, rtol=0)
+
+    def test_sliced_probability_rotations(self, tmp_path, monkeypatch, tol):
+        """Test that the streamed probabilities are returned in the order of the given wires,
+        after rotating each slice of the state"""
+        dev = qml.device("default.qubit", wires=3, memmap_dir=str(tmp_path))
+        monkeypatch.setattr(dev, "_max_block_size", 2)
+        dev.reset()
+        dev.apply("PauliX", [2], [])
+
+        rotations = [(qml.plugins.default_qubit.H, [0])]
+        res = dev._sliced_probability([2, 0, 1], rotations)
+
+        expected = np.zeros([2, 2, 2])
+        expected[1, :, 0] = 0.5
+        assert np.allclose(res, expected.ravel(), atol=tol, rtol=0)
+
+    def test_sample(self, tmp_path, monkeypatch):
+        """Test that samples are drawn from the streamed probabilities"""
+        dev = qml.device("default.qubit", wires=3, memmap_dir=str(tmp_path), shots=10)
+        monkeypatch.setattr(dev, "_max_block_size", 2)
+
+        queue = [qml.PauliX(wires=0), qml.Hadamard(wires=2)]
+        observables = [qml.sample(qml.PauliZ(0)), qml.sample(qml.PauliX(2) @ qml.PauliZ(1))]
+        res = dev.execute(queue, observables)
+
+        assert np.all(res[0] == -1)
+        assert np.all(res[1] == 1)
+
+    def test_reset_reuses_file(self, tmp_path):
+        """Test that the memory-mapped state is reused after a reset"""
+        dev = qml.device("default.qubit", wires=3, memmap_dir=str(tmp_path))
+        dev.reset()
+        buffer = dev._state
+
+        dev.apply("BasisState", [0, 1, 2], [np.array([1, 0, 1])])
+        dev.apply("RX", [0], [0.3])
+        assert dev._state is buffer
+
+        dev.reset()
+
+        assert dev._state is buffer
+        assert np.allclose(dev._state, np.eye(8)[0])
+
+
+class TestProbability:
+    """Tests for the probabilities of the computational basis states"""
+
+    def test_marginal_probability(self, tol):
+        """Test that the probability array agrees with the probability dictionary"""
+        dev = qml.device("default.qubit", wires=3)
+        dev.execute([qml.RX(0.4, wires=0), qml.RY(-0.2, wires=2), qml.CNOT(wires=[0, 1])], [])
+
+        for wires in [None, [0], [2, 1], [0, 1, 2]]:
+            res = dev.marginal_probability(wires=wires)
+            expected = dev.probability(wires=wires)
+
+            assert isinstance(res, np.ndarray)
+            assert np.allclose(res, list(expected.values()), atol=tol, rtol=0)
+
+        expected = np.abs(dev._state) ** 2
+        assert np.allclose(dev.marginal_probability(), expected, atol=tol, rtol=0)
+
+        expected = np.sum(expected.reshape(2, 2, 2), axis=1).ravel()
+        assert np.allclose(dev.marginal_probability(wires=[2, 0]), expected, atol=tol, rtol=0)
+
+    def test_probabilities_computed_once(self, monkeypatch):
+        """Test that the probabilities of the state are reused by all probs observables"""
+        dev = qml.device("default.qubit", wires=3)
+
+        calls = []
+        abs_fn = dev._abs
+
+        def mock_abs(x):
+            calls.append(np.shape(x))
+            return abs_fn(x)
+
+        monkeypatch.setattr(dev, "_abs", mock_abs)
+
+        queue = [qml.Hadamard(wires=0), qml.CNOT(wires=[0, 2])]
+        observables = [qml.probs(wires=[0]), qml.probs(wires=[1, 2]), qml.probs(wires=[2])]
+        res = dev.execute(queue, observables)
+
+        assert calls == [(8,)]
+        assert np.allclose(res[0], [0.5, 0.5])
+        assert np.allclose(res[1], [0.5, 0.5, 0, 0])
+
+        dev.probability(wires=[1])
+        assert calls == [(8,)]
+
+    @pytest.mark.parametrize("inplace", [False, True])
+    def test_cache_invalidated(self, inplace, tol):
+        """Test that the cached probabilities are recomputed when the state changes"""
+        dev = qml.device("default.qubit", wires=2, inplace=inplace)
+        dev.reset()
+
+        assert np.allclose(dev.marginal_probability(), [1, 0, 0, 0], atol=tol, rtol=0)
+
+        dev.apply("PauliX", [1], [])
+        assert np.allclose(dev.marginal_probability(), [0, 1, 0, 0], atol=tol, rtol=0)
+
+        dev.apply("SWAP", [0, 1], [])
+        assert np.allclose(dev.marginal_probability(), [0, 0, 1, 0], atol=tol, rtol=0)
+
+        queue = [qml.PauliX(wires=0)]
+        dev.apply_compiled(dev.compile(queue, []), queue)
+        assert np.allclose(dev.marginal_probability(), [1, 0, 0, 0], atol=tol, rtol=0)
+
+
+class TestSinglePrecision:
+    """Tests for the single-precision mode of default.qubit"""
+
+    @staticmethod
+    def queue():
+        """Returns an operation queue containing dense, diagonal and permutation operations"""
+        return [
+            qml.QubitStateVector(np.array([1, 1j, 0, 1]) / np.sqrt(3), wires=[2, 0]),
+            qml.Hadamard(wires=1),
+            qml.RX(0.4, wires=0),
+            qml.CRY(-1.2, wires=[1, 2]),
+            qml.CNOT(wires=[2, 0]),
+            qml.T(wires=2).inv(),
+            qml.CRZ(0.7, wires=[0, 1]),
+            qml.Rot(0.1, 0.2, 0.3, wires=2).inv(),
+            qml.QubitUnitary(U2, wires=[1, 0]),
+        ]
+
+    @pytest.mark.parametrize("inplace", [False, True])
+    def test_agrees_with_double_precision(self, inplace):
+        """Test that the results agree with double precision to single-precision accuracy"""
+        observables = [
+            qml.expval(qml.PauliX(0) @ qml.PauliY(2)),
+            qml.var(qml.Hermitian(np.array([[1, 2j], [-2j, 0]]), wires=1)),
+        ]
+
+        dev1 = qml.device("default.qubit", wires=3, dtype=np.complex64, inplace=inplace)
+        dev2 = qml.device("default.qubit", wires=3)
+
+        res = dev1.execute(self.queue(), observables)
+        assert dev1._state.dtype == np.complex64
+
+        expected = dev2.execute(self.queue(), observables)
+        assert np.allclose(res, expected, atol=1e-6, rtol=0)
+
+        queue = self.queue()
+        res = dev1.execute_compiled(dev1.compile(queue, observables), queue, observables)
+        assert dev1._state.dtype == np.complex64
+        assert np.allclose(res, expected, atol=1e-6, rtol=0)
+
+    def test_probability(self):
+        """Test that the probabilities are computed in single precision"""
+        dev1 = qml.device("default.qubit", wires=3, dtype=np.complex64)
+        dev2 = qml.device("default.qubit", wires=3)
+
+        dev1.execute(self.queue(), [])
+        dev2.execute(self.queue(), [])
+
+        res = np.array(list(dev1.probability(wires=[2, 0]).values()))
+        expected = np.array(list(dev2.probability(wires=[2, 0]).values()))
+
+        assert res.dtype == np.float32
+        assert np.allclose(res, expected, atol=1e-6, rtol=0)
+
+    def test_sample(self):
+        """Test that samples can be drawn despite the rounding errors of single precision"""
+        dev = qml.device("default.qubit", wires=12, dtype=np.complex64, shots=10)
+        queue = [qml.Hadamard(wires=i) for i in range(12)]
+        queue += [qml.RX(0.1 * i, wires=i) for i in range(12)]
+        dev.execute(queue, [])
+
+        res = dev.sample("PauliZ", [3], [])
+        assert res.shape == (10,)
+        assert set(res).issubset({-1, 1})
+
+        res = dev.sample("Hermitian", [7, 2], [np.diag([1.0, 2.0, 3.0, 4.0])])
+        assert set(res).issubset({1, 2, 3, 4})
+
+    def test_state_size(self):
+        """Test that the state requires half the memory of double precision"""
+        dev1 = qml.device("default.qubit", wires=4, dtype=np.complex64)
+        dev2 = qml.device("default.qubit", wires=4)
+        dev1.reset()
+        dev2.reset()
+
+        assert dev1._state.nbytes == dev2._state.nbytes // 2
+
+    def test_invalid_dtype(self):
+        """Test that an exception is raised for unsupported data types"""
+        with pytest.raises(DeviceError, match="Data type float64 not supported"):
+            qml.device("default.qubit", wires=1, dtype=np.float64)
+
+
+class TestBroadcasting:
+    """Tests for the simulation of batches of circuits using parameter broadcasting"""
+
+    @staticmethod
+    def circuit(x, y, return_type=qml.expval):
+        """Returns the operation queue and observables of a test circuit"""
+        queue = [
+            qml.RX(x, wires=0),
+            qml.RY(y, wires=1),
+            qml.CNOT(wires=[0, 1]),
+            qml.Rot(x, 0.3, y, wires=2),
+            qml.CRZ(0.2, wires=[1, 2]),
+        ]
+        observables = [
+            return_type(qml.PauliZ(0)),
+            return_type(qml.PauliX(1) @ qml.PauliY(2)),
+            return_type(qml.Hermitian(np.diag([1.0, 2.0]), wires=2)),
+        ]
+        return queue, observables
+
+    def test_batched_mat_vec_product(self, tol):
+        """Test that a batch of matrices is applied to a batch of states"""
+        dev = qml.device("default.qubit", wires=2)
+
+        mats = np.stack([Rotx(0.1), Roty(0.2), Rotz(0.3)])
+        states = np.stack([np.ones(4) / 2, np.array([1, 0, 0, 0]), np.array([0, 0, 0, 1])])
+
+        res = dev.mat_vec_product(mats, states, [1])
+        expected = [dev.mat_vec_product(m, s, [1]) for m, s in zip(mats, states)]
+
+        assert res.shape == (3, 4)
+        assert np.allclose(res, expected, atol=tol, rtol=0)
+
+    def test_single_matrix_batched_state(self, tol):
+        """Test that a single matrix is applied to every state in a batch"""
+        dev = qml.device("default.qubit", wires=2)
+
+        states = np.stack([np.ones(4) / 2, np.array([1, 0, 0, 0])])
+        res = dev.mat_vec_product(CNOT, states, [1, 0])
+        expected = [dev.mat_vec_product(CNOT, s, [1, 0]) for s in states]
+
+        assert res.shape == (2, 4)
+        assert np.allclose(res, expected, atol=tol, rtol=0)
+
+    @pytest.mark.parametrize("return_type", [qml.expval, qml.var])
+    def test_broadcast_matches_execute(self, return_type, tol):
+        """Test that broadcasting a batch of circuits gives the
+        same results as executing the circuits one at a time"""
+        dev = qml.device("default.qubit", wires=3)
+        params = [(0.1, 0.2), (0.5, -0.3), (1.2, 0.9), (0.1, 0.2)]
+        circuits = [self.circuit(x, y, return_type) for x, y in params]
+
+        res = dev.batch_execute(circuits)
+
+        expected = []
+        for queue, observables in circuits:
+            dev.reset()
+            expected.append(dev.execute(queue, observables))
+
+        assert len(res) == len(params)
+        assert np.allclose(res, expected, atol=tol, rtol=0)
+
+    def test_broadcast_probs(self, tol):
+        """Test that marginal probabilities are broadcasted"""
+        dev = qml.device("default.qubit", wires=3)
+        circuits = [
+            ([qml.RX(x, wires=0), qml.CNOT(wires=[0, 2])], [qml.probs(wires=[0, 2])])
+            for x in [0.1, 0.6, 2.1]
+        ]
+
+        res = dev.batch_execute(circuits)
+
+        for r, (queue, observables) in zip(res, circuits):
+            dev.reset()
+            assert np.allclose(r, dev.execute(queue, observables), atol=tol, rtol=0)
+
+    def test_hooks_called_once(self, monkeypatch):
+        """Test that the execution hooks are called once for a broadcasted batch"""
+        dev = qml.device("default.qubit", wires=3)
+        calls = []
+
+        for hook in ["pre_apply", "post_apply", "pre_measure", "post_measure"]:
+            original = getattr(dev, hook)
+
+            def mock_hook(hook=hook, original=original):
+                calls.append((hook, dev._op_queue is not None))
+                original()
+
+            monkeypatch.setattr(dev, hook, mock_hook)
+
+        dev.batch_execute([self.circuit(0.1 * i, 0.2) for i in range(3)])
+
+        assert calls == [
+            ("pre_apply", True),
+            ("post_apply", True),
+            ("pre_measure", True),
+            ("post_measure", True),
+        ]
+        assert dev._op_queue is None
+
+    def test_circuits_are_grouped(self, monkeypatch, tol):
+        """Test that circuits are grouped by structure, and that
+        the results are returned in the original order"""
+        dev = qml.device("default.qubit", wires=3)
+
+        other = ([qml.RX(0.4, wires=1)], [qml.expval(qml.PauliZ(1))])
+        circuits = [self.circuit(0.1, 0.2), other, self.circuit(0.3, 0.4), self.circuit(0.5, 0.6)]
+
+        batches = []
+        broadcast = dev._execute_broadcast
+
+        def mock_broadcast(circuits):
+            batches.append(len(circuits))
+            return broadcast(circuits)
+
+        monkeypatch.setattr(dev, "_execute_broadcast", mock_broadcast)
+        res = dev.batch_execute(circuits)
+
+        assert batches == [3]
+        assert np.allclose(res[1], [np.cos(0.4)], atol=tol, rtol=0)
+
+        for r, (queue, observables) in zip(res, circuits):
+            dev.reset()
+            assert np.allclose(r, dev.execute(queue, observables), atol=tol, rtol=0)
+
+    def test_batches_are_split(self, monkeypatch):
+        """Test that batches larger than the maximum broadcast size are split"""
+        dev = qml.device("default.qubit", wires=3)
+        monkeypatch.setattr(dev, "_max_broadcast_size", 2 * 2 ** 3)
+
+        batches = []
+        broadcast = dev._execute_broadcast
+
+        def mock_broadcast(circuits):
+            batches.append(len(circuits))
+            return broadcast(circuits)
+
+        monkeypatch.setattr(dev, "_execute_broadcast", mock_broadcast)
+        dev.batch_execute([self.circuit(0.1 * i, 0.2) for i in range(5)])
+
+        # the final circuit is executed on its own
+        assert batches == [2, 2]
+
+    def test_samples_not_broadcasted(self, monkeypatch):
+        """Test that circuits returning samples, or executed in non-analytic
+        mode, are not broadcasted"""
+        dev = qml.device("default.qubit", wires=3)
+
+        def mock_broadcast(circuits):
+            raise AssertionError("should not be broadcasted")
+
+        monkeypatch.setattr(dev, "_execute_broadcast", mock_broadcast)
+
+        res = dev.batch_execute([self.circuit(0.1, 0.2, qml.sample) for _ in range(2)])
+        assert [r.shape for r in res] == [(3, dev.shots)] * 2
+
+        dev.analytic = False
+        res = dev.batch_execute([self.circuit(0.1, 0.2) for _ in range(2)])
+        assert len(res) == 2
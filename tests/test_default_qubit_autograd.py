@@ -0,0 +1,238 @@
+# Copyright 2019 Xanadu Quantum Technologies Inc.
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+
+#     http://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+Unit tests for the :mod:`pennylane.plugin.DefaultQubitAutograd` device.
+"""
+import pytest
+
+import pennylane as qml
+from pennylane import numpy as np
+from pennylane.plugins import default_qubit, default_qubit_autograd
+from pennylane.qnodes import qnode, QNode
+from pennylane.qnodes.device_jacobian import DeviceJacobianQNode
+
+
+thetas = np.linspace(-2 * np.pi, 2 * np.pi, 7)
+
+
+class TestOperatorMatrices:
+    """Tests that the Autograd gate matrices agree with default.qubit"""
+
+    @pytest.mark.parametrize("theta", thetas)
+    @pytest.mark.parametrize("name", ["PhaseShift", "RX", "RY", "RZ", "CRX", "CRY", "CRZ"])
+    def test_single_parameter(self, name, theta, tol):
+        """Test the single parameter gates"""
+        res = default_qubit_autograd.DefaultQubitAutograd._operation_map[name](theta)
+        expected = default_qubit.DefaultQubit._operation_map[name](theta)
+        assert np.allclose(res, expected, atol=tol, rtol=0)
+
+    @pytest.mark.parametrize("name", ["Rot", "CRot"])
+    def test_three_parameters(self, name, tol):
+        """Test the three parameter gates"""
+        res = default_qubit_autograd.DefaultQubitAutograd._operation_map[name](0.1, -0.4, 2.3)
+        expected = default_qubit.DefaultQubit._operation_map[name](0.1, -0.4, 2.3)
+        assert np.allclose(res, expected, atol=tol, rtol=0)
+
+
+class TestQNodeIntegration:
+    """Integration tests for default.qubit.autograd. This test ensures it integrates
+    properly with the PennyLane UI, in particular the new QNode."""
+
+    def test_load_device(self):
+        """Test that the plugin loads correctly"""
+        dev = qml.device("default.qubit.autograd", wires=2)
+        assert dev.num_wires == 2
+        assert dev.shots == 1000
+        assert dev.analytic
+        assert dev.short_name == "default.qubit.autograd"
+        assert dev.capabilities()["provides_jacobian"]
+
+    def test_device_jacobian_qnode(self):
+        """Test that the best differentiation method hands off to the device"""
+        dev = qml.device("default.qubit.autograd", wires=1)
+
+        @qnode(dev, interface=None)
+        def circuit(x):
+            qml.RX(x, wires=0)
+            return qml.expval(qml.PauliY(0))
+
+        assert isinstance(circuit, DeviceJacobianQNode)
+
+    def test_qubit_circuit(self, tol):
+        """Test that the plugin provides correct result for a simple circuit"""
+        p = 0.543
+
+        dev = qml.device("default.qubit.autograd", wires=1)
+
+        @qnode(dev)
+        def circuit(x):
+            qml.RX(x, wires=0)
+            return qml.expval(qml.PauliY(0))
+
+        assert np.isclose(circuit(p), -np.sin(p), atol=tol, rtol=0)
+
+
+class TestJacobianIntegration:
+    """Tests for the Jacobian calculation"""
+
+    def test_jacobian_variable_multiply(self, tol):
+        """Test that qnode.jacobian gives the correct result
+        in the case of parameters multiplied by scalars"""
+        x = 0.43316321
+        y = 0.2162158
+        z = 0.75110998
+
+        dev = qml.device("default.qubit.autograd", wires=1)
+
+        @qnode(dev)
+        def circuit(p):
+            qml.RX(3 * p[0], wires=0)
+            qml.RY(p[1], wires=0)
+            qml.RX(p[2] / 2, wires=0)
+            return qml.expval(qml.PauliZ(0))
+
+        res = circuit.jacobian([[x, y, z]])
+        expected = np.array(
+            [
+                -3 * (np.sin(3 * x) * np.cos(y) * np.cos(z / 2) + np.cos(3 * x) * np.sin(z / 2)),
+                -np.cos(3 * x) * np.sin(y) * np.cos(z / 2),
+                -0.5 * (np.sin(3 * x) * np.cos(z / 2) + np.cos(3 * x) * np.cos(y) * np.sin(z / 2)),
+            ]
+        )
+
+        assert np.allclose(res, expected, atol=tol, rtol=0)
+
+    def test_jacobian_zero_multiplier(self, tol):
+        """Test that qnode.jacobian gives the correct result
+        in the case of a parameter multiplied by zero"""
+        y = 0.2162158
+
+        dev = qml.device("default.qubit.autograd", wires=1)
+
+        @qnode(dev)
+        def circuit(p):
+            qml.RX(0 * p[0], wires=0)
+            qml.RY(p[1], wires=0)
+            return qml.expval(qml.PauliZ(0))
+
+        res = circuit.jacobian([[0.5, y]])
+        assert np.allclose(res, [[0, -np.sin(y)]], atol=tol, rtol=0)
+
+    def test_jacobian_repeated(self, tol):
+        """Test that qnode.jacobian gives the correct result
+        in the case of repeated parameters"""
+        x = 0.43316321
+        y = 0.2162158
+        z = 0.75110998
+        p = np.array([x, y, z])
+        dev = qml.device("default.qubit.autograd", wires=1)
+
+        @qnode(dev)
+        def circuit(x):
+            qml.RX(x[1], wires=0)
+            qml.Rot(x[0], x[1], x[2], wires=0)
+            return qml.expval(qml.PauliZ(0))
+
+        res = circuit.jacobian([p])
+        expected = np.array(
+            [-np.cos(x) * np.sin(y) ** 2, -2 * (np.sin(x) + 1) * np.sin(y) * np.cos(y), 0]
+        )
+        assert np.allclose(res, expected, atol=tol, rtol=0)
+
+    def test_jacobian_agrees(self, tol):
+        """Test that qnode.jacobian returns the same result as finite
+        differences on default.qubit. The two-term parameter-shift rule is
+        not exact for the controlled rotations, so it is not used here."""
+        p = np.array([0.43316321, 0.2162158, 0.75110998, 0.94714242, -0.3])
+
+        def circuit(x):
+            qml.RX(x[0], wires=0)
+            qml.RY(x[1], wires=1)
+            qml.Rot(x[2], x[3], x[4], wires=2)
+            qml.CNOT(wires=[0, 1])
+            qml.PhaseShift(x[1], wires=1).inv()
+            qml.CRot(x[4], x[3], x[0], wires=[1, 2])
+            qml.CNOT(wires=[2, 0])
+            return (
+                qml.var(qml.PauliZ(0)),
+                qml.expval(qml.PauliX(1) @ qml.PauliY(2)),
+            )
+
+        dev1 = qml.device("default.qubit.autograd", wires=3)
+        dev2 = qml.device("default.qubit", wires=3)
+
+        circuit1 = QNode(circuit, dev1, diff_method="best")
+        circuit2 = QNode(circuit, dev2, diff_method="finite-diff")
+
+        assert np.allclose(circuit1(p), circuit2(p), atol=tol, rtol=0)
+
+        res = circuit1.jacobian([p])
+        expected = circuit2.jacobian([p], options={"order": 2})
+        assert np.allclose(res, expected, atol=tol, rtol=0)
+
+    def test_jacobian_probs(self, tol):
+        """Test that the Jacobian of marginal probabilities is correct"""
+        x = 0.543
+        y = -0.654
+        dev = qml.device("default.qubit.autograd", wires=3)
+
+        @qnode(dev, interface=None)
+        def circuit(x, y):
+            qml.RX(x, wires=0)
+            qml.RY(y, wires=1)
+            qml.CNOT(wires=[0, 1])
+            return qml.probs(wires=[1])
+
+        res = circuit.jacobian([x, y])
+        expected = np.array(
+            [
+                [-np.sin(x) * np.cos(y) / 2, -np.cos(x) * np.sin(y) / 2],
+                [np.sin(x) * np.cos(y) / 2, np.cos(x) * np.sin(y) / 2],
+            ]
+        )
+        assert np.allclose(res, expected, atol=tol, rtol=0)
+
+    def test_autograd_interface(self, tol):
+        """Test that the device Jacobian is used by the autograd interface"""
+        dev = qml.device("default.qubit.autograd", wires=2)
+
+        @qnode(dev, interface="autograd")
+        def circuit(x):
+            qml.RX(x[0], wires=0)
+            qml.CRY(x[1], wires=[0, 1])
+            return qml.expval(qml.PauliZ(1))
+
+        x = np.array([0.4, -1.2])
+        res = qml.grad(circuit, argnum=0)(x)
+
+        # <Z_1> = 1 - sin^2(x0/2) (1 - cos(x1))
+        expected = [
+            -np.sin(x[0]) / 2 * (1 - np.cos(x[1])),
+            -np.sin(x[0] / 2) ** 2 * np.sin(x[1]),
+        ]
+        assert np.allclose(res, expected, atol=tol, rtol=0)
+
+    def test_state_reset_after_jacobian(self, tol):
+        """Test that the device state is not left traced after computing the Jacobian"""
+        dev = qml.device("default.qubit.autograd", wires=1)
+
+        @qnode(dev, interface=None)
+        def circuit(x):
+            qml.RX(x, wires=0)
+            return qml.expval(qml.PauliZ(0))
+
+        circuit.jacobian([0.2])
+
+        assert isinstance(dev._state, np.ndarray)
+        assert np.allclose(dev._state, [1, 0], atol=tol, rtol=0)
@@ -0,0 +1,164 @@
+# Copyright 2019 Xanadu Quantum Technologies Inc.
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+
+#     http://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+Unit tests for the :mod:`pennylane.plugin.DefaultQubitSparse` device.
+"""
+import pytest
+
+import pennylane as qml
+from pennylane import numpy as np, DeviceError
+
+
+U2 = np.array([[0, 1, 1, 1], [1, 0, 1, -1], [1, -1, 0, 1], [1, 1, -1, 0]]) / np.sqrt(3)
+
+A = np.array([[1.02789352, 1.61296440 - 0.3498192j], [1.61296440 + 0.3498192j, 1.23920938 + 0j]])
+
+A2 = np.kron(A, np.array([[0, 1j], [-1j, 0]]))
+
+
+def queue(num_wires):
+    """Returns an operation queue containing dense, diagonal and permutation operations"""
+    ops = [qml.BasisState(np.array([1, 0, 1, 1]), wires=[0, 1, 2, 3])]
+    ops += [qml.Hadamard(wires=0), qml.RY(0.4, wires=2)]
+    ops += [qml.CRX(0.3 * i, wires=[i, (i + 2) % num_wires]) for i in range(num_wires)]
+    ops += [qml.CNOT(wires=[i, (i + 1) % num_wires]) for i in range(num_wires)]
+    ops += [
+        qml.RZ(0.2, wires=1),
+        qml.CZ(wires=[2, 0]),
+        qml.Toffoli(wires=[0, 3, 1]),
+        qml.CSWAP(wires=[3, 1, 2]),
+        qml.SWAP(wires=[2, 0]),
+        qml.Rot(0.1, 0.2, 0.3, wires=3).inv(),
+        qml.QubitUnitary(U2, wires=[3, 1]),
+    ]
+    return ops
+
+
+class TestAgreesWithDefaultQubit:
+    """Tests that the sparse device gives the same results as default.qubit"""
+
+    @pytest.mark.parametrize(
+        "obs",
+        [
+            qml.expval(qml.PauliX(0) @ qml.PauliY(2)),
+            qml.var(qml.PauliZ(3)),
+            qml.expval(qml.Hermitian(A2, wires=[1, 3])),
+            qml.var(qml.Hermitian(A2, wires=[3, 0])),
+            qml.var(qml.Hadamard(1) @ qml.Hermitian(A, wires=0)),
+            qml.probs(wires=[2, 0]),
+        ],
+    )
+    def test_measurements(self, obs, tol):
+        """Test the expectation values, variances and probabilities"""
+        dev1 = qml.device("default.qubit.sparse", wires=4)
+        dev2 = qml.device("default.qubit", wires=4)
+
+        res = dev1.execute(queue(4), [obs])
+        expected = dev2.execute(queue(4), [obs])
+        assert np.allclose(res, expected, atol=tol, rtol=0)
+
+    def test_state_vector(self, tol):
+        """Test that a state vector of a subset of the wires is prepared"""
+        state = np.array([1, 0, 1j, -1]) / np.sqrt(3)
+        ops = [qml.QubitStateVector(state, wires=[2, 0]), qml.CNOT(wires=[0, 1])]
+        obs = [qml.probs(wires=[0, 1, 2])]
+
+        dev1 = qml.device("default.qubit.sparse", wires=3)
+        dev2 = qml.device("default.qubit", wires=3)
+        assert np.allclose(dev1.execute(ops, obs), dev2.execute(ops, obs), atol=tol, rtol=0)
+
+    @pytest.mark.parametrize(
+        "obs,eigvals",
+        [
+            (qml.PauliX(0) @ qml.Hermitian(A, wires=3), np.kron([-1, 1], np.linalg.eigvalsh(A))),
+            (qml.Hermitian(A2, wires=[2, 1]), np.linalg.eigvalsh(A2)),
+        ],
+    )
+    def test_sample(self, obs, eigvals, tol):
+        """Test that the sample statistics agree with the exact expectation value"""
+        dev = qml.device("default.qubit.sparse", wires=4, shots=20000)
+
+        res = dev.execute(queue(4), [qml.sample(obs)])[0]
+        expected = qml.device("default.qubit", wires=4).execute(queue(4), [qml.expval(obs)])
+
+        assert res.shape == (20000,)
+        assert set(np.round(res, 8)).issubset(set(np.round(eigvals, 8)))
+        assert np.allclose(np.mean(res), expected, atol=0.05, rtol=0)
+
+
+class TestSparsity:
+    """Tests that the cost of the simulation follows the number of nonzero amplitudes"""
+
+    def test_many_wires(self, tol):
+        """Test a circuit of mostly permutations on 60 wires"""
+        n = 60
+        dev = qml.device("default.qubit.sparse", wires=n)
+
+        ops = [qml.BasisState(np.array([1] + [0] * (n - 1)), wires=list(range(n)))]
+        ops += [qml.CNOT(wires=[i, i + 1]) for i in range(n - 1)]
+        ops += [qml.Hadamard(wires=n - 1), qml.Toffoli(wires=[0, n - 1, 5]), qml.SWAP(wires=[1, 30])]
+
+        res = dev.execute(
+            ops,
+            [
+                qml.expval(qml.PauliZ(5)),
+                qml.expval(qml.PauliX(n - 1)),
+                qml.var(qml.PauliZ(30) @ qml.PauliZ(0)),
+                qml.probs(wires=[5, 7]),
+            ],
+        )
+
+        assert len(dev._state) == 2
+        assert np.allclose(res[0], 0, atol=tol, rtol=0)
+        assert np.allclose(res[1], 0, atol=tol, rtol=0)
+        assert np.allclose(res[2], 0, atol=tol, rtol=0)
+        assert np.allclose(res[3], [0, 0.5, 0, 0.5], atol=tol, rtol=0)
+
+    def test_cutoff(self):
+        """Test that amplitudes cancelled by interference are removed"""
+        dev = qml.device("default.qubit.sparse", wires=2)
+        dev.reset()
+        dev.apply("Hadamard", [1], [])
+        assert len(dev._state) == 2
+
+        dev.apply("Hadamard", [1], [])
+        assert list(dev._state) == [0]
+
+
+class TestExceptions:
+    """Tests for the exceptions raised by the sparse device"""
+
+    def test_state_preparation_after_operations(self):
+        """Test that an exception is raised if the state is prepared after other operations"""
+        dev = qml.device("default.qubit.sparse", wires=2)
+        ops = [qml.PauliX(wires=0), qml.BasisState(np.array([1, 1]), wires=[0, 1])]
+
+        with pytest.raises(DeviceError, match="cannot be used after other Operations"):
+            dev.execute(ops, [qml.expval(qml.PauliZ(0))])
+
+    def test_invalid_basis_state(self):
+        """Test that an exception is raised for a basis state not made of 0 and 1"""
+        dev = qml.device("default.qubit.sparse", wires=2)
+
+        with pytest.raises(ValueError, match="must consist of 0 or 1"):
+            dev.execute([qml.BasisState(np.array([2, 0]), wires=[0, 1])], [qml.expval(qml.PauliZ(0))])
+
+    def test_invalid_state_vector(self):
+        """Test that an exception is raised for a state vector that is not normalized"""
+        dev = qml.device("default.qubit.sparse", wires=2)
+
+        with pytest.raises(ValueError, match="does not equal one"):
+            dev.execute(
+                [qml.QubitStateVector(np.array([1, 1]), wires=[0])], [qml.expval(qml.PauliZ(0))]
+            )
@@ -14,8 +14,10 @@
 """
 Unit tests for the :mod:`pennylane` :class:`Device` class.
 """
+from collections import OrderedDict
 
 import pytest
+import numpy as np
 import pennylane as qml
 from pennylane import Device, DeviceError
 from pennylane.qnodes import QuantumFunctionError
@@ -445,6 +447,142 @@ class TestOperations:
             mock_device_with_paulis_and_methods.execute(queue, observables)
 
 
+class TestBatchExecute:
+    """Tests for the batch_execute method"""
+
+    def test_batch_execute_resets_and_executes_each_circuit(self, mock_device_with_paulis_and_methods, monkeypatch):
+        """Tests that the default batch_execute resets the device and
+        executes every circuit in order"""
+        circuits = [
+            ([qml.PauliX(wires=0)], [qml.expval(qml.PauliZ(0))]),
+            ([qml.PauliY(wires=1)], [qml.expval(qml.PauliZ(1))]),
+        ]
+
+        call_history = []
+        with monkeypatch.context() as m:
+            m.setattr(Device, 'reset', lambda self: call_history.append("reset"))
+            m.setattr(Device, 'apply', lambda self, op, wires, params: call_history.append(op))
+            res = mock_device_with_paulis_and_methods.batch_execute(circuits)
+
+        assert call_history == ["reset", "PauliX", "reset", "PauliY"]
+        assert len(res) == 2
+        assert all(np.array_equal(r, [0]) for r in res)
+
+    def test_batch_execute_empty(self, mock_device_with_paulis_and_methods):
+        """Tests that an empty batch returns an empty list of results"""
+        assert mock_device_with_paulis_and_methods.batch_execute([]) == []
+
+
+class TestExecuteGrouped:
+    """Tests for the execute_grouped method"""
+
+    A = np.array([[1, 2j], [-2j, 0]])
+
+    def circuit(self):
+        """Operation queue and observables of a test circuit"""
+        queue = [
+            qml.RX(0.4, wires=0),
+            qml.RY(-0.2, wires=1),
+            qml.CNOT(wires=[0, 1]),
+            qml.Hadamard(wires=2),
+            qml.CRZ(0.3, wires=[2, 1]),
+        ]
+        observables = [
+            qml.expval(qml.PauliX(0) @ qml.PauliZ(1)),
+            qml.expval(qml.PauliY(0)),
+            qml.var(qml.PauliZ(1) @ qml.Hermitian(self.A, wires=2)),
+            qml.expval(qml.PauliX(0)),
+            qml.sample(qml.PauliZ(2)),
+            qml.expval(qml.Hadamard(1) @ qml.Hermitian(self.A, wires=2)),
+        ]
+        return queue, observables
+
+    def test_agrees_with_execute(self, tol):
+        """Tests that executing the groups in rotated circuits gives the same results"""
+        dev = qml.device("default.qubit", wires=3)
+
+        res = dev.execute_grouped(*self.circuit())
+        assert len(res) == 6
+
+        for i, obs in enumerate(self.circuit()[1]):
+            if obs.return_type is qml.operation.Sample:
+                assert res[i].shape == (dev.shots,)
+                continue
+
+            dev.reset()
+            expected = dev.execute(self.circuit()[0], [obs])
+            assert np.allclose(res[i], expected[0], atol=tol, rtol=0)
+
+    def test_one_circuit_per_group(self, monkeypatch):
+        """Tests that a single circuit is executed for each group of qubit-wise commuting
+        observables, and one for the remaining observables"""
+        dev = qml.device("default.qubit", wires=3)
+
+        batches = []
+        batch_execute = dev.batch_execute
+
+        def mock_batch_execute(circuits):
+            batches.append([[ob.name for ob in obs] for _, obs in circuits])
+            return batch_execute(circuits)
+
+        monkeypatch.setattr(dev, "batch_execute", mock_batch_execute)
+        dev.execute_grouped(*self.circuit())
+
+        assert batches == [
+            [
+                [["PauliZ", "PauliZ"], ["PauliZ", "Hermitian"], "PauliZ"],
+                ["PauliZ", ["PauliZ", "Hermitian"]],
+                ["PauliZ"],
+            ]
+        ]
+
+
+class TestCompile:
+    """Tests for the compile and execute_compiled methods"""
+
+    def test_compile_checks_validity(self, mock_device_with_paulis_and_methods):
+        """Tests that compiling a circuit checks that it is supported by the device"""
+        queue = [qml.PauliX(wires=0)]
+        observables = [qml.expval(qml.PauliZ(0))]
+
+        assert mock_device_with_paulis_and_methods.compile(queue, observables) is None
+
+        queue = [qml.Hadamard(wires=0)]
+
+        with pytest.raises(DeviceError, match="Gate Hadamard not supported on device"):
+            mock_device_with_paulis_and_methods.compile(queue, observables)
+
+    def test_execute_compiled_without_plan(self, mock_device_with_paulis_and_methods, monkeypatch):
+        """Tests that circuits are passed to execute if no plan was compiled"""
+        queue = [qml.PauliX(wires=0)]
+        observables = [qml.expval(qml.PauliZ(0))]
+
+        call_history = []
+        with monkeypatch.context() as m:
+            m.setattr(Device, 'execute', lambda self, *args: call_history.append(args))
+            mock_device_with_paulis_and_methods.execute_compiled(None, queue, observables, {})
+
+        assert call_history == [(queue, observables, {})]
+
+    def test_execute_compiled_with_plan(self, mock_device_with_paulis_and_methods, monkeypatch):
+        """Tests that the plan is passed to apply_compiled, and that the
+        validity of the circuit is not checked again"""
+        queue = [qml.PauliX(wires=0)]
+        observables = [qml.expval(qml.PauliZ(0))]
+
+        def mock_check_validity(self, queue, observables):
+            raise AssertionError("validity should not be checked")
+
+        call_history = []
+        with monkeypatch.context() as m:
+            m.setattr(Device, 'check_validity', mock_check_validity)
+            m.setattr(Device, 'apply_compiled', lambda self, plan, queue: call_history.append(plan))
+            res = mock_device_with_paulis_and_methods.execute_compiled("plan", queue, observables)
+
+        assert call_history == ["plan"]
+        assert np.array_equal(res, [0])
+
+
 class TestObservables:
     """Tests the logic related to observables"""
 
@@ -535,6 +673,39 @@ class TestObservables:
             mock_device_with_paulis_and_methods.execute(queue, observables)
 
 
+class TestProbability:
+    """Tests for the probability methods of the device"""
+
+    # pylint: disable=no-self-use, redefined-outer-name
+
+    def test_marginal_probability_from_probability(self, mock_device, monkeypatch):
+        """Tests that by default, the probability array is extracted from the dictionary"""
+        probs = OrderedDict([((0, 0), 0.1), ((0, 1), 0.2), ((1, 0), 0.3), ((1, 1), 0.4)])
+
+        with monkeypatch.context() as m:
+            m.setattr(Device, "probability", lambda self, wires=None: probs)
+            res = mock_device.marginal_probability(wires=[0, 1])
+
+        assert isinstance(res, np.ndarray)
+        assert np.allclose(res, [0.1, 0.2, 0.3, 0.4])
+
+    def test_execute_returns_marginal_probability(self, mock_device, monkeypatch):
+        """Tests that execute returns the probability array for probs observables"""
+        calls = []
+
+        def mock_marginal_probability(self, wires=None):
+            calls.append(wires)
+            return np.array([0.25, 0.75])
+
+        with monkeypatch.context() as m:
+            m.setattr(Device, "observables", ["PauliZ", "Identity"])
+            m.setattr(Device, "marginal_probability", mock_marginal_probability)
+            res = mock_device.execute([qml.RX(0.1, wires=0)], [qml.probs(wires=[1])])
+
+        assert calls == [[1]]
+        assert np.allclose(res, [[0.25, 0.75]])
+
+
 class TestParameters:
     """Test for checking device parameter mappings"""
 
@@ -332,6 +332,9 @@ class TestTensorSample:
             return sample(qml.PauliX(0) @ qml.PauliY(2))
 
         with monkeypatch.context() as m:
+            # draw the eigenvalues of the observable directly, rather than the shared
+            # basis state samples, so that the mock returns their probabilities
+            m.setattr(dev, "pre_measure", lambda: None)
             m.setattr("numpy.random.choice", lambda x, y, p: (x, p))
             s1, p = circuit(theta, phi, varphi)
 
@@ -363,6 +366,9 @@ class TestTensorSample:
             return sample(qml.PauliZ(0) @ qml.Hadamard(1) @ qml.PauliY(2))
 
         with monkeypatch.context() as m:
+            # draw the eigenvalues of the observable directly, rather than the shared
+            # basis state samples, so that the mock returns their probabilities
+            m.setattr(dev, "pre_measure", lambda: None)
             m.setattr("numpy.random.choice", lambda x, y, p: (x, p))
             s1, p = circuit(theta, phi, varphi)
 
@@ -401,6 +407,9 @@ class TestTensorSample:
             return sample(qml.PauliZ(0) @ qml.Hermitian(A, [1, 2]))
 
         with monkeypatch.context() as m:
+            # draw the eigenvalues of the observable directly, rather than the shared
+            # basis state samples, so that the mock returns their probabilities
+            m.setattr(dev, "pre_measure", lambda: None)
             m.setattr("numpy.random.choice", lambda x, y, p: (x, p))
             s1, p = circuit(theta, phi, varphi)
 
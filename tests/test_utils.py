@@ -22,6 +22,7 @@ import numpy as np
 
 import pennylane as qml
 import pennylane.utils as pu
+from pennylane.plugins.default_qubit import spectral_decomposition
 import functools
 import itertools
 
@@ -297,6 +298,221 @@ class TestExpand:
         assert np.allclose(res, expected, atol=tol, rtol=0)
 
 
+class TestCircuitStructure:
+    """Tests for the structure of a circuit"""
+
+    def ops(self, x, state):
+        return [
+            qml.BasisState(np.array(state), wires=[0, 1], do_queue=False),
+            qml.RX(x, wires=0, do_queue=False),
+            qml.CNOT(wires=[0, 1], do_queue=False),
+        ]
+
+    def test_parameters_ignored(self):
+        """Test that circuits only differing in their parameters have the same structure"""
+        obs = [qml.PauliZ(wires=0, do_queue=False) @ qml.PauliX(wires=1, do_queue=False)]
+        obs = [qml.expval(obs[0])]
+        assert pu._circuit_structure(self.ops(0.1, [0, 1]), obs) == pu._circuit_structure(
+            self.ops(0.2, [1, 1]), obs
+        )
+
+    def test_wires(self):
+        """Test that the structure depends on the wires of the operations"""
+        obs = [qml.expval(qml.PauliZ(wires=0, do_queue=False))]
+        ops = self.ops(0.1, [0, 1])
+        ops[2] = qml.CNOT(wires=[1, 0], do_queue=False)
+        assert pu._circuit_structure(self.ops(0.1, [0, 1]), obs) != pu._circuit_structure(
+            ops, obs
+        )
+
+    def test_fixed_params(self):
+        """Test that the parameters of the state preparations and observables are part
+        of the structure if requested"""
+        A = np.diag([1, 2])
+        obs = [qml.expval(qml.Hermitian(A, wires=0, do_queue=False))]
+        obs2 = [qml.expval(qml.Hermitian(2 * A, wires=0, do_queue=False))]
+
+        def structure(x, state, obs):
+            return pu._circuit_structure(self.ops(x, state), obs, fixed_params=True)
+
+        assert structure(0.1, [0, 1], obs) == structure(0.2, [0, 1], obs)
+        assert structure(0.1, [0, 1], obs) != structure(0.1, [1, 1], obs)
+        assert structure(0.1, [0, 1], obs) != structure(0.1, [0, 1], obs2)
+
+
+class TestGroupObservables:
+    """Tests for the partitioning of observables into qubit-wise commuting groups"""
+
+    A = np.array([[1, 2j, 0, 0], [-2j, 0, 0, 1], [0, 0, 3, 0], [0, 1, 0, -1]])
+
+    def test_groups(self):
+        """Test that observables are grouped greedily in the given order"""
+        obs = [
+            qml.PauliX(0) @ qml.PauliZ(1),
+            qml.PauliY(1),
+            qml.PauliZ(1) @ qml.PauliZ(2),
+            qml.PauliY(1) @ qml.Identity(0),
+            qml.Hadamard(3),
+            qml.PauliZ(0),
+        ]
+        assert pu.group_observables(obs) == [[0, 2, 4], [1, 3, 5]]
+
+    def test_identity(self):
+        """Test that the identity commutes qubit-wise with every observable"""
+        obs = [qml.PauliX(0), qml.Identity(0), qml.PauliY(1) @ qml.Identity(0), qml.Identity(1)]
+        assert pu.group_observables(obs) == [[0, 1, 2, 3]]
+
+    def test_hermitian(self):
+        """Test that Hermitian observables are only grouped with identical
+        observables on the wires they share"""
+        obs = [
+            qml.Hermitian(self.A, wires=[0, 1]),
+            qml.Hermitian(self.A, wires=[1, 0]),
+            qml.Hermitian(self.A, wires=[0, 1]) @ qml.PauliX(2),
+            qml.PauliZ(1),
+            qml.Hermitian(2 * self.A, wires=[0, 1]),
+        ]
+        assert pu.group_observables(obs) == [[0, 2], [1], [3], [4]]
+
+    def test_rotations(self, tol):
+        """Test that the measurement rotations diagonalize all observables of a group"""
+        obs = [
+            qml.PauliX(0) @ qml.PauliY(1),
+            qml.PauliY(1) @ qml.Hadamard(2),
+            qml.Hermitian(self.A, wires=[3, 4]) @ qml.PauliZ(5),
+            qml.PauliX(0) @ qml.PauliZ(5),
+        ]
+        rotations = pu.measurement_rotations(obs)
+        assert [r.name for r in rotations] == [
+            "Hadamard",
+            "PauliZ",
+            "S",
+            "Hadamard",
+            "RY",
+            "QubitUnitary",
+        ]
+
+        dev = qml.device("default.qubit", wires=6)
+        U = np.eye(2 ** 6)
+        for r in rotations:
+            U = pu.expand(dev._get_operator_matrix(r.name, r.parameters), r.wires, 6) @ U
+
+        for o in obs:
+            mat = np.eye(1)
+            wires = []
+            for factor in o.obs:
+                mat = np.kron(mat, dev._get_operator_matrix(factor.name, factor.parameters))
+                wires.extend(factor.wires)
+            mat = pu.expand(mat, wires, 6)
+
+            res = U @ mat @ U.conj().T
+            assert np.allclose(res, np.diag(np.diag(res)), atol=tol, rtol=0)
+
+    def test_rotations_not_commuting(self):
+        """Test that an exception is raised if the observables are not qubit-wise commuting"""
+        with pytest.raises(ValueError, match="not qubit-wise commuting"):
+            pu.measurement_rotations([qml.PauliX(0), qml.PauliY(0) @ qml.PauliZ(1)])
+
+    def test_rotations_unknown(self):
+        """Test that an exception is raised if the eigenbasis of an observable is not known"""
+        with pytest.raises(ValueError, match="eigenbasis of NumberOperator is not known"):
+            pu.measurement_rotations([qml.NumberOperator(0)])
+
+
+class TestSpectralCache:
+    """Tests for the cache of eigendecompositions of Hermitian matrices"""
+
+    A = np.array([[1, 2j, 0, 0], [-2j, 0, 0, 1], [0, 0, 3, 0], [0, 1, 0, -1]])
+
+    def test_decomposition(self, tol):
+        """Test that the eigenvalues, eigenvectors and projectors of a matrix are returned"""
+        cache = pu.SpectralCache()
+        entry = cache[self.A]
+
+        w, U = np.linalg.eigh(self.A)
+        assert np.allclose(entry["eigval"], w, atol=tol, rtol=0)
+        assert np.allclose(entry["eigvec"], U, atol=tol, rtol=0)
+
+        res = sum(a * P for a, P in zip(entry["eigval"], entry["projectors"]))
+        assert np.allclose(res, self.A, atol=tol, rtol=0)
+
+    def test_reuse(self):
+        """Test that equal matrices share an entry, and that the projectors are only
+        computed once"""
+        cache = pu.SpectralCache()
+        entry = cache[self.A]
+        projectors = entry["projectors"]
+
+        assert cache[self.A.copy()] is entry
+        assert cache[np.asfortranarray(self.A)] is entry
+        assert cache[self.A]["projectors"] is projectors
+        assert len(cache) == 1
+
+    def test_key(self):
+        """Test that matrices with the same elements but a different shape or
+        data type are stored separately"""
+        cache = pu.SpectralCache()
+        cache[X]
+        cache[X.astype(np.complex128)]
+        cache[np.kron(I, X)]
+        cache[np.kron(X, I)]
+
+        assert len(cache) == 4
+        assert X in cache
+        assert Z not in cache
+
+    def test_lru_eviction(self):
+        """Test that the least recently used entry is discarded once the cache is full"""
+        cache = pu.SpectralCache(maxsize=2)
+        cache[X]
+        cache[Y]
+        cache[X]
+        cache[Z]
+
+        assert len(cache) == 2
+        assert X in cache
+        assert Y not in cache
+        assert Z in cache
+
+        cache.maxsize = 1
+        assert len(cache) == 1
+        assert Z in cache
+
+        cache.clear()
+        assert len(cache) == 0
+
+    def test_invalid_size(self):
+        """Test that an exception is raised if the size of the cache is not positive"""
+        with pytest.raises(ValueError, match="must be at least one"):
+            pu.SpectralCache(maxsize=0)
+
+    def test_concurrent_lookups(self):
+        """Test that concurrent lookups and evictions leave the cache consistent"""
+        from concurrent.futures import ThreadPoolExecutor
+
+        cache = pu.SpectralCache(maxsize=3)
+        matrices = [np.diag([k, -k]) for k in range(1, 9)]
+
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            entries = list(executor.map(lambda A: cache[A], matrices * 50))
+
+        assert len(cache) == 3
+        for A, entry in zip(matrices * 50, entries):
+            assert np.allclose(entry["eigval"], np.sort(np.diag(A)))
+
+    @pytest.mark.usefixtures("tear_down_hermitian")
+    def test_shared(self):
+        """Test that the Hermitian observable and the default.qubit device share the cache"""
+        pu.spectral_cache.clear()
+        qml.Hermitian.eigvals(self.A)
+        entry = pu.spectral_cache[self.A]
+
+        d, P = spectral_decomposition(self.A)
+        assert d is entry["eigval"]
+        assert P is entry["projectors"]
+        assert len(pu.spectral_cache) == 1
+
+
 class TestRecorder:
     """Test the Recorder QNode replacement"""
 